@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Standing-query alerts over newly pulled postings.
+
+Saved searches live in data/saved_searches.json, one entry each:
+
+    {"id": "aigc-infra", "query": "title:(aigc | genai | \\"generative ai\\") title:(infra* | platform)"}
+
+A query is a list of clauses that must all hold. A clause is a word, a
+"quoted phrase" or a (a | b | ...) group of alternatives, optionally
+scoped to title:, company: or location: (otherwise any of the three)
+and negated with a leading -. A trailing * matches word prefixes, so
+infra* meets "Infrastructure". Terms and postings are normalized like
+dedup titles (case, accents, punctuation, "Sr."/"ML" expansions) and
+terms match whole words.
+
+Every term of every query is compiled into one Aho-Corasick automaton
+over words (prefix terms into a prefix table), so a posting's fields are
+scanned once, word by word, however many queries there are. Each query
+is indexed under its rarest clause, and only queries whose anchor term
+turned up are checked clause by clause.
+
+pull_rss.py runs the engine over the postings that are new in each pull
+and appends matches to output/alerts.jsonl. A SQLite log of the (query,
+job) pairs already alerted keeps full pulls and re-runs from repeating
+an alert.
+
+    python scripts/alerts.py output/rss_jobs.csv          # backfill a table against the saved searches
+    python scripts/alerts.py --query 'title:(aigc | genai) title:infra*' output/rss_jobs.csv --dry-run
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import metrics
+from dedup import normalize_title
+from job_store import job_key
+
+QUERIES_PATH = Path("data/saved_searches.json")
+ALERTS_PATH = Path("output/alerts.jsonl")
+FIELDS = ("job_title", "company", "location")
+FIELD_NAMES = {"title": "job_title", "company": "company", "location": "location"}
+ALERT_FIELDS = ("job_title", "company", "location", "original_url", "platform", "post_date")
+
+CLAUSE_RE = re.compile(r'\s*(-?)(?:(title|company|location):)?(\([^()]*\)|"[^"]*"|[^\s()"|]+)')
+
+
+def _term(raw):
+    """(words, prefix) for one search term"""
+    raw = raw.strip().strip('"').strip()
+    prefix = raw.endswith("*")
+    words = tuple(normalize_title(raw.rstrip("*")).split())
+    if not words:
+        raise ValueError(f"empty search term: {raw!r}")
+    if prefix and len(words) > 1:
+        raise ValueError(f"a * prefix only works on a single word: {raw!r}")
+    return words, prefix
+
+
+def parse_query(text):
+    """[(negated, field or None, [(words, prefix), ...]), ...] for a query string"""
+    clauses, pos = [], 0
+    text = text.rstrip()
+    while pos < len(text):
+        m = CLAUSE_RE.match(text, pos)
+        if not m:
+            raise ValueError(f"cannot parse query at {text[pos:]!r}")
+        negated, field, body = m.groups()
+        if body.startswith("("):
+            terms = [_term(alt) for alt in body[1:-1].split("|")]
+        else:
+            terms = [_term(body)]
+        clauses.append((negated == "-", FIELD_NAMES.get(field), terms))
+        pos = m.end()
+    if not any(not negated for negated, _, _ in clauses):
+        raise ValueError(f"query needs at least one clause that is not negated: {text!r}")
+    return clauses
+
+
+def load_queries(path=QUERIES_PATH):
+    """Saved searches as [{"id", "query", "name"?}, ...]"""
+    with open(path, encoding="utf-8") as f:
+        queries = json.load(f)
+    ids = [q["id"] for q in queries]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"duplicate saved search ids in {path}")
+    return queries
+
+
+@lru_cache(maxsize=65536)
+def _tokens(text):
+    return normalize_title(text).split()
+
+
+class AlertEngine:
+    """All saved searches compiled into one word-level Aho-Corasick automaton"""
+
+    def __init__(self, queries):
+        self.queries = list(queries)
+        terms = {}                          # (words, prefix) -> term id
+        self._clauses = []                  # per query: [(fields, negated, term ids)]
+        for spec in self.queries:
+            try:
+                parsed = parse_query(spec["query"])
+            except ValueError as e:
+                raise ValueError(f"saved search {spec['id']}: {e}") from None
+            clauses = []
+            for negated, field, alternatives in parsed:
+                tids = tuple(terms.setdefault(term, len(terms)) for term in alternatives)
+                clauses.append(((field,) if field else FIELDS, negated, tids))
+            self._clauses.append(clauses)
+        self.terms = [" ".join(words) + ("*" if prefix else "") for words, prefix in terms]
+
+        # A query is indexed under one positive clause only, the one whose terms the
+        # fewest queries use; a hit there makes it a candidate and the rest is checked
+        # per candidate. Rare anchors keep the work per posting flat as queries pile up.
+        uses = [0] * len(terms)
+        for clauses in self._clauses:
+            for _, _, tids in clauses:
+                for tid in tids:
+                    uses[tid] += 1
+        self._anchors = {field: {} for field in FIELDS}
+        for q, clauses in enumerate(self._clauses):
+            fields, _, tids = min((c for c in clauses if not c[1]), key=lambda c: sum(uses[t] for t in c[2]))
+            for field in fields:
+                for tid in tids:
+                    self._anchors[field].setdefault(tid, []).append(q)
+
+        self._build([(words, tid) for (words, prefix), tid in terms.items() if not prefix])
+        self._prefixes = {}
+        for (words, prefix), tid in terms.items():
+            if prefix:
+                self._prefixes.setdefault(words[0], []).append(tid)
+        self._prefix_lengths = sorted({len(p) for p in self._prefixes})
+
+    def _build(self, patterns):
+        """Trie of word sequences with failure links; out[state] lists every term ending there"""
+        goto, out = [{}], [[]]
+        for words, tid in patterns:
+            state = 0
+            for word in words:
+                if word not in goto[state]:
+                    goto.append({})
+                    out.append([])
+                    goto[state][word] = len(goto) - 1
+                state = goto[state][word]
+            out[state].append(tid)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in goto[state].items():
+                queue.append(child)
+                f = fail[state]
+                while f and word not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(word, 0) if goto[f].get(word) != child else 0
+                out[child] = out[child] + out[fail[child]]
+        self._goto, self._fail, self._out = goto, fail, [tuple(o) for o in out]
+
+    def scan(self, text):
+        """Ids of the terms found in one field value"""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = set()
+        state = 0
+        for token in _tokens(text):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if out[state]:
+                hits.update(out[state])
+            for n in self._prefix_lengths:
+                if len(token) < n:
+                    break
+                found = self._prefixes.get(token[:n])
+                if found:
+                    hits.update(found)
+        return hits
+
+    def match(self, job):
+        """[(query index, [matched terms]), ...] for the saved searches a posting satisfies"""
+        hits, candidates = {}, set()
+        for field in FIELDS:
+            text = job.get(field)
+            found = self.scan(text) if text else set()
+            hits[field] = found
+            anchors = self._anchors[field]
+            for tid in found:
+                candidates.update(anchors.get(tid, ()))
+        matches = []
+        for q in candidates:
+            matched = []
+            for fields, negated, tids in self._clauses[q]:
+                hit = next((tid for tid in tids for field in fields if tid in hits[field]), None)
+                if (hit is not None) == negated:
+                    break
+                if hit is not None:
+                    matched.append(self.terms[hit])
+            else:
+                matches.append((q, matched))
+        return matches
+
+
+class AlertStream:
+    """Appends alerts to a JSONL file, once per (saved search, job)"""
+
+    def __init__(self, engine, path=ALERTS_PATH, log_path=None, dry_run=False):
+        self.engine = engine
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.dry_run = dry_run
+        self.conn = sqlite3.connect(log_path or self.path.with_suffix(".sqlite"))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS alerted ("
+            " query_id TEXT NOT NULL, job TEXT NOT NULL, alerted_at TEXT NOT NULL,"
+            " PRIMARY KEY (query_id, job)) WITHOUT ROWID"
+        )
+        self.file = None if dry_run else open(self.path, "a", encoding="utf-8")
+        self.checked = 0
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.dry_run:
+            self.conn.rollback()
+        else:
+            self.conn.commit()
+            self.file.close()
+        self.conn.close()
+
+    def check(self, job):
+        """Alert on the saved searches one posting matches; returns the alerts written"""
+        self.checked += 1
+        matches = self.engine.match(job)
+        if not matches:
+            return []
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        key = job_key(job)
+        alerts = []
+        for q, terms in matches:
+            spec = self.engine.queries[q]
+            cursor = self.conn.execute("INSERT OR IGNORE INTO alerted VALUES (?, ?, ?)", (spec["id"], key, now))
+            if not cursor.rowcount:
+                continue
+            alert = {"alerted_at": now, "query": spec["id"], "name": spec.get("name", spec["id"]), "matched": terms}
+            alert.update((field, job.get(field) or "") for field in ALERT_FIELDS)
+            alerts.append(alert)
+            if self.file is not None:
+                self.file.write(json.dumps(alert, ensure_ascii=False) + "\n")
+            metrics.inc("alerts_total", query=spec["id"])
+        self.count += len(alerts)
+        return alerts
+
+    def tee(self, jobs):
+        """Pass jobs through unchanged, alerting on each as it goes by"""
+        for job in jobs:
+            self.check(job)
+            yield job
+
+
+def open_alerts(queries_path=QUERIES_PATH, alerts_path=ALERTS_PATH):
+    """An AlertStream over the saved searches, or None when there are none"""
+    if not Path(queries_path).exists():
+        return None
+    queries = load_queries(queries_path)
+    if not queries:
+        return None
+    return AlertStream(AlertEngine(queries), alerts_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run saved searches over a job table and append alerts")
+    parser.add_argument("input", help="jobs table (CSV, Parquet, Arrow) with job_title, company, location")
+    parser.add_argument("--queries", default=QUERIES_PATH, help="saved searches JSON")
+    parser.add_argument("--query", action="append", help="ad-hoc query instead of the saved searches")
+    parser.add_argument("-o", "--output", default=ALERTS_PATH, help="alert stream (JSONL)")
+    parser.add_argument("--dry-run", action="store_true", help="print matches without writing or logging them")
+    args = parser.parse_args()
+
+    from storage import iter_table_chunks
+
+    if args.query:
+        queries = [{"id": f"adhoc-{i}", "query": q} for i, q in enumerate(args.query, 1)]
+    else:
+        queries = load_queries(args.queries)
+    with AlertStream(AlertEngine(queries), args.output, dry_run=args.dry_run) as stream:
+        for chunk in iter_table_chunks(args.input):
+            chunk = chunk.astype(object).where(chunk.notna(), "")
+            for row in chunk.to_dict("records"):
+                for alert in stream.check(row):
+                    if args.dry_run:
+                        print(f"🔔 {alert['query']}: {alert['job_title']} at {alert['company']}"
+                              f" ({', '.join(alert['matched'])})")
+        target = "(dry run)" if args.dry_run else f"to {stream.path}"
+        print(f"🔔 {stream.count} new alerts from {stream.checked} postings and {len(queries)} saved searches {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Airtable sync benchmark against the in-process FakeAirtable.
+
+Syncs a synthetic scaffold into an empty fake base, re-syncs it
+unchanged, edits 1% of the rows and adds 0.5% new ones, syncs again,
+then does a full re-send (every record patched, as the old
+create_records-everything flow would) for comparison. Each run reports
+API calls per method, records sent, 429s and wall time. Afterwards the
+fake base is checked against the scaffold: one job record per job, the
+edited values present and every contact's linked_jobs pointing at
+existing job records. Exits 1 if the check fails.
+
+    python scripts/benchmarks/bench_airtable_sync.py --rows 2000 --rate 50
+"""
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "teal-integration"))
+from airtable_sync import (  # noqa: E402
+    CONTACTS_TABLE, JOBS_TABLE, AirtableClient, AirtableSync, FakeAirtable, Snapshot, build_records,
+)
+from synthetic import scaffold_csv  # noqa: E402
+
+
+def edit(path, changed, added):
+    """Change `changed` rows in place and append `added` copies under new URLs; returns the rows"""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        fields, rows = reader.fieldnames, list(reader)
+    step = max(1, len(rows) // changed) if changed else 0
+    for row in rows[::step][:changed] if step else []:
+        row["job_title"] += " (Remote)"
+        row["confidence"] = "95"
+    for i in range(added):
+        row = dict(rows[i * 7 % len(rows)])
+        row["original_url"] = f"https://aijobs.net/job/new-{i}/"
+        rows.append(row)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+
+def run(label, fake, client, snapshot, rows, full=False):
+    before = dict(fake.requests)
+    started = time.perf_counter()
+    stats = AirtableSync(client, snapshot, full=full).sync(rows)
+    seconds = time.perf_counter() - started
+    calls = {method: fake.requests[method] - before[method] for method in before}
+    sent = sum(s["created"] + s["updated"] for s in stats.values())
+    failed = sum(s["failed"] for s in stats.values())
+    print(f"{label:<14} {calls['POST']:>6} {calls['PATCH']:>6} {sent:>8} {calls['429']:>5} {failed:>7} {seconds:>8.2f}")
+    return failed
+
+
+def check(fake, rows):
+    """Problems found comparing the fake base with the scaffold rows"""
+    jobs, contacts = build_records(rows)
+    problems = []
+    remote_jobs = {fields.get("original_url"): fields for fields in fake.tables[JOBS_TABLE].values()}
+    if len(fake.tables[JOBS_TABLE]) != len(jobs):
+        problems.append(f"{len(fake.tables[JOBS_TABLE])} job records for {len(jobs)} jobs")
+    if len(fake.tables[CONTACTS_TABLE]) != len(contacts):
+        problems.append(f"{len(fake.tables[CONTACTS_TABLE])} contact records for {len(contacts)} contacts")
+    for fields in jobs.values():
+        remote = remote_jobs.get(fields["original_url"], {})
+        if any(remote.get(k) != v for k, v in fields.items() if v is not None):
+            problems.append(f"job {fields['original_url']} differs from the scaffold")
+    linked = sum(len(fields.get("linked_jobs", [])) for fields in fake.tables[CONTACTS_TABLE].values())
+    expected = sum(len(keys) for _, keys in contacts.values())
+    if linked != expected:
+        problems.append(f"{linked} contact-job links, expected {expected}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the diff-based Airtable sync")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=50.0,
+                        help="requests/s allowed by the fake and used by the client (Airtable: 5)")
+    parser.add_argument("--changed", type=float, default=0.01, help="share of rows edited before the third sync")
+    parser.add_argument("--added", type=float, default=0.005, help="share of rows added before the third sync")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, FakeAirtable(rate=args.rate, token="bench") as fake:
+        path = Path(tmp) / "scaffold.csv"
+        scaffold_csv(path, args.rows)
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        client = AirtableClient("appBENCH", "bench", fake.url, rate=args.rate, rate_limit_wait=1.0)
+        with Snapshot(Path(tmp) / "snapshot.sqlite", "appBENCH") as snapshot:
+            jobs, contacts = build_records(rows)
+            print(f"{len(jobs)} jobs, {len(contacts)} contacts, {args.rate:.0f} requests/s")
+            print(f"{'sync':<14} {'POST':>6} {'PATCH':>6} {'records':>8} {'429s':>5} {'failed':>7} {'seconds':>8}")
+            failed = run("initial", fake, client, snapshot, rows)
+            failed += run("unchanged", fake, client, snapshot, rows)
+            rows = edit(path, int(args.rows * args.changed), int(args.rows * args.added))
+            failed += run("1% changed", fake, client, snapshot, rows)
+            problems = check(fake, rows)
+            failed += run("full re-send", fake, client, snapshot, rows, full=True)
+        client.close()
+
+    for problem in problems[:10]:
+        print(f"⚠️  {problem}")
+    if problems or failed:
+        raise SystemExit(1)
+    print("✅ fake base matches the scaffold")
+
+
+if __name__ == "__main__":
+    main()
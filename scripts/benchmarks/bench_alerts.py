@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Saved-search alert benchmark: matching cost against the number of queries.
+
+Generates synthetic postings and 10 to 10,000 saved searches built from
+the same vocabulary: ten broad role searches (title words, phrases and
+prefixes) and, beyond those, searches for roles at named companies, some
+limited to locations or excluding words. AlertEngine.match is timed over
+the postings for each query count. For the smaller counts a naive
+matcher that checks every query against every posting is timed too, and
+the run exits 1 if the two disagree on any match.
+
+    python scripts/benchmarks/bench_alerts.py --postings 20000 --queries 10 100 1000 10000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from alerts import FIELDS, AlertEngine, _tokens, parse_query  # noqa: E402
+from synthetic import COMPANY_WORDS, LOCATIONS, ROLES, TEAMS, Generator  # noqa: E402
+
+TITLE_TERMS = sorted({w for text in ROLES + TEAMS for w in _tokens(text)} | {"aigc", "genai", "llm", "inference"})
+PREFIXES = ["infra*", "eng*", "develop*", "platform*", "monet*", "scien*", "manag*"]
+PHRASES = ['"machine learning"', '"site reliability"', '"data platform"', '"search ranking"', '"genai platform"']
+
+
+def _company(i):
+    """The i-th synthetic company name, as Generator.company spells it (without suffix)"""
+    return f"{COMPANY_WORDS[i % 20]}{COMPANY_WORDS[(i // 20) % 20]}{i // 400 or ''}".lower()
+
+
+def synthetic_queries(count, companies=1000, seed=7):
+    """Ten broad role searches, the rest tracking roles at a named company"""
+    rng = random.Random(seed)
+    queries = []
+    for i in range(count):
+        clauses = []
+        alternatives = rng.sample(TITLE_TERMS, rng.randint(1, 3)) + rng.sample(PHRASES + PREFIXES, rng.randint(0, 1))
+        clauses.append(f"title:({' | '.join(alternatives)})")
+        if i < 10:
+            clauses.append(f"title:{rng.choice(TITLE_TERMS + PREFIXES)}")
+        else:
+            clauses.append(f"company:({' | '.join(_company(rng.randrange(companies)) for _ in range(rng.randint(1, 2)))})")
+        if rng.random() < 0.4:
+            clauses.append(f"location:({' | '.join(rng.sample(LOCATIONS, 2)).lower()})")
+        if rng.random() < 0.3:
+            clauses.append(f"-title:{rng.choice(['junior', 'intern', 'manager', 'lead'])}")
+        queries.append({"id": f"q{i}", "query": " ".join(clauses)})
+    return queries
+
+
+def synthetic_postings(count):
+    return [
+        {"job_title": title, "company": company, "location": location, "original_url": f"https://jobs.test/{pid}"}
+        for pid, title, company, location, _ in Generator(3).postings(count)
+    ]
+
+
+class NaiveMatcher:
+    """Checks every clause of every query against every posting"""
+
+    def __init__(self, queries):
+        self.queries = [parse_query(q["query"]) for q in queries]
+
+    @staticmethod
+    def _hit(term, padded):
+        words, prefix = term
+        needle = " " + " ".join(words) + ("" if prefix else " ")
+        return needle in padded
+
+    def match(self, job):
+        padded = {field: f" {' '.join(_tokens(job.get(field) or ''))} " for field in FIELDS}
+        matched = []
+        for q, clauses in enumerate(self.queries):
+            ok = True
+            for negated, field, terms in clauses:
+                fields = (field,) if field else FIELDS
+                hit = any(self._hit(term, padded[f]) for term in terms for f in fields)
+                if hit == negated:
+                    ok = False
+                    break
+            if ok:
+                matched.append(q)
+        return matched
+
+
+def time_matches(matcher, postings, engine=True):
+    started = time.perf_counter()
+    if engine:
+        matches = [sorted(q for q, _ in matcher.match(job)) for job in postings]
+    else:
+        matches = [matcher.match(job) for job in postings]
+    return time.perf_counter() - started, matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark saved-search matching against the number of queries")
+    parser.add_argument("--postings", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, nargs="+", default=[10, 100, 1000, 10_000])
+    parser.add_argument("--naive-max", type=int, default=1000, help="largest query count to run the naive matcher on")
+    args = parser.parse_args()
+
+    postings = synthetic_postings(args.postings)
+    print(f"{args.postings} postings")
+    print(f"{'queries':>8} {'compile s':>10} {'postings/s':>11} {'us/posting':>11} {'alerts':>8}"
+          f" {'naive us/posting':>17}")
+    mismatches = 0
+    for count in args.queries:
+        queries = synthetic_queries(count)
+        started = time.perf_counter()
+        engine = AlertEngine(queries)
+        compile_seconds = time.perf_counter() - started
+        _tokens.cache_clear()
+        seconds, matches = time_matches(engine, postings)
+        alerts = sum(map(len, matches))
+        naive = ""
+        if count <= args.naive_max:
+            naive_seconds, expected = time_matches(NaiveMatcher(queries), postings, engine=False)
+            naive = f"{naive_seconds / len(postings) * 1e6:.1f}"
+            mismatches += sum(a != b for a, b in zip(matches, expected))
+        print(f"{count:>8} {compile_seconds:>10.3f} {len(postings) / seconds:>11.0f}"
+              f" {seconds / len(postings) * 1e6:>11.1f} {alerts:>8} {naive:>17}")
+    if mismatches:
+        print(f"⚠️  {mismatches} postings matched differently from the naive matcher")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Enrichment runner benchmark against the offline fake provider.
+
+Loads synthetic jobs into a throwaway store, then enriches them with one
+worker (the old "for each job" loop) and with a worker pool. With enough
+workers, throughput should approach the provider's rate limit instead of
+1 / latency. Each run is repeated with the org-search cache, which
+should cut provider calls to about one per company and team.
+
+    python scripts/benchmarks/bench_enrich.py --jobs 300 --companies 15 --rate 100 --workers 1 8 32
+"""
+
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from enrichment import EnrichmentRunner, FakeProvider  # noqa: E402
+from job_store import JobStore  # noqa: E402
+from org_cache import OrgSearchCache  # noqa: E402
+
+
+def synthetic_jobs(count, companies):
+    return [
+        {
+            "job_title": f"Engineer {i}",
+            "company": f"Company {i % companies}",
+            "original_url": f"https://jobs.example.com/postings/{i}",
+            "platform": "bench",
+        }
+        for i in range(count)
+    ]
+
+
+def run(jobs, workers, latency, rate, cached):
+    with tempfile.TemporaryDirectory() as tmp, JobStore(Path(tmp) / "bench.db") as store:
+        store.upsert_rows(jobs)
+        provider = FakeProvider(rate=rate, burst=rate / 10, latency=latency)
+        if cached:
+            provider.cache = OrgSearchCache(Path(tmp) / "org_cache.sqlite")
+        runner = EnrichmentRunner(store, provider, workers=workers, checkpoint_dir=tmp)
+        stats = runner.run()
+        hit_rate = provider.cache.hit_rate if cached else 0.0
+        if cached:
+            provider.cache.close()
+        return stats["done"], stats["elapsed"], provider.calls, hit_rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serial vs pooled enrichment")
+    parser.add_argument("--jobs", type=int, default=300)
+    parser.add_argument("--companies", type=int, default=15)
+    parser.add_argument("--latency", type=float, default=0.05, help="fake provider latency per call (s)")
+    parser.add_argument("--rate", type=float, default=100, help="fake provider rate limit (req/s)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    jobs = synthetic_jobs(args.jobs, args.companies)
+    print(
+        f"{args.jobs} jobs from {args.companies} companies, {args.latency * 1000:.0f} ms latency,"
+        f" {args.rate:.0f} req/s limit"
+    )
+    print(f"{'workers':>8} {'cache':>6} {'seconds':>9} {'jobs/s':>9} {'calls':>7} {'hit rate':>9}")
+    for workers in args.workers:
+        for cached in (False, True):
+            done, elapsed, calls, hit_rate = run(jobs, workers, args.latency, args.rate, cached)
+            print(
+                f"{workers:>8} {'on' if cached else 'off':>6} {elapsed:>9.2f} {done / elapsed:>9.1f}"
+                f" {calls:>7} {hit_rate:>9.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
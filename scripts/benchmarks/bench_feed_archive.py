@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Feed archive benchmark: a simulated pull history, then replay.
+
+Every pull of each source (Remotive and RemoteOK shaped postings) sees a
+window of the most recent postings. Each day brings new postings, and a
+share of the window is edited between pulls. Every posting of every pull
+goes through FeedArchive.add, as in pull_rss.py, with the pull's time as
+fetch time.
+
+Reported: archive write rate, bytes on disk against the raw JSON the
+pulls returned, the time to open the index and select a month, a
+source and a single posting, and replay throughput through the adapters.
+The replay of the latest versions is checked against normalizing each
+posting's last raw version directly, and the run exits 1 on any
+difference.
+
+    python scripts/benchmarks/bench_feed_archive.py --days 90 --pulls-per-day 4 --window 2000 --new-per-day 500
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from feed_archive import FeedArchive, default_codec  # noqa: E402
+from sources import ADAPTERS  # noqa: E402
+from synthetic import Generator, remoteok_item, remotive_item  # noqa: E402
+
+START = 1_735_689_600        # 2025-01-01T00:00:00Z
+ITEMS = {"remotive": remotive_item, "remoteok": remoteok_item}
+
+
+def simulate(archive, days, pulls_per_day, window, new_per_day, edit_rate, seed=1):
+    """Feed every pull through the archive; returns (postings seen, seconds in add, raw bytes, last versions)"""
+    seen, seconds, raw_bytes, latest = 0, 0.0, 0, {}
+    for s, (source, item) in enumerate(ITEMS.items()):
+        gen = Generator(seed + s, duplicate_rate=0)
+        postings = gen.postings(days * new_per_day + window)
+        feed = [item(gen, next(postings)) for _ in range(window)]
+        for pull in range(days * pulls_per_day):
+            if pull % pulls_per_day == 0 and pull:
+                feed = feed[new_per_day:] + [item(gen, next(postings)) for _ in range(new_per_day)]
+            for raw in gen.rng.sample(feed, int(len(feed) * edit_rate)):
+                raw["description"] = f"{raw['description'][:500]} Updated {pull}."
+            fetched_at = START + pull * 86_400 // pulls_per_day
+            started = time.perf_counter()
+            for raw in feed:
+                archive.add(source, raw["id"], raw, fetched_at=fetched_at)
+            seconds += time.perf_counter() - started
+            for raw in feed:
+                latest[(source, str(raw["id"]))] = json.loads(json.dumps(raw))
+            seen += len(feed)
+            raw_bytes += sum(len(json.dumps(raw)) for raw in feed)
+    started = time.perf_counter()
+    archive.commit()
+    return seen, seconds + time.perf_counter() - started, raw_bytes, latest
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the raw feed archive: archive a pull history, replay it")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--pulls-per-day", type=int, default=4)
+    parser.add_argument("--window", type=int, default=2000, help="postings in each feed response")
+    parser.add_argument("--new-per-day", type=int, default=500)
+    parser.add_argument("--edit-rate", type=float, default=0.01, help="share of the feed edited before each pull")
+    parser.add_argument("--codec", choices=["gzip", "zstd"], default=default_codec())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with FeedArchive(Path(tmp) / "archive", codec=args.codec) as archive:
+            seen, seconds, raw_bytes, latest = simulate(
+                archive, args.days, args.pulls_per_day, args.window, args.new_per_day, args.edit_rate)
+            stats = archive.stats
+            print(f"{args.days} days x {args.pulls_per_day} pulls x {len(ITEMS)} sources, {args.window} postings"
+                  f" per feed, codec {args.codec}")
+            print(f"archive: {seen} postings in {seconds:.1f}s ({seen / seconds:.0f}/s),"
+                  f" {stats['added']} records written, {stats['unchanged']} unchanged skipped")
+            disk = archive.disk_bytes()
+            print(f"disk:    {disk / 1024 / 1024:.1f} MB for {raw_bytes / 1024 / 1024:.0f} MB of pulled JSON"
+                  f" ({raw_bytes / disk:.0f}x); records {stats['raw_bytes'] / stats['stored_bytes']:.1f}x compressed")
+
+        with FeedArchive(Path(tmp) / "archive", codec=args.codec) as archive:
+            index, open_seconds = timed(archive.index)
+            month_start = START + 30 * 86_400
+            month, month_seconds = timed(lambda: archive.select(month_start, month_start + 30 * 86_400))
+            source, source_seconds = timed(lambda: archive.select(sources=["remoteok"], latest=True))
+            one_id = next(iter(latest))[1]
+            posting, posting_seconds = timed(lambda: archive.select(sources=["remotive"], posting_ids=[one_id]))
+            print(f"index:   {len(index)} entries, open {open_seconds * 1000:.1f} ms; select month"
+                  f" {month_seconds * 1000:.1f} ms ({len(month)}), source latest {source_seconds * 1000:.1f} ms"
+                  f" ({len(source)}), posting {posting_seconds * 1000:.1f} ms ({len(posting)} versions)")
+
+            records, latest_seconds = timed(lambda: [tuple(r.values()) for r in archive.replay()])
+            rows, all_seconds = timed(lambda: sum(1 for _ in archive.replay(latest=False)))
+            print(f"replay:  latest {len(records)} postings in {latest_seconds:.2f}s"
+                  f" ({len(records) / latest_seconds:.0f}/s); all {rows} versions in {all_seconds:.2f}s"
+                  f" ({rows / all_seconds:.0f}/s)")
+
+    expected = Counter(tuple(ADAPTERS[source].normalize(raw).values()) for (source, _), raw in latest.items())
+    if Counter(records) != expected:
+        print(f"⚠️  replay differs from the last pulled versions ({len(records)} rows, {len(expected)} expected)")
+        raise SystemExit(1)
+    print("✅ replay matches the last pulled version of every posting")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Fetch engine benchmark against local stub feeds.
+
+Starts one stub HTTP server per source (each on its own port, so each
+counts as a separate host) that answers after a fixed delay, then times
+a sequential pull against FetchEngine.fetch_all as the source count grows.
+
+    python scripts/benchmarks/bench_fetch.py --delay 0.2 --sources 1 2 4 8 16
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from fetch_engine import FetchEngine, FetchRequest  # noqa: E402
+
+
+def make_handler(delay, payload):
+    class StubFeedHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return StubFeedHandler
+
+
+def start_stub_servers(count, delay, payload):
+    servers = []
+    for _ in range(count):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(delay, payload))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+def stub_requests(servers):
+    return [
+        FetchRequest(name=f"stub{i}", url=f"http://127.0.0.1:{s.server_address[1]}/api", timeout=10)
+        for i, s in enumerate(servers)
+    ]
+
+
+def time_sequential(reqs):
+    started = time.perf_counter()
+    for req in reqs:
+        requests.get(req.url, timeout=req.timeout).json()
+    return time.perf_counter() - started
+
+
+def time_concurrent(reqs):
+    with FetchEngine(max_workers=len(reqs)) as engine:
+        started = time.perf_counter()
+        results = engine.fetch_all(reqs)
+        elapsed = time.perf_counter() - started
+    assert all(r.ok for r in results)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--delay", type=float, default=0.2, help="stub response delay in seconds")
+    parser.add_argument("--sources", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    payload = json.dumps({"jobs": [{"id": i, "title": f"Job {i}"} for i in range(200)]}).encode()
+
+    print(f"{'sources':>8} {'sequential_s':>13} {'concurrent_s':>13} {'speedup':>8}")
+    for count in args.sources:
+        servers = start_stub_servers(count, args.delay, payload)
+        try:
+            reqs = stub_requests(servers)
+            seq = time_sequential(reqs)
+            conc = time_concurrent(reqs)
+        finally:
+            for server in servers:
+                server.shutdown()
+        print(f"{count:>8} {seq:>13.3f} {conc:>13.3f} {seq / conc:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
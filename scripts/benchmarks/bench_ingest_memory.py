@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Peak-RSS benchmark for RSS ingestion.
+
+Serves a synthetic RemoteOK payload from a local stub server and runs
+each ingestion path in a fresh subprocess, reporting peak RSS:
+
+- legacy: res.json() -> list of dicts -> DataFrame -> to_csv (the
+  original pull_remoteok/save_csv path)
+- streaming: adapter records streamed from a spooled body into the
+  incremental CSV writer
+
+    python scripts/benchmarks/bench_ingest_memory.py --postings 50000
+"""
+
+import argparse
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+def write_remoteok_payload(path, postings, description_size=2000):
+    """Write a synthetic RemoteOK payload item by item and return its size"""
+    # The parent must stay small: Linux carries ru_maxrss across exec,
+    # so children would otherwise inherit the payload-sized peak.
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps([{"legal": "API terms of service"}])[:-1])
+        for i in range(postings):
+            f.write(", " + json.dumps({
+                "id": str(1000000 + i),
+                "position": f"Senior Engineer {i}",
+                "company": f"Company {i % 5000}",
+                "url": f"/remote-jobs/remote-senior-engineer-{i}",
+                "location": "Worldwide",
+                "date": "2025-06-23T16:01:46+00:00",
+                "tags": ["python", "infra", "genai"],
+                "description": "x" * description_size,
+            }))
+        f.write("]")
+    return Path(path).stat().st_size
+
+
+def serve(payload_path):
+    size = Path(payload_path).stat().st_size
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            with open(payload_path, "rb") as f:
+                shutil.copyfileobj(f, self.wfile)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_legacy(url, out_path):
+    import pandas as pd
+    import requests
+
+    res = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+    data = res.json()[1:]
+    jobs = []
+    for job in data:
+        jobs.append({
+            "job_title": job.get("position") or job.get("title"),
+            "company": job.get("company"),
+            "original_url": "https://remoteok.com" + job.get("url", ""),
+            "platform": "remoteok",
+            "location": job.get("location", ""),
+            "post_date": job.get("date", ""),
+        })
+    df = pd.DataFrame(jobs)
+    df.to_csv(out_path, index=False)
+    return len(df)
+
+
+def run_streaming(url, out_path):
+    import pull_rss
+    from sources import ADAPTERS
+
+    ADAPTERS["remoteok"].url = url
+    return pull_rss.save_csv(pull_rss.stream_jobs(["remoteok"]), out_path)
+
+
+def child(mode, url, out_path):
+    baseline = peak_rss_mb()
+    rows = {"legacy": run_legacy, "streaming": run_streaming}[mode](url, out_path)
+    print(json.dumps({"mode": mode, "rows": rows, "start_mb": baseline, "peak_mb": peak_rss_mb()}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--postings", type=int, default=50000)
+    parser.add_argument("--child", nargs=3, metavar=("MODE", "URL", "OUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        payload_path = Path(tmp) / "remoteok.json"
+        size = write_remoteok_payload(payload_path, args.postings)
+        server = serve(payload_path)
+        url = f"http://127.0.0.1:{server.server_address[1]}/api"
+        print(f"Payload: {args.postings} postings, {size / 1e6:.1f} MB")
+        print(f"{'mode':>10} {'rows':>8} {'start_rss_mb':>13} {'peak_rss_mb':>12}")
+        try:
+            for mode in ("legacy", "streaming"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, url, str(Path(tmp) / f"{mode}.csv")],
+                    capture_output=True, text=True, check=True,
+                ).stdout.strip().splitlines()[-1]
+                stats = json.loads(out)
+                print(f"{mode:>10} {stats['rows']:>8} {stats['start_mb']:>13.1f} {stats['peak_mb']:>12.1f}")
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
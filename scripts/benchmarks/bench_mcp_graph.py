@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+MCP graph export benchmark: payload size and peak traced memory.
+
+Compares the old one-shot export (a company entity per job, one
+indented json.dump) with MCPGraphBuilder, then re-exports after adding
+a few new jobs to show the manifest-based incremental diff.
+
+    python scripts/benchmarks/bench_mcp_graph.py --jobs 50000 --companies 2000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "teal-integration"))
+from mcp_graph import MCPGraphBuilder  # noqa: E402
+
+
+def synthetic_jobs(count, companies, start=0):
+    for i in range(start, start + count):
+        yield {
+            "index": i,
+            "title": f"Software Engineer {i % 50}",
+            "company": f"Company {i % companies}",
+            "url": f"https://linkedin.com/jobs/view/{1000000 + i}",
+            "extractedAt": "2025-06-25T12:00:00",
+        }
+
+
+def legacy_export(jobs, path):
+    """The previous process_with_memory_mcp: everything in memory, one indented dump"""
+    entities, relations = [], []
+    for job in jobs:
+        entities.append({
+            "name": f"Job_{job.get('index', 'unknown')}",
+            "entityType": "job_posting",
+            "observations": [
+                f"Title: {job.get('title', '')}",
+                f"Company: {job.get('company', '')}",
+                f"URL: {job.get('url', '')}",
+                "Source: Teal HQ",
+                f"Extracted: {job.get('extractedAt', '')}",
+            ],
+        })
+        if job.get("company"):
+            entities.append({
+                "name": job.get("company", ""),
+                "entityType": "company",
+                "observations": [f"Has job posting: {job.get('title', '')}", "Source: Teal HQ extraction"],
+            })
+            relations.append({"from": job["company"], "to": f"Job_{job.get('index')}", "relationType": "has_job_posting"})
+    with open(path, "w") as f:
+        json.dump({"entities": entities, "relations": relations}, f, indent=2)
+
+
+def measure(label, fn, path):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = Path(path).stat().st_size
+    print(f"{label:<22} {size / 1024 / 1024:>9.2f} MB {peak / 1024 / 1024:>9.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MCP graph export")
+    parser.add_argument("--jobs", type=int, default=50_000)
+    parser.add_argument("--companies", type=int, default=2_000)
+    parser.add_argument("--new", type=int, default=500, help="jobs added before the incremental re-export")
+    args = parser.parse_args()
+
+    print(f"{args.jobs} jobs from {args.companies} companies")
+    print(f"{'export':<22} {'payload':>12} {'peak mem':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        measure("legacy json.dump", lambda: legacy_export(synthetic_jobs(args.jobs, args.companies),
+                                                          tmp / "legacy.json"), tmp / "legacy.json")
+
+        def export(jobs):
+            with MCPGraphBuilder(tmp / "manifest.sqlite") as graph:
+                graph.export(jobs, tmp / "graph.ndjson")
+
+        measure("graph (first export)", lambda: export(synthetic_jobs(args.jobs, args.companies)),
+                tmp / "graph.ndjson")
+        measure(f"graph (+{args.new} jobs)", lambda: export(synthetic_jobs(args.jobs + args.new, args.companies)),
+                tmp / "graph.ndjson")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Metadata scraper benchmark against local fixture job boards.
+
+A child process serves synthetic job pages from several fixture hosts
+(one port each, so per-host limits apply per host), with a fixed
+response latency. Each page is one of a set of kinds: JobPosting JSON-LD
+with a hiring manager, an @graph with a "hiring team" LinkedIn card,
+OpenGraph only, malformed JSON-LD, bare HTML, 404, JSON, a path
+robots.txt disallows and a redirect. Every tenth posting is mirrored on
+a second host with an identical body.
+
+The jobs are loaded into a temporary job store and scraped cold, then
+again with their statuses reset (every page must come from the cache).
+Each written-back meta_scrape_status is checked against the kind served
+for that URL, and the run exits 1 on any mismatch. Parse-only
+throughput is measured on the same bodies.
+
+    python scripts/benchmarks/bench_meta_scrape.py --pages 2000 --hosts 8 --latency-ms 20
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from synthetic import Generator  # noqa: E402
+
+ROBOTS = b"User-agent: *\nDisallow: /private/\n"
+KINDS = ("jsonld", "graph", "contact", "og", "bad_jsonld", "bare", "missing", "json", "private", "redirect")
+EXPECTED = {
+    "jsonld": "success", "graph": "success", "contact": "success", "og": "partial", "bad_jsonld": "partial",
+    "bare": "fail:no_metadata", "missing": "fail:http_404", "json": "fail:not_html", "private": "fail:robots",
+    "redirect": "success",
+}
+
+
+def job_path(n):
+    return f"/private/job/{n}" if KINDS[n % len(KINDS)] == "private" else f"/job/{n}"
+
+
+def _html(head, body, padding):
+    filler = "<p>We are hiring. " + "Build things with a kind, remote-first team. " * 8 + "</p>\n"
+    return (f"<!DOCTYPE html><html><head><meta charset=\"utf-8\">{head}</head><body>{body}"
+            f"{filler * max(1, padding * 1024 // len(filler))}</body></html>").encode("utf-8")
+
+
+def fixture_page(n, padding=40):
+    """(HTTP status, content type, body, extra headers) served for posting n"""
+    gen = Generator(n)
+    pid, title, company, location, date = next(gen.postings(1))
+    kind = KINDS[n % len(KINDS)]
+    person = f"{gen.rng.choice(['Alex', 'Sam', 'Jordan', 'Riley'])} {gen.rng.choice(['Chen', 'Patel', 'Kim'])}"
+    profile = f"https://www.linkedin.com/in/{gen.slug(person)}-{n}"
+    posting = {
+        "@context": "https://schema.org", "@type": "JobPosting", "title": title, "datePosted": date,
+        "hiringOrganization": {"@type": "Organization", "name": company, "sameAs": f"https://{gen.slug(company)}.com"},
+        "jobLocation": {"@type": "Place", "address": {"addressLocality": location, "addressCountry": "US"}},
+        "jobLocationType": "TELECOMMUTE", "employmentType": ["FULL_TIME"],
+        "baseSalary": {"currency": "USD", "value": {"minValue": 120000, "maxValue": 160000, "unitText": "YEAR"}},
+        "description": "<p>Join us &amp; build things.</p>",
+    }
+    og = (f'<meta property="og:title" content="{title} at {company}"><meta property="og:site_name" content="Fixture">'
+          f'<link rel="canonical" href="https://fixture.test/job/{n}">')
+    script = '<script type="application/ld+json">{}</script>'
+    if kind == "jsonld":
+        posting["hiringManager"] = {"@type": "Person", "name": person, "jobTitle": "Engineering Manager",
+                                    "sameAs": [profile]}
+        return 200, "text/html; charset=utf-8", _html(og + script.format(json.dumps(posting)), "", padding), {}
+    if kind == "graph":
+        graph = {"@context": "https://schema.org", "@graph": [{"@type": "Organization", "name": company}, posting]}
+        card = f'<section><h2>Meet the hiring team</h2><a href="{profile}?trk=x"><span>{person}</span></a></section>'
+        return 200, "text/html", _html(script.format(json.dumps(graph)), card, padding), {}
+    if kind == "contact":
+        posting["applicationContact"] = {"@type": "ContactPoint", "name": person, "email": f"jobs{n}@example.com"}
+        return 200, "text/html", _html(script.format(json.dumps([posting])), "", padding), {}
+    if kind == "og":
+        return 200, "text/html", _html(og, "", padding), {}
+    if kind == "bad_jsonld":
+        return 200, "text/html", _html(og + script.format('{"@type": "JobPosting", "title": '), "", padding), {}
+    if kind == "bare":
+        return 200, "text/html", _html(f"<title>{title}</title>", "", padding), {}
+    if kind == "missing":
+        return 404, "text/html", _html("<title>Not found</title>", "", 1), {}
+    if kind == "json":
+        return 200, "application/json", json.dumps(posting).encode("utf-8"), {}
+    if kind == "private":
+        return 200, "text/html", _html(og, "", padding), {}
+    return 301, "text/html", b"", {"Location": f"/job/{n - 9}"}
+
+
+def make_handler(latency, padding):
+    class FixtureBoardHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # One write per response, or keep-alive connections stall on delayed ACKs
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(latency)
+            if self.path == "/robots.txt":
+                status, content_type, body, headers = 200, "text/plain", ROBOTS, {}
+            else:
+                n = int(self.path.rstrip("/").rsplit("/", 1)[-1])
+                status, content_type, body, headers = fixture_page(n, padding)
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return FixtureBoardHandler
+
+
+def serve(hosts, latency, padding):
+    """Child process: start the fixture hosts, print their ports, serve until stdin closes"""
+    servers = [ThreadingHTTPServer(("127.0.0.1", 0), make_handler(latency, padding)) for _ in range(hosts)]
+    for server in servers:
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(json.dumps([s.server_address[1] for s in servers]), flush=True)
+    sys.stdin.read()
+
+
+def fixture_jobs(pages, ports):
+    """Scaffold rows pointing at the fixture hosts, with the status each one should end up with"""
+    rows, expected = [], {}
+    for n in range(pages):
+        kind = KINDS[n % len(KINDS)]
+        hosts = [ports[n % len(ports)]] + ([ports[(n + 1) % len(ports)]] if n % 10 == 0 and len(ports) > 1 else [])
+        for port in hosts:
+            url = f"http://127.0.0.1:{port}{job_path(n)}"
+            # Graph pages start without a title, so the write-back has to fill it
+            rows.append({"job_title": "" if kind == "graph" else f"Posting {n}", "company": f"Company {n}",
+                         "original_url": url})
+            expected[url] = EXPECTED[kind]
+    return rows, expected
+
+
+def check(store, expected):
+    from urls import canonical_url
+
+    expected = {canonical_url(url): status for url, status in expected.items()}
+    mismatches = []
+    for key, status in store.conn.execute("SELECT canonical_url, meta_scrape_status FROM jobs"):
+        if expected.get(key) != status:
+            mismatches.append((key, expected.get(key), status))
+    return mismatches
+
+
+def time_parse(pages, padding, repeat=3):
+    from meta_scrape import decode, parse_page
+
+    bodies = [fixture_page(n, padding)[2] for n in range(min(pages, 500))]
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            parse_page(decode(body))
+        best = min(best, time.perf_counter() - started)
+    return len(bodies) / best, sum(map(len, bodies)) / len(bodies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the job page metadata scraper against fixture hosts")
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--hosts", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="fixture response delay")
+    parser.add_argument("--page-kb", type=int, default=40, help="filler per page")
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.hosts, args.latency_ms / 1000, args.page_kb)
+        return
+
+    from job_store import JobStore
+    from meta_scrape import MetaScraper, PageCache, scrape_store
+
+    child = subprocess.Popen(
+        [sys.executable, __file__, "--serve", "--hosts", str(args.hosts), "--latency-ms", str(args.latency_ms),
+         "--page-kb", str(args.page_kb)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        ports = json.loads(child.stdout.readline())
+        rows, expected = fixture_jobs(args.pages, ports)
+        with tempfile.TemporaryDirectory() as tmp, JobStore(Path(tmp) / "pipeline.db") as store, \
+                PageCache(Path(tmp) / "meta_pages.sqlite") as cache:
+            store.upsert_rows(rows)
+            print(f"{len(rows)} jobs on {len(ports)} fixture hosts, {args.latency_ms:.0f} ms latency,"
+                  f" {args.workers} workers, {args.per_host} per host")
+            print(f"{'run':<6} {'seconds':>8} {'jobs/s':>8} {'fetched':>8} {'cached':>7} {'parsed':>7} {'reused':>7}")
+            for run in ("cold", "warm"):
+                if run == "warm":
+                    with store.conn:
+                        store.conn.execute("UPDATE jobs SET meta_scrape_status = NULL")
+                    cache.stats.update(parsed=0, reused=0)
+                with MetaScraper(cache, workers=args.workers, per_host=args.per_host) as scraper:
+                    stats = scrape_store(store, scraper)
+                print(f"{run:<6} {stats['elapsed']:>8.2f} {stats['done'] / stats['elapsed']:>8.0f}"
+                      f" {stats['fetched']:>8} {stats['cached']:>7} {cache.stats['parsed']:>7}"
+                      f" {cache.stats['reused']:>7}")
+            mismatches = check(store, expected)
+            (posters,) = store.conn.execute("SELECT COUNT(*) FROM jobs WHERE primary_contact_id IS NOT NULL").fetchone()
+            (titled,) = store.conn.execute("SELECT COUNT(*) FROM jobs WHERE job_title IS NOT NULL").fetchone()
+            print(f"statuses: {json.dumps(stats['statuses'], sort_keys=True)}")
+            print(f"posters from page hints: {posters}, jobs with a title: {titled}/{len(rows)}")
+    finally:
+        child.stdin.close()
+        child.wait(timeout=10)
+
+    rate, size = time_parse(args.pages, args.page_kb)
+    print(f"parse only: {rate:.0f} pages/s ({size / 1024:.0f} KB pages)")
+    if mismatches:
+        for key, want, got in mismatches[:10]:
+            print(f"⚠️  {key}: expected {want}, got {got}")
+        print(f"⚠️  {len(mismatches)} jobs ended with the wrong meta_scrape_status")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Memory footprint of holding postings in memory.
+
+Normalizes N synthetic RemoteOK postings and keeps all of them, once per
+representation, each in a fresh subprocess:
+
+- dicts:   one dict per posting (the previous adapter output)
+- records: records.JobRecord (slots, interned company/platform/location)
+- columns: records.JobColumns (Arrow string columns, dictionary-encoded)
+
+Held memory is Python heap (tracemalloc) plus the Arrow memory pool,
+measured after a gc once everything is built, so transient parsing
+garbage is not counted. For columns it also checks that to_pandas()
+adds no copy of the text.
+
+    python scripts/benchmarks/bench_records.py --rows 1000000
+"""
+
+import argparse
+import gc
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+MODES = ("dicts", "records", "columns")
+
+
+def raw_postings(rows):
+    """RemoteOK-shaped raw postings, created one at a time like a JSON parser would"""
+    from synthetic import Generator
+
+    gen = Generator(42)
+    for pid, title, company, location, date in gen.postings(rows):
+        yield {
+            "id": str(pid), "position": title, "company": company, "location": location, "date": date,
+            "url": gen.tracked(f"/remote-jobs/remote-{gen.slug(title)}-{gen.slug(company)}-{pid}"),
+        }
+
+
+def legacy_normalize(raw):
+    """The dict-per-row adapter output this module replaced"""
+    from urls import clean_url
+
+    return {
+        "job_title": raw.get("position") or raw.get("title"),
+        "company": raw.get("company"),
+        "original_url": clean_url(raw.get("url", ""), "https://remoteok.com"),
+        "platform": "remoteok",
+        "location": raw.get("location", ""),
+        "post_date": raw.get("date", ""),
+    }
+
+
+def held_bytes():
+    import pyarrow as pa
+
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] + pa.total_allocated_bytes()
+
+
+def child(mode, rows):
+    from records import JobColumns
+    from sources import ADAPTERS
+
+    # Load every module the representations use (pandas, pyarrow) before measuring
+    JobColumns.from_records(ADAPTERS["remoteok"].normalize(raw) for raw in raw_postings(10)).to_pandas()
+    legacy_normalize(next(raw_postings(1)))
+    normalize = ADAPTERS["remoteok"].normalize if mode != "dicts" else legacy_normalize
+    tracemalloc.start()
+    before = held_bytes()
+    started = time.perf_counter()
+    postings = (normalize(raw) for raw in raw_postings(rows))
+    if mode == "columns":
+        held = JobColumns.from_records(postings)
+        held.flush()
+    else:
+        held = list(postings)
+    elapsed = time.perf_counter() - started
+    result = {"mode": mode, "rows": len(held), "bytes": held_bytes() - before, "seconds": elapsed}
+    if mode == "columns":
+        started = time.perf_counter()
+        before_pandas = held_bytes()
+        df = held.to_pandas()
+        result["to_pandas_seconds"] = time.perf_counter() - started
+        result["to_pandas_bytes"] = held_bytes() - before_pandas
+        del df
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure in-memory size of job postings per representation")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], int(args.child[1]))
+        return
+
+    results = []
+    for mode in args.modes:
+        out = subprocess.run([sys.executable, __file__, "--child", mode, str(args.rows)],
+                             capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    baseline = next((r["bytes"] for r in results if r["mode"] == "dicts"), None)
+    print(f"{args.rows:,} postings held in memory")
+    print(f"{'mode':<10} {'MB':>9} {'bytes/row':>10} {'vs dicts':>9} {'build s':>8}")
+    for r in results:
+        ratio = f"{r['bytes'] / baseline:.2f}" if baseline else "-"
+        print(f"{r['mode']:<10} {r['bytes'] / 2**20:>9.1f} {r['bytes'] / max(r['rows'], 1):>10.0f}"
+              f" {ratio:>9} {r['seconds']:>8.2f}")
+        if "to_pandas_bytes" in r:
+            print(f"{'':<10} to_pandas: {r['to_pandas_bytes'] / 2**20:+.1f} MB in {r['to_pandas_seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Sharded execution benchmark.
+
+Runs a CPU-bound stage (score or validate) over a synthetic scaffold
+table in-process, then through ShardedRunner with increasing worker
+counts, and prints the speedup. On a machine with N idle cores the
+sharded time should approach the in-process time / N plus the cost of
+partitioning and the shared-memory round trip.
+
+    python scripts/benchmarks/bench_sharding.py --rows 1000000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from sharding import OPERATIONS, ShardedRunner  # noqa: E402
+from storage import read_table  # noqa: E402
+from synthetic import scaffold_csv  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sharded scoring/validation against one process")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--op", choices=["score", "validate"], default="score")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "scaffold.csv"
+        scaffold_csv(path, args.rows)
+        df = read_table(path)
+
+    fn, _ = OPERATIONS[args.op]
+    started = time.perf_counter()
+    fn(df)
+    baseline = time.perf_counter() - started
+    print(f"{args.op} {args.rows} rows on {os.cpu_count()} cores")
+    print(f"  in-process        {baseline:6.2f}s")
+    for workers in sorted(set(args.workers)):
+        started = time.perf_counter()
+        ShardedRunner(workers=workers).run(args.op, df)
+        elapsed = time.perf_counter() - started
+        print(f"  {workers:>2} workers        {elapsed:6.2f}s  ×{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark.
+
+Times fresh `python scripts/pipeline.py ...` processes, the way cron or an
+agent calls them, and lists which heavy dependencies each command ended
+up importing (from `python -X importtime`). Quick commands should stay
+within --budget-ms and never load pandas, numpy or requests.
+
+    python scripts/benchmarks/bench_startup.py --repeat 10
+    python scripts/benchmarks/bench_startup.py --budget-ms 100   # exits 1 if a quick command is slower
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from synthetic import scaffold_csv  # noqa: E402
+
+PIPELINE = str(Path(__file__).resolve().parent.parent / "pipeline.py")
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "requests", "bs4", "yaml")
+QUICK_COMMANDS = ("--help", "status", "validate-header")
+
+
+def cases(workdir):
+    scaffold = Path(workdir) / "scaffold.csv"
+    scaffold_csv(scaffold, 10)
+    return {
+        "python -c pass": ["-c", "pass"],
+        "--help": [PIPELINE, "--help"],
+        "status": [PIPELINE, "status", "--output-dir", str(workdir)],
+        "validate-header": [PIPELINE, "validate-header", str(scaffold)],
+        "run --list": [PIPELINE, "run", "--list"],
+        "validate (10 rows)": [PIPELINE, "validate", str(scaffold)],
+    }
+
+
+def wall_times(args, repeat):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def heavy_imports(args):
+    """Heavy top-level packages a command imported, with their cumulative import time in ms"""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+    loaded = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name in HEAVY_MODULES and cumulative.strip().isdigit():
+            loaded[name] = int(cumulative) / 1000
+    return loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline CLI startup time")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, help="fail if a quick command's median exceeds this")
+    args = parser.parse_args()
+
+    over_budget = []
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'command':<22} {'median ms':>10} {'min ms':>8}  heavy imports")
+        for name, command in cases(tmp).items():
+            times = wall_times(command, args.repeat)
+            median = statistics.median(times) * 1000
+            heavy = heavy_imports(command)
+            loaded = ", ".join(f"{mod} ({ms:.0f} ms)" for mod, ms in heavy.items()) or "-"
+            print(f"{name:<22} {median:>10.1f} {min(times) * 1000:>8.1f}  {loaded}")
+            if name in QUICK_COMMANDS and args.budget_ms and (median > args.budget_ms or heavy):
+                over_budget.append(name)
+    if over_budget:
+        print(f"⚠️  Over the {args.budget_ms:.0f} ms budget or loading heavy modules: {', '.join(over_budget)}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+CSV vs Parquet vs Arrow IPC benchmark for scaffold tables.
+
+Writes a synthetic scaffold table in each format, then loads and
+validates it in a fresh subprocess per format, reporting wall time,
+peak RSS and file size. "csv-legacy" is the original pd.read_csv path
+with no explicit dtypes.
+
+    python scripts/benchmarks/bench_storage.py --rows 1000000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+FILES = {"csv-legacy": "scaffold.csv", "csv": "scaffold.csv", "parquet": "scaffold.parquet", "arrow": "scaffold.arrow"}
+
+
+def synthetic_scaffold(rows):
+    import numpy as np
+    import pandas as pd
+
+    from scaffold_format import REQUIRED_COLUMNS
+
+    rng = np.random.default_rng(0)
+    idx = np.arange(rows)
+    companies = np.array([f"Company {i}" for i in range(5000)])
+    df = pd.DataFrame({col: "" for col in REQUIRED_COLUMNS}, index=idx)
+    df["job_title"] = "Software Engineer " + pd.Series(idx % 997).astype(str)
+    df["company"] = companies[rng.integers(0, len(companies), rows)]
+    df["original_url"] = "https://remoteok.com/remote-jobs/" + pd.Series(idx).astype(str)
+    df["poster_type"] = np.array(["", "team_lead", "recruiter", "hiring_manager"])[idx % 4]
+    df["confidence"] = rng.integers(0, 101, rows)
+    df["meta_scrape_status"] = np.array(["", "success", "fail"])[idx % 3]
+    df["org_search_status"] = np.array(["", "success", "fail"])[(idx // 3) % 3]
+    return df
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(mode, path):
+    import pandas as pd
+
+    from scaffold_format import REQUIRED_COLUMNS
+    from storage import read_table
+
+    started = time.perf_counter()
+    if mode == "csv-legacy":
+        df = pd.read_csv(path)
+    else:
+        df = read_table(path)
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    assert not missing
+    elapsed = time.perf_counter() - started
+    print(json.dumps({"rows": len(df), "seconds": elapsed, "peak_mb": peak_rss_mb()}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Write from a child so the parent's RSS does not leak into measurements
+        subprocess.run([sys.executable, "-c", (
+            "import sys; sys.path[:0] = [%r, %r]\n"
+            "from bench_storage import synthetic_scaffold\n"
+            "from storage import write_table\n"
+            "df = synthetic_scaffold(%d)\n"
+            "for name in ('scaffold.csv', 'scaffold.parquet', 'scaffold.arrow'):\n"
+            "    write_table(df, %r + '/' + name)\n"
+        ) % (str(Path(__file__).parent), str(Path(__file__).parent.parent), args.rows, tmp)], check=True)
+
+        print(f"{'format':>11} {'rows':>9} {'load+validate_s':>16} {'peak_rss_mb':>12} {'file_mb':>8}")
+        for mode, name in FILES.items():
+            path = Path(tmp) / name
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, str(path)],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            stats = json.loads(out)
+            print(f"{mode:>11} {stats['rows']:>9} {stats['seconds']:>16.2f} {stats['peak_mb']:>12.1f}"
+                  f" {path.stat().st_size / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
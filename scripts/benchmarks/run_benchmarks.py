@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the pipeline stages.
+
+Generates synthetic inputs (see synthetic.py) at each requested size and
+times each stage in a fresh subprocess, recording wall time, throughput
+and peak RSS:
+
+- ingest:           RemoteOK payload -> adapter records -> pull_rss.save_csv
+- convert:          job table -> rss_to_scaffold.convert_file (convert_to_scaffold per chunk)
+- validate:         scaffold CSV -> scaffold_format.validate_scaffold
+- score:            scaffold CSV -> scoring.score_file
+- save_to_scaffold: Teal export -> TealJobScraper.import_exports/save_to_scaffold
+- mcp_export:       job table -> MCPGraphBuilder.export
+
+Results go to a JSON file (output/benchmarks/<time>_<commit>.json by
+default) that --compare can diff against an earlier run.
+
+    python scripts/benchmarks/run_benchmarks.py --rows 1000 100000
+    python scripts/benchmarks/run_benchmarks.py --rows 100000 --compare output/benchmarks/<earlier>.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+sys.path.insert(0, str(SCRIPTS_DIR / "teal-integration"))
+
+RESULTS_DIR = Path("output/benchmarks")
+DATA_DIR = Path("output/synthetic")
+REGRESSION_THRESHOLD = 0.2
+
+# case -> synthetic input kind
+CASES = {
+    "ingest": "remoteok",
+    "convert": "jobs",
+    "validate": "scaffold",
+    "score": "scaffold",
+    "save_to_scaffold": "teal",
+    "mcp_export": "jobs",
+}
+
+
+def _rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# Each case imports what it needs and returns the callable to time, so
+# import cost stays out of the measurement.
+
+def run_ingest(input_path, workdir):
+    from pull_rss import save_csv
+    from sources import ADAPTERS
+
+    def run():
+        with open(input_path, "rb") as fp:
+            return save_csv(ADAPTERS["remoteok"].records(fp), Path(workdir) / "jobs.csv")
+    return run
+
+
+def run_convert(input_path, workdir):
+    from rss_to_scaffold import convert_file
+
+    def run():
+        _, rows_out, _ = convert_file(input_path, Path(workdir) / "scaffold.csv", dedup=False, store_path=None)
+        return rows_out
+    return run
+
+
+def run_validate(input_path, workdir):
+    from scaffold_format import validate_scaffold
+
+    def run():
+        validate_scaffold(input_path)
+        return sum(1 for _ in open(input_path, encoding="utf-8")) - 1
+    return run
+
+
+def run_score(input_path, workdir):
+    from scoring import score_file
+
+    def run():
+        rows, _ = score_file(input_path, Path(workdir) / "scored.csv", rescore_manual=True)
+        return rows
+    return run
+
+
+def run_save_to_scaffold(input_path, workdir):
+    from teal_job_scraper import TealJobScraper
+
+    def run():
+        scraper = TealJobScraper(Path(workdir) / "teal_jobs_scaffold.csv", dedup=False)
+        return scraper.import_exports([input_path], append=False, preview_lines=0)
+    return run
+
+
+def run_mcp_export(input_path, workdir):
+    import csv
+
+    from mcp_graph import MCPGraphBuilder
+
+    def run():
+        with open(input_path, newline="", encoding="utf-8") as f, \
+                MCPGraphBuilder(Path(workdir) / "manifest.sqlite") as graph:
+            return graph.export(csv.DictReader(f), Path(workdir) / "graph.ndjson")["jobs"]
+    return run
+
+
+RUNNERS = {
+    "ingest": run_ingest,
+    "convert": run_convert,
+    "validate": run_validate,
+    "score": run_score,
+    "save_to_scaffold": run_save_to_scaffold,
+    "mcp_export": run_mcp_export,
+}
+
+
+def child(case, input_path, workdir, profile_path=None):
+    """Run one case in this (fresh) process and print its measurements as JSON"""
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    with contextlib.redirect_stdout(io.StringIO()):
+        run = RUNNERS[case](input_path, workdir)
+    baseline = _rss_mb()
+    profiler = None
+    if profile_path:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = run()
+    elapsed = time.perf_counter() - started
+    result = {"seconds": round(elapsed, 4), "rows": rows, "peak_rss_mb": round(_rss_mb(), 1),
+              "baseline_rss_mb": round(baseline, 1)}
+    if profiler is not None:
+        import pstats
+
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+        stats = pstats.Stats(profiler)
+        top = sorted(stats.stats.items(), key=lambda item: -item[1][2])[:10]
+        result["top_functions"] = [f"{Path(fn[0]).name}:{fn[1]}({fn[2]}) {stat[2]:.3f}s" for fn, stat in top]
+    print(json.dumps(result))
+
+
+def run_case(case, input_path, rows, profile_dir=None):
+    with tempfile.TemporaryDirectory() as workdir:
+        cmd = [sys.executable, __file__, "--child", case, str(input_path), workdir]
+        if profile_dir:
+            cmd.append(str(Path(profile_dir) / f"{case}_{rows}.prof"))
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(proc.stderr)
+        raise RuntimeError(f"Benchmark {case} ({rows} rows) failed")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result.update(case=case, size=rows)
+    result["rows_per_s"] = round(result["rows"] / result["seconds"]) if result["seconds"] else None
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=SCRIPTS_DIR, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def input_for(kind, rows, data_dir):
+    from synthetic import GENERATORS, generate
+
+    path = Path(data_dir) / f"{kind}_{rows}{GENERATORS[kind][1]}"
+    if not path.exists():
+        generate(kind, path, rows)
+    return path
+
+
+def compare(results, baseline_path, threshold=REGRESSION_THRESHOLD):
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    before = {(r["case"], r["size"]): r for r in baseline["results"]}
+    print(f"\nCompared with {baseline_path} ({baseline['meta']['commit']}):")
+    regressions = 0
+    for r in results:
+        old = before.get((r["case"], r["size"]))
+        if old is None:
+            continue
+        time_ratio = r["seconds"] / old["seconds"] if old["seconds"] else 1.0
+        mem_ratio = r["peak_rss_mb"] / old["peak_rss_mb"] if old["peak_rss_mb"] else 1.0
+        flag = ""
+        if time_ratio > 1 + threshold or mem_ratio > 1 + threshold:
+            flag = "  ⚠️ regression"
+            regressions += 1
+        print(f"  {r['case']:<17} {r['size']:>9}  time ×{time_ratio:.2f}  memory ×{mem_ratio:.2f}{flag}")
+    return regressions
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        child(*sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(description="Benchmark pipeline stages on synthetic data")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100_000])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--data-dir", default=DATA_DIR, help="where generated inputs are kept and reused")
+    parser.add_argument("-o", "--output", help="results JSON (default: output/benchmarks/<time>_<commit>.json)")
+    parser.add_argument("--profile", action="store_true", help="also write cProfile stats per case (slows the timed run)")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    commit = git_commit()
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    output = Path(args.output or RESULTS_DIR / f"{stamp}_{commit}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    profile_dir = output.with_suffix("") if args.profile else None
+    if profile_dir:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    print(f"{'case':<17} {'rows':>9} {'seconds':>9} {'rows/s':>11} {'peak MB':>9}")
+    for rows in args.rows:
+        for case in args.cases:
+            input_path = input_for(CASES[case], rows, args.data_dir)
+            result = run_case(case, input_path, rows, profile_dir)
+            results.append(result)
+            print(f"{case:<17} {rows:>9} {result['seconds']:>9.2f} {result['rows_per_s'] or 0:>11,} "
+                  f"{result['peak_rss_mb']:>9.1f}")
+
+    meta = {
+        "commit": commit,
+        "timestamp": stamp,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+    output.write_text(json.dumps({"meta": meta, "results": results}, indent=1), encoding="utf-8")
+    print(f"💾 Results written to {output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator for benchmarks.
+
+Writes Remotive and RemoteOK API payloads, job tables in the
+output/rss_jobs.csv layout, Teal export CSVs, scaffold CSVs and contact
+lists of any size. Rows are generated and written one at a time, so 10M-row files
+need no more memory than 1k-row ones. Companies follow a skewed
+distribution and a share of postings repeat with tracking parameters,
+so dedup, caching and grouping have realistic work to do.
+
+    python scripts/benchmarks/synthetic.py scaffold --rows 1000000 -o /tmp/scaffold_1m.csv
+    python scripts/benchmarks/synthetic.py remoteok --rows 50000 -o /tmp/remoteok.json
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+from itertools import chain
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from scaffold_schema import POSTER_TYPES, SCAFFOLD_COLUMNS  # noqa: E402
+from sources import JOB_FIELDS  # noqa: E402
+
+SENIORITY = ["", "Senior ", "Sr. ", "Staff ", "Principal ", "Lead ", "Junior "]
+ROLES = [
+    "Software Engineer", "Backend Engineer", "Frontend Developer", "Data Scientist", "ML Engineer",
+    "Machine Learning Engineer", "DevOps Engineer", "Product Manager", "Product Designer",
+    "Customer Support Manager", "Account Executive", "Data Analyst", "Site Reliability Engineer",
+    "Engineering Manager", "Research Scientist", "Marketing Manager", "Technical Writer",
+]
+TEAMS = [
+    "", ", AIGC Infrastructure", " – GenAI Platform", ", Monetization", " (Payments)", ", Growth",
+    " – Search Ranking", ", Trust & Safety", " - Developer Experience", ", Data Platform",
+]
+LOCATIONS = ["Worldwide", "USA", "United States", "Europe", "UK", "Canada", "LATAM", "APAC", "Germany", "Remote"]
+COMPANY_WORDS = ["Acme", "Nova", "Blue", "Quantum", "Pixel", "Cloud", "Data", "Bright", "Open", "Hyper",
+                 "Flow", "Stack", "Vector", "Signal", "Orbit", "Lumen", "Atlas", "Nimbus", "Forge", "Delta"]
+COMPANY_SUFFIXES = ["", " Inc", " Inc.", " LLC", " Labs", " AI", " Technologies", " GmbH"]
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn"]
+LAST_NAMES = ["Shi", "Chen", "Patel", "Garcia", "Kim", "Nguyen", "Smith", "Müller", "Rossi", "Silva"]
+STATUSES = ["success", "partial", "fail", "fail:http_404", "pending", ""]
+
+TEAL_HEADER = ["Job Title", "Company", "URL", "Notes", "Status", "Date Saved"]
+
+
+class Generator:
+    def __init__(self, seed=42, companies=None, duplicate_rate=0.05):
+        self.rng = random.Random(seed)
+        self.companies = companies
+        self.duplicate_rate = duplicate_rate
+        self._recent = []
+
+    def company(self, n):
+        count = self.companies or max(10, n // 20)
+        # Skewed: a few companies post a lot, most post a little
+        i = int(count * self.rng.random() ** 3)
+        words = COMPANY_WORDS[i % len(COMPANY_WORDS)] + COMPANY_WORDS[(i // len(COMPANY_WORDS)) % len(COMPANY_WORDS)]
+        return f"{words}{i // 400 or ''}{COMPANY_SUFFIXES[i % len(COMPANY_SUFFIXES)]}"
+
+    def title(self):
+        rng = self.rng
+        return rng.choice(SENIORITY) + rng.choice(ROLES) + rng.choice(TEAMS)
+
+    def slug(self, text):
+        return "-".join("".join(c if c.isalnum() else " " for c in text.lower()).split())
+
+    def postings(self, n):
+        """Yield n raw postings: (id, title, company, location, date)"""
+        for i in range(n):
+            if self._recent and self.rng.random() < self.duplicate_rate:
+                yield self.rng.choice(self._recent)
+                continue
+            posting = (
+                1_000_000 + i,
+                self.title(),
+                self.company(n),
+                self.rng.choice(LOCATIONS),
+                f"2025-{self.rng.randint(1, 12):02d}-{self.rng.randint(1, 28):02d}T{self.rng.randint(0, 23):02d}:00:00",
+            )
+            if len(self._recent) < 1000:
+                self._recent.append(posting)
+            elif self.rng.random() < 0.01:
+                self._recent[self.rng.randrange(1000)] = posting
+            yield posting
+
+    def tracked(self, url):
+        if self.rng.random() < 0.3:
+            return url + f"?utm_source=feed&utm_campaign={self.rng.randrange(100)}"
+        return url
+
+
+def _write_json_array(path, items, prefix="[", suffix="]"):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(prefix)
+        for i, item in enumerate(items):
+            f.write(("," if i else "") + json.dumps(item))
+        f.write(suffix)
+
+
+def remotive_item(gen, posting):
+    pid, title, company, location, date = posting
+    return {
+        "id": pid, "url": f"https://remotive.com/remote-jobs/software-dev/{gen.slug(title)}-{pid}",
+        "title": title, "company_name": company, "category": "Software Development",
+        "candidate_required_location": location, "publication_date": date,
+        "job_type": "full_time", "description": "<p>" + "Build things. " * 40 + "</p>",
+    }
+
+
+def remoteok_item(gen, posting):
+    pid, title, company, location, date = posting
+    return {
+        "id": str(pid), "position": title, "company": company, "location": location, "date": date,
+        "url": f"/remote-jobs/remote-{gen.slug(title)}-{gen.slug(company)}-{pid}",
+        "tags": ["python", "infra"], "description": "Build things. " * 40,
+    }
+
+
+def remotive_payload(path, rows, seed=42):
+    gen = Generator(seed)
+    items = (remotive_item(gen, posting) for posting in gen.postings(rows))
+    _write_json_array(path, items, prefix='{"job-count": %d, "jobs": [' % rows, suffix="]}")
+
+
+def remoteok_payload(path, rows, seed=42):
+    gen = Generator(seed)
+    items = (remoteok_item(gen, posting) for posting in gen.postings(rows))
+    # The first item of a RemoteOK payload is its legal notice
+    _write_json_array(path, chain([{"legal": "API terms of service"}], items))
+
+
+def jobs_csv(path, rows, seed=42):
+    gen = Generator(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(JOB_FIELDS)
+        for pid, title, company, location, date in gen.postings(rows):
+            platform = "remotive" if pid % 2 else "remoteok"
+            url = gen.tracked(f"https://{platform}.com/remote-jobs/{gen.slug(title)}-{pid}")
+            writer.writerow([title, company, url, platform, location, date])
+
+
+def teal_export(path, rows, seed=42):
+    gen = Generator(seed)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(TEAL_HEADER)
+        for pid, title, company, location, date in gen.postings(rows):
+            url = f"https://www.linkedin.com/jobs/view/{pid}/?trackingId={gen.rng.randrange(10**6)}&refId=abc"
+            writer.writerow([title, company, url, "", gen.rng.choice(["Bookmarked", "Applying", "Applied"]), date[:10]])
+
+
+def contacts_csv(path, rows, seed=42, companies=None):
+    """People with titles at companies, for poster matching; pass a job table's company count to align them"""
+    gen = Generator(seed, companies=companies)
+    rng = gen.rng
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["poster_name", "poster_title", "company", "poster_linkedin"])
+        for i in range(rows):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            handle = f"{first}{last}{i}".lower().encode("ascii", "ignore").decode()
+            title = rng.choice(["Engineering Lead", "Hiring Manager", "Head of", "Technical Recruiter",
+                                "Staff", "Director,"]) + " " + rng.choice(ROLES) + rng.choice(TEAMS)
+            writer.writerow([f"{first} {last}", title, gen.company(rows), f"https://linkedin.com/in/{handle}"])
+
+
+def scaffold_csv(path, rows, seed=42, enriched=0.3):
+    gen = Generator(seed)
+    rng = gen.rng
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(SCAFFOLD_COLUMNS)
+        for pid, title, company, location, date in gen.postings(rows):
+            row = dict.fromkeys(SCAFFOLD_COLUMNS, "")
+            row.update(job_title=title, company=company, original_url=f"https://aijobs.net/job/{pid}-{gen.slug(title)}/",
+                       location=location)
+            if rng.random() < enriched:
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                handle = f"{first}{last}{pid % 997}".lower().encode("ascii", "ignore").decode()
+                row.update(
+                    poster_name=f"{first} {last}",
+                    poster_linkedin=f"https://linkedin.com/in/{handle}",
+                    poster_title=rng.choice(["Engineering Lead, ", "Hiring Manager, ", "Head of "]) + rng.choice(ROLES),
+                    poster_type=rng.choice(POSTER_TYPES),
+                    confidence=rng.randint(0, 100),
+                    reason="Synthetic match on company + team.",
+                    meta_scrape_status=rng.choice(STATUSES),
+                    org_search_status=rng.choice(STATUSES),
+                    poster_twitter=f"@{handle[:15]}" if rng.random() < 0.3 else "",
+                    contact_source="synthetic",
+                    poster_location=rng.choice([location, location, "Berlin, Germany", ""]),
+                )
+            writer.writerow(row.values())
+
+
+GENERATORS = {
+    "remotive": (remotive_payload, ".json"),
+    "remoteok": (remoteok_payload, ".json"),
+    "jobs": (jobs_csv, ".csv"),
+    "teal": (teal_export, ".csv"),
+    "scaffold": (scaffold_csv, ".csv"),
+    "contacts": (contacts_csv, ".csv"),
+}
+
+
+def generate(kind, path, rows, seed=42):
+    fn, _ = GENERATORS[kind]
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    fn(path, rows, seed)
+    return Path(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic feeds, Teal exports and scaffold tables")
+    parser.add_argument("kind", choices=sorted(GENERATORS))
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("-o", "--output", help="output path (default: output/synthetic/<kind>_<rows><ext>)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    output = args.output or Path("output/synthetic") / f"{args.kind}_{args.rows}{GENERATORS[args.kind][1]}"
+    path = generate(args.kind, output, args.rows, args.seed)
+    print(f"✅ Wrote {args.rows} synthetic {args.kind} rows to {path} ({path.stat().st_size / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Small DAG runner for the pipeline stages.
+
+A Stage declares typed inputs and outputs, the source files it reads and
+the files it persists. The runner checks the graph once (every input has
+exactly one producer of the same type), then runs stages on a thread
+pool as soon as their inputs are ready, so independent branches overlap.
+A stage can also name stages it must run `after` without taking their
+outputs, when both write the same file or database.
+
+Each stage gets a fingerprint: a hash of its code, the source of the
+project modules it imports (directly or through other project modules),
+its params, the content of its source files and the fingerprints of the
+outputs it consumes. A stage whose fingerprint matches the last successful run
+(and whose persisted files still exist) is skipped. Outputs pass to
+downstream stages in memory; a skipped stage's outputs are only loaded
+from disk if a downstream stage actually has to run.
+
+File content hashes are cached by (size, mtime), so a no-op re-run costs
+a few stat calls per stage.
+"""
+
+import ast
+import dis
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+import time
+import types
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import metrics
+
+STATE_PATH = Path("output/.pipeline_state.json")
+HASH_CHUNK = 1024 * 1024
+PROJECT_DIR = Path(__file__).resolve().parent
+
+
+def _code_imports(code):
+    """Top-level names of the modules a code object (or any function in it) imports"""
+    names = {i.argval.partition(".")[0] for i in dis.get_instructions(code) if i.opname == "IMPORT_NAME"}
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_imports(const)
+    return names
+
+
+@lru_cache(maxsize=None)
+def _module_path(name):
+    """Source file of a project module, None for the stdlib, packages and unknown names"""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.has_location or not spec.origin.endswith(".py"):
+        return None
+    path = Path(spec.origin).resolve()
+    return path if PROJECT_DIR in path.parents else None
+
+
+@lru_cache(maxsize=1024)
+def _file_imports(path, size, mtime_ns):
+    """Top-level names a source file imports anywhere, lazy imports included; keyed on size/mtime"""
+    tree = ast.parse(Path(path).read_bytes(), filename=str(path))
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.partition(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.partition(".")[0])
+    return frozenset(names)
+
+
+class StageError(Exception):
+    """A stage finished but its result must not be cached (e.g. validation failed)"""
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: object                                    # fn(**inputs) -> {output name: value}
+    inputs: dict = field(default_factory=dict)    # input name -> type
+    outputs: dict = field(default_factory=dict)   # output name -> type
+    sources: tuple = ()                           # files or directories read by the stage
+    persist: tuple = ()                           # files the stage writes; must exist to skip
+    params: dict = field(default_factory=dict)
+    load: object = None                           # load() -> outputs, from the persisted files
+    volatile: bool = False                        # only runs when asked for (e.g. network pulls)
+    after: tuple = ()                             # stages that must finish first, e.g. writers of a shared file
+
+    def code_hash(self):
+        code = self.fn.__code__
+        return hashlib.blake2b(code.co_code + repr(code.co_consts).encode("utf-8"), digest_size=8).hexdigest()
+
+    def modules(self):
+        """Source files of the project modules the stage imports, followed transitively"""
+        found, pending = set(), list(_code_imports(self.fn.__code__))
+        while pending:
+            path = _module_path(pending.pop())
+            if path is None or path in found:
+                continue
+            found.add(path)
+            st = path.stat()
+            pending.extend(_file_imports(path, st.st_size, st.st_mtime_ns))
+        return sorted(found)
+
+
+class FileHasher:
+    """Content digests of files and directories, cached by size and mtime"""
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else {}
+        self.lock = threading.Lock()
+
+    def _file(self, path):
+        st = path.stat()
+        key = str(path)
+        with self.lock:
+            cached = self.cache.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(HASH_CHUNK), b""):
+                h.update(block)
+        digest = h.hexdigest()
+        with self.lock:
+            self.cache[key] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def digest(self, path):
+        path = Path(path)
+        if path.is_dir():
+            h = hashlib.blake2b(digest_size=16)
+            for child in sorted(p for p in path.rglob("*") if p.is_file()):
+                h.update(f"{child.relative_to(path)}:{self._file(child)}\n".encode("utf-8"))
+            return h.hexdigest()
+        if path.exists():
+            return self._file(path)
+        return "absent"
+
+
+class Pipeline:
+    def __init__(self, stages, state_path=STATE_PATH, max_workers=4):
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_path = Path(state_path)
+        self.max_workers = max_workers
+        self.producers = {}
+        for stage in stages:
+            for name, kind in stage.outputs.items():
+                if name in self.producers:
+                    raise ValueError(f"Output {name!r} is produced by both {self.producers[name]} and {stage.name}")
+                self.producers[name] = stage.name
+        for stage in stages:
+            for name, kind in stage.inputs.items():
+                producer = self.producers.get(name)
+                if producer is None:
+                    raise ValueError(f"Stage {stage.name} needs {name!r}, which no stage produces")
+                produced = self.stages[producer].outputs[name]
+                if produced != kind:
+                    raise TypeError(f"Stage {stage.name} expects {name!r} as {kind}, {producer} produces {produced}")
+            for name in stage.after:
+                if name not in self.stages:
+                    raise ValueError(f"Stage {stage.name} runs after {name!r}, which is not a stage")
+        self.order = self._toposort()
+
+    def _deps(self, stage):
+        return {self.producers[name] for name in stage.inputs} | set(stage.after)
+
+    def _toposort(self):
+        order, done, visiting = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle through stage {name}")
+            visiting.add(name)
+            for dep in sorted(self._deps(self.stages[name])):
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _load_state(self):
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"stages": {}, "files": {}}
+
+    def _save_state(self, state):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+
+    def _select(self, targets, run_volatile):
+        """Stages to consider: the targets and everything upstream of them"""
+        wanted = set()
+        pending = list(targets or self.stages)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage: {name}")
+            if name not in wanted:
+                wanted.add(name)
+                pending.extend(self._deps(self.stages[name]))
+        explicit = set(targets or ())
+        return [
+            name for name in self.order
+            if name in wanted and (not self.stages[name].volatile or run_volatile or name in explicit)
+        ], wanted
+
+    def run(self, targets=None, force=False, run_volatile=False):
+        """Run (or skip) the selected stages; returns {stage: (status, seconds)}"""
+        state = self._load_state()
+        hasher = FileHasher(state.setdefault("files", {}))
+        runnable, wanted = self._select(targets, run_volatile)
+        lock = threading.Lock()
+        values, output_fps, results = {}, {}, {}
+
+        def output_fp(stage, input_fp):
+            # Downstream stages key on what was written, not on how it was produced
+            if not stage.persist:
+                return input_fp
+            digests = "".join(hasher.digest(p) for p in stage.persist)
+            return hashlib.blake2b(digests.encode("utf-8"), digest_size=16).hexdigest()
+
+        def input_fp(stage):
+            h = hashlib.blake2b(digest_size=16)
+            params = json.dumps(stage.params, sort_keys=True, default=str)
+            h.update(f"{stage.name}|{stage.code_hash()}|{params}".encode("utf-8"))
+            for module in stage.modules():
+                h.update(f"|{module.relative_to(PROJECT_DIR)}:{hasher.digest(module)}".encode("utf-8"))
+            for source in stage.sources:
+                h.update(f"|{source}:{hasher.digest(source)}".encode("utf-8"))
+            for dep in sorted(self._deps(stage)):
+                h.update(f"|{dep}:{output_fps[dep]}".encode("utf-8"))
+            return h.hexdigest()
+
+        def inputs_for(stage):
+            kwargs = {}
+            for name in stage.inputs:
+                producer = self.stages[self.producers[name]]
+                with lock:
+                    if producer.name not in values:
+                        if producer.load is None:
+                            raise StageError(f"{producer.name} was skipped and cannot reload {name!r}")
+                        values[producer.name] = producer.load()
+                    kwargs[name] = values[producer.name][name]
+            return kwargs
+
+        def execute(stage):
+            started = time.perf_counter()
+            with metrics.span("dag_stage", stage=stage.name):
+                outputs = stage.fn(**inputs_for(stage)) or {}
+            missing = set(stage.outputs) - set(outputs)
+            if missing:
+                raise StageError(f"{stage.name} did not produce {sorted(missing)}")
+            with lock:
+                values[stage.name] = outputs
+            return time.perf_counter() - started
+
+        # Volatile stages that are not run act as sources: their persisted files stand in for them
+        for name in self.order:
+            if name in wanted and name not in runnable:
+                output_fps[name] = output_fp(self.stages[name], "")
+                results[name] = ("source", 0.0)
+
+        failed, fps, running = set(), {}, {}
+        remaining = list(runnable)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while remaining or running:
+                for name in list(remaining):
+                    stage = self.stages[name]
+                    deps = self._deps(stage)
+                    if deps & failed:
+                        remaining.remove(name)
+                        failed.add(name)
+                        results[name] = ("blocked", 0.0)
+                        continue
+                    if not all(dep in output_fps for dep in deps):
+                        continue
+                    remaining.remove(name)
+                    fps[name] = input_fp(stage)
+                    previous = state["stages"].get(name, {})
+                    if (not force and not stage.volatile and previous.get("fingerprint") == fps[name]
+                            and all(Path(p).exists() for p in stage.persist)):
+                        output_fps[name] = output_fp(stage, fps[name])
+                        results[name] = ("cached", 0.0)
+                        continue
+                    running[pool.submit(execute, stage)] = name
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    stage = self.stages[name]
+                    try:
+                        elapsed = future.result()
+                    except Exception as e:
+                        failed.add(name)
+                        results[name] = ("failed", 0.0)
+                        state["stages"].pop(name, None)
+                        print(f"❌ {name}: {e}")
+                        continue
+                    output_fps[name] = output_fp(stage, fps[name])
+                    results[name] = ("ran", elapsed)
+                    state["stages"][name] = {"fingerprint": fps[name], "ran_at": time.time()}
+                    self._save_state(state)
+        self._save_state(state)
+        for name, (status, _) in results.items():
+            metrics.inc("dag_stages_total", stage=name, status=status)
+        return {name: results[name] for name in self.order if name in results}
+
+    def report(self, results):
+        icons = {"ran": "✅", "cached": "⏭️ ", "source": "📄", "failed": "❌", "blocked": "⛔"}
+        for name, (status, elapsed) in results.items():
+            timing = f" in {elapsed:.2f}s" if status == "ran" else ""
+            print(f"{icons[status]} {name}: {status}{timing}")
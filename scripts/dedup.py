@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Cross-source deduplication of job postings.
+
+Every posting is keyed on its canonical original_url and on its
+normalized (company, job_title). Keys live in a persistent SQLite index
+(B-tree lookups, so cost grows with log n as the archive grows) together
+with the posting that first claimed them. A posting is identified by its
+source (platform) plus URL, and it is a duplicate when one of its keys
+already belongs to a different posting, which keeps re-runs over the
+same file idempotent.
+
+The optional near-duplicate mode adds MinHash signatures over title
+trigrams, banded for LSH and scoped to the company, so "Sr. Software
+Engineer" and "Senior Software Engineer" at the same company collapse.
+
+    python scripts/dedup.py output/rss_jobs.csv output/teal_jobs_scaffold.csv -o output/jobs_dedup.csv --near
+"""
+
+import argparse
+import csv
+import hashlib
+import re
+import sqlite3
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+import metrics
+from urls import canonical_url
+
+INDEX_PATH = Path("output/dedup.sqlite")
+BATCH_SIZE = 5000
+SQL_IN_LIMIT = 500
+
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "gmbh", "plc", "usa"}
+TITLE_ABBREVIATIONS = {
+    "sr": "senior", "jr": "junior", "eng": "engineer", "engr": "engineer",
+    "mgr": "manager", "dev": "developer", "ml": "machine learning", "swe": "software engineer",
+}
+
+NUM_PERM = 64
+LSH_BANDS = 16
+NEAR_THRESHOLD = 0.8
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def text_words(text):
+    """Casefolded ASCII word tokens of a value (accents stripped)"""
+    text = unicodedata.normalize("NFKD", str(text or "")).casefold()
+    return re.findall(r"[a-z0-9]+", text)
+
+
+def normalize_company(company):
+    words = text_words(company)
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def normalize_title(title):
+    return " ".join(TITLE_ABBREVIATIONS.get(w, w) for w in text_words(title))
+
+
+def _digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+
+@lru_cache(maxsize=None)
+def _permutations():
+    """MinHash (a, b) parameters, built on first use so exact-only runs never load numpy"""
+    import numpy as np
+
+    rng = np.random.RandomState(1)
+    a = rng.randint(1, np.iinfo(np.int64).max, NUM_PERM, dtype=np.int64).astype(np.uint64)
+    b = rng.randint(0, np.iinfo(np.int64).max, NUM_PERM, dtype=np.int64).astype(np.uint64)
+    return a, b
+
+
+def minhash(text):
+    """64-permutation MinHash signature over character trigrams"""
+    import numpy as np
+
+    perm_a, perm_b = _permutations()
+    padded = f" {text} "
+    shingles = {padded[i:i + 3] for i in range(max(1, len(padded) - 2))}
+    hashes = np.fromiter(
+        (int.from_bytes(_digest(s)[:4], "little") for s in shingles), dtype=np.uint64, count=len(shingles)
+    )
+    permuted = (np.outer(hashes, perm_a) + perm_b) % np.uint64(_MERSENNE_PRIME) & np.uint64(_MAX_HASH)
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+class DedupIndex:
+    def __init__(self, path=INDEX_PATH, near=False, threshold=NEAR_THRESHOLD):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.near = near
+        self.threshold = threshold
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS dedup_keys (key BLOB PRIMARY KEY, owner BLOB NOT NULL) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS minhash_sigs (owner BLOB PRIMARY KEY, sig BLOB NOT NULL) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS minhash_bands ("
+            " bucket BLOB NOT NULL, owner BLOB NOT NULL, PRIMARY KEY (bucket, owner)) WITHOUT ROWID;"
+        )
+        self._emitted = set()
+        self.stats = {"seen": 0, "kept": 0, "exact": 0, "near": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def row_keys(row):
+        """Return (owner, keys, company, title); owner identifies the posting itself"""
+        url = canonical_url(row.get("original_url"))
+        company = normalize_company(row.get("company"))
+        title = normalize_title(row.get("job_title"))
+        keys = []
+        if url:
+            keys.append(_digest("url:" + url))
+        if company and title:
+            keys.append(_digest(f"ct:{company}|{title}"))
+        if not keys:
+            return None, keys, company, title
+        source = row.get("platform") or row.get("source") or ""
+        owner = _digest(f"{source}|{url or company + '|' + title}")
+        return owner, keys, company, title
+
+    def _lookup(self, keys):
+        found = {}
+        keys = list(set(keys))
+        for i in range(0, len(keys), SQL_IN_LIMIT):
+            chunk = keys[i:i + SQL_IN_LIMIT]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(self.conn.execute(
+                f"SELECT key, owner FROM dedup_keys WHERE key IN ({placeholders})", chunk
+            ).fetchall())
+        return found
+
+    def _is_near_duplicate(self, owner, company, title):
+        import numpy as np
+
+        sig = minhash(title)
+        rows = len(sig) // LSH_BANDS
+        buckets = [
+            _digest(company + "|" + str(band)) + sig[band * rows:(band + 1) * rows].tobytes()
+            for band in range(LSH_BANDS)
+        ]
+        placeholders = ",".join("?" * len(buckets))
+        candidates = [c for (c,) in self.conn.execute(
+            f"SELECT DISTINCT owner FROM minhash_bands WHERE bucket IN ({placeholders})", buckets
+        ) if c != owner]
+        for candidate in candidates:
+            (other,) = self.conn.execute("SELECT sig FROM minhash_sigs WHERE owner = ?", (candidate,)).fetchone()
+            if np.mean(np.frombuffer(other, dtype=np.uint32) == sig) >= self.threshold:
+                return True
+        self.conn.execute("INSERT OR REPLACE INTO minhash_sigs VALUES (?, ?)", (owner, sig.tobytes()))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO minhash_bands VALUES (?, ?)", ((b, owner) for b in buckets)
+        )
+        return False
+
+    def filter_batch(self, rows):
+        """Return the rows of a batch that are not duplicates, recording their keys"""
+        keyed = [(row, *self.row_keys(row)) for row in rows]
+        exact, near = self.stats["exact"], self.stats["near"]
+        existing = self._lookup(k for _, _, keys, _, _ in keyed for k in keys)
+        kept, new_keys = [], []
+        with self.conn:
+            for row, owner, keys, company, title in keyed:
+                self.stats["seen"] += 1
+                if owner is None:
+                    kept.append(row)
+                    continue
+                if owner in self._emitted or any(existing.get(k, owner) != owner for k in keys):
+                    self.stats["exact"] += 1
+                    continue
+                if self.near and company and title and self._is_near_duplicate(owner, company, title):
+                    self.stats["near"] += 1
+                    continue
+                for k in keys:
+                    if k not in existing:
+                        existing[k] = owner
+                        new_keys.append((k, owner))
+                self._emitted.add(owner)
+                kept.append(row)
+            self.conn.executemany("INSERT OR IGNORE INTO dedup_keys VALUES (?, ?)", new_keys)
+        self.stats["kept"] += len(kept)
+        metrics.inc("rows_dropped_total", self.stats["exact"] - exact, stage="dedup", reason="duplicate")
+        metrics.inc("rows_dropped_total", self.stats["near"] - near, stage="dedup", reason="near_duplicate")
+        return kept
+
+    def filter_records(self, records, batch_size=BATCH_SIZE):
+        """Stream records through the index, yielding only non-duplicates"""
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                yield from self.filter_batch(batch)
+                batch = []
+        if batch:
+            yield from self.filter_batch(batch)
+
+    def filter_frame(self, df):
+        """Drop duplicate rows from a DataFrame with job_title/company/original_url columns"""
+        cols = [c for c in ("job_title", "company", "original_url", "platform", "source") if c in df.columns]
+        import numpy as np
+
+        records = df[cols].fillna("").to_dict("records")
+        mask = []
+        for i in range(0, len(records), BATCH_SIZE):
+            batch = records[i:i + BATCH_SIZE]
+            kept = {id(r) for r in self.filter_batch(batch)}
+            mask.extend(id(r) in kept for r in batch)
+        return df[np.array(mask, dtype=bool)] if mask else df
+
+    def report(self):
+        dropped = self.stats["exact"] + self.stats["near"]
+        print(
+            f"🧹 Dedup: {self.stats['seen']} in, {self.stats['kept']} kept, {dropped} duplicates dropped"
+            f" ({self.stats['exact']} exact, {self.stats['near']} near)"
+        )
+
+
+def dedup_csv(inputs, output, index_path=INDEX_PATH, near=False):
+    """Merge one or more job CSVs into output, dropping duplicates across all of them"""
+    fieldnames = None
+    with DedupIndex(index_path, near=near) as index, open(output, "w", newline="", encoding="utf-8") as out:
+        writer = None
+        for path in inputs:
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                if writer is None:
+                    fieldnames = reader.fieldnames
+                    writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction="ignore")
+                    writer.writeheader()
+                writer.writerows(index.filter_records(reader))
+        index.report()
+        return dict(index.stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drop duplicate job postings across CSV files")
+    parser.add_argument("inputs", nargs="+", help="job CSVs with job_title, company and original_url columns")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--index", default=INDEX_PATH, help="persistent dedup index (SQLite)")
+    parser.add_argument("--near", action="store_true", help="also drop near-duplicate titles (MinHash/LSH)")
+    args = parser.parse_args()
+    dedup_csv(args.inputs, args.output, args.index, args.near)
+
+
+if __name__ == "__main__":
+    main()
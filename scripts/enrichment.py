@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Parallel contact enrichment over the job store.
+
+Pending jobs (status column still empty) fan out to a bounded thread
+pool. Every provider owns a token bucket, so throughput is set by the
+provider's rate limit rather than by one-request-at-a-time latency.
+Lookups that still fail transiently after their retries (timeouts, 429,
+5xx) leave the status empty, so the next run picks them up again.
+Finished rows are appended to an on-disk checkpoint as they complete
+and written back to the store in batches; the checkpoint is cleared
+after each batch commits and replayed on start-up, so a restart never
+redoes a row that already finished.
+
+FakeProvider answers locally with deterministic contacts, latency and
+transient failures, for offline runs and benchmarks.
+
+    python scripts/enrichment.py --provider fake --workers 16 --limit 500
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import metrics
+from job_store import STORE_PATH, JobStore
+from org_cache import CACHE_PATH, OrgSearchCache
+
+CHECKPOINT_DIR = Path("output/.enrich_checkpoints")
+DEFAULT_WORKERS = 8
+BATCH_SIZE = 200
+
+PROVIDERS = {}
+
+
+def register_provider(cls):
+    """Class decorator that adds a provider instance to PROVIDERS"""
+    PROVIDERS[cls.name] = cls()
+    return cls
+
+
+class ProviderError(Exception):
+    """
+    A failed lookup. A permanent failure ends up in the status column as
+    fail:<code>; a retryable one leaves the job pending for the next run.
+    """
+
+    def __init__(self, code, retryable=False, retry_after=None):
+        super().__init__(code)
+        self.code = code
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, at most `burst` saved up"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = max(1.0, float(burst))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` are available; returns the seconds spent waiting"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class EnrichmentProvider:
+    name = ""
+    rate = 1.0          # requests per second allowed by the provider
+    burst = 1
+    retries = 2
+    backoff = 0.5
+    status_column = "org_search_status"
+
+    def __init__(self):
+        self.bucket = TokenBucket(self.rate, self.burst)
+        self.cache = None
+
+    def lookup(self, job):
+        """Return scaffold poster_* columns for a job, or None when nothing matched"""
+        raise NotImplementedError
+
+    def _fetch(self, job):
+        """Rate-limited lookup, retrying transient ProviderErrors with backoff"""
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            started = time.perf_counter()
+            try:
+                result = self.lookup(job)
+            except ProviderError as e:
+                metrics.inc("provider_calls_total", provider=self.name, result=e.code)
+                metrics.observe("provider_call_duration_seconds", time.perf_counter() - started, provider=self.name)
+                if not e.retryable or attempt >= self.retries:
+                    raise
+                time.sleep(e.retry_after or self.backoff * (2 ** attempt))
+            else:
+                metrics.inc("provider_calls_total", provider=self.name, result="ok")
+                metrics.observe("provider_call_duration_seconds", time.perf_counter() - started, provider=self.name)
+                return result
+
+    def enrich(self, job):
+        """Look up a job's poster (through the org cache if set); always returns a write-back row"""
+        update = {"original_url": job["original_url"], "company": job["company"], "job_title": job["job_title"]}
+        try:
+            if self.cache is not None:
+                contact = self.cache.get_or_fetch(self.name, job["company"], job["job_title"], lambda: self._fetch(job))
+            else:
+                contact = self._fetch(job)
+        except ProviderError as e:
+            # A None status never overwrites the stored one, so the job stays pending
+            update[self.status_column] = None if e.retryable else f"fail:{e.code}"
+            return update
+        if not contact:
+            update[self.status_column] = "fail:no_match"
+            return update
+        update.update(contact)
+        update.setdefault("contact_source", self.name)
+        update[self.status_column] = "success"
+        return update
+
+
+@register_provider
+class FakeProvider(EnrichmentProvider):
+    """Offline provider: deterministic answers, fixed latency and first-attempt failures"""
+
+    name = "fake"
+    rate = 50.0
+    burst = 10
+
+    def __init__(self, rate=None, burst=None, latency=0.05, fail_rate=0.05, match_rate=0.7):
+        if rate is not None:
+            self.rate = rate
+        if burst is not None:
+            self.burst = burst
+        super().__init__()
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.match_rate = match_rate
+        self.calls = 0
+        self._failed = set()
+        self._lock = threading.Lock()
+
+    def _roll(self, key, salt):
+        digest = hashlib.blake2b(f"{salt}:{key}".encode("utf-8"), digest_size=4).digest()
+        return int.from_bytes(digest, "little") / 0xFFFFFFFF
+
+    def lookup(self, job):
+        key = job["canonical_url"]
+        time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+            if key not in self._failed and self._roll(key, "fail") < self.fail_rate:
+                self._failed.add(key)
+                raise ProviderError("timeout", retryable=True, retry_after=0.01)
+        if self._roll(key, "match") >= self.match_rate:
+            return None
+        handle = "lead" + hashlib.blake2b(key.encode("utf-8"), digest_size=3).hexdigest()
+        return {
+            "poster_name": f"{job['company'] or 'Unknown'} Hiring Lead",
+            "poster_linkedin": f"https://linkedin.com/in/{handle}",
+            "poster_title": f"Hiring Manager, {job['job_title'] or 'Engineering'}",
+            "poster_type": "hiring_manager",
+            "poster_twitter": f"@{handle}",
+            "confidence": int(50 + self._roll(key, "confidence") * 50),
+            "reason": "Fake provider match on company + title.",
+        }
+
+
+class Checkpoint:
+    """Append-only JSONL of finished rows that are not yet committed to the store"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fp = None
+
+    def load(self):
+        if not self.path.exists():
+            return []
+        rows = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break  # torn final line from a crash
+        return rows
+
+    def append(self, row):
+        if self.fp is None:
+            self.fp = open(self.path, "a", encoding="utf-8")
+        self.fp.write(json.dumps(row) + "\n")
+        self.fp.flush()
+
+    def sync(self):
+        if self.fp is not None:
+            os.fsync(self.fp.fileno())
+
+    def reset(self):
+        """Drop everything recorded so far; called once a batch is in the store"""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def close(self):
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
+
+
+class EnrichmentRunner:
+    def __init__(self, store, provider, workers=DEFAULT_WORKERS, batch_size=BATCH_SIZE,
+                 checkpoint_dir=CHECKPOINT_DIR):
+        self.store = store
+        self.provider = provider
+        self.workers = workers
+        self.batch_size = batch_size
+        self.checkpoint = Checkpoint(Path(checkpoint_dir) / f"{provider.name}.jsonl")
+        self.stats = {"replayed": 0, "done": 0, "success": 0, "no_match": 0, "failed": 0, "deferred": 0,
+                      "elapsed": 0.0}
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        self.checkpoint.sync()
+        self.store.upsert_rows(batch, source=None)
+        self.checkpoint.reset()
+        if self.provider.cache is not None:
+            self.provider.cache.commit()
+        batch.clear()
+
+    def _record(self, row, batch):
+        self.checkpoint.append(row)
+        batch.append(row)
+        self.stats["done"] += 1
+        status = row[self.provider.status_column]
+        if status == "success":
+            self.stats["success"] += 1
+        elif status is None:
+            self.stats["deferred"] += 1
+        else:
+            self.stats["no_match" if status == "fail:no_match" else "failed"] += 1
+        if len(batch) >= self.batch_size:
+            self._flush(batch)
+
+    def run(self, limit=None):
+        """Enrich pending jobs until none are left (or `limit` rows are done)"""
+        started = time.perf_counter()
+        replay = self.checkpoint.load()
+        if replay:
+            self.store.upsert_rows(replay)
+            self.checkpoint.reset()
+            self.stats["replayed"] = len(replay)
+
+        jobs = self.store.iter_pending(self.provider.status_column)
+        batch, in_flight, submitted = [], set(), 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for job in jobs:
+                    if limit is not None and submitted >= limit:
+                        break
+                    in_flight.add(pool.submit(self.provider.enrich, dict(job)))
+                    submitted += 1
+                    if len(in_flight) >= self.workers * 2:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self._record(future.result(), batch)
+                for future in in_flight:
+                    self._record(future.result(), batch)
+                in_flight = set()
+            self._flush(batch)
+        finally:
+            self.checkpoint.close()
+        self.stats["elapsed"] = time.perf_counter() - started
+        return self.stats
+
+    def report(self):
+        s = self.stats
+        rate = s["done"] / s["elapsed"] if s["elapsed"] else 0
+        if s["replayed"]:
+            print(f"♻️  Replayed {s['replayed']} checkpointed rows from an interrupted run")
+        print(
+            f"🔎 {self.provider.name}: {s['done']} jobs enriched ({s['success']} matched,"
+            f" {s['no_match']} no match, {s['failed']} failed, {s['deferred']} left pending)"
+            f" in {s['elapsed']:.2f}s ({rate:.1f} jobs/s)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enrich pending jobs in the store with poster contacts")
+    parser.add_argument("--provider", default="fake", choices=sorted(PROVIDERS))
+    parser.add_argument("--db", default=STORE_PATH)
+    parser.add_argument("--input", help="scaffold or job table to load into the store first")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--rate", type=float, help="override the provider's requests per second")
+    parser.add_argument("--checkpoint-dir", default=CHECKPOINT_DIR)
+    parser.add_argument("--org-cache", default=CACHE_PATH, help="org-search cache (SQLite)")
+    parser.add_argument("--no-cache", action="store_true", help="search every posting, even for known companies")
+    args = parser.parse_args()
+
+    provider = PROVIDERS[args.provider]
+    if args.rate:
+        provider.rate = args.rate
+        provider.bucket = TokenBucket(args.rate, provider.burst)
+
+    with JobStore(args.db) as store:
+        if args.input:
+            from storage import iter_table_chunks
+
+            loaded = sum(store.upsert_frame(chunk) for chunk in iter_table_chunks(args.input))
+            print(f"📥 Loaded {loaded} rows from {args.input}")
+        if not args.no_cache:
+            provider.cache = OrgSearchCache(args.org_cache)
+        try:
+            runner = EnrichmentRunner(store, provider, args.workers, args.batch_size, args.checkpoint_dir)
+            runner.run(args.limit)
+            runner.report()
+        finally:
+            if provider.cache is not None:
+                provider.cache.report()
+                provider.cache.evict()
+                provider.cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Append-only archive of raw feed postings, for replay without the network.
+
+pull_rss.py hands every raw posting it parses to the archive. A posting
+is stored again whenever its content differs from its last archived
+version, as one compressed record: a gzip
+member, or a zstd frame when the zstandard package is installed. The
+records go to per-source monthly segments
+(output/feed_archive/remotive/2025-06.jsonl.gz), so `zcat` on a segment
+prints one JSON posting per line.
+
+index.bin holds one fixed-width entry per record: fetch time, source,
+posting ID hash, content digest, segment and byte range. It is read
+through a numpy memmap, so selecting a time range, a source or a posting
+among millions of entries is a few vectorized comparisons, and reading a
+record is a slice of a memory-mapped segment plus one decompress. Entries
+are appended only after their records are flushed; a torn tail from a
+crash is cut off on the next open.
+
+Replay runs the selected raw postings through the same adapters
+(sources.ADAPTERS) as a live pull, so a changed mapping or a new field
+can be re-derived for months of postings locally.
+
+    python scripts/feed_archive.py stats
+    python scripts/feed_archive.py replay --since 2025-06-01 --source remotive -o output/rss_jobs_replay.csv
+    python scripts/feed_archive.py show remoteok 1093436
+    python scripts/feed_archive.py add saved_remotive.json --source remotive --fetched-at 2025-05-01
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import sys
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+import metrics
+
+ARCHIVE_DIR = Path("output/feed_archive")
+COMMIT_EVERY = 10_000
+INDEX_DTYPE = np.dtype([
+    ("fetched_at", "<i8"),      # unix seconds of the pull that first saw this content
+    ("posting", "<u8"),         # hash of the feed's posting ID
+    ("digest", "<u8"),          # hash of source + canonical JSON, compared with the posting's last version
+    ("offset", "<u8"),          # byte range in the segment
+    ("length", "<u4"),
+    ("month", "<u4"),           # segment: source/YYYY-MM.jsonl.<ext>
+    ("source", "u1"),
+    ("codec", "u1"),
+    ("_pad", "V6"),
+])
+CODECS = {"gzip": 1, "zstd": 2}
+EXTENSIONS = {1: "gz", 2: "zst"}
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd archive segments need zstandard: pip3 install zstandard") from e
+    return zstandard
+
+
+def default_codec():
+    try:
+        _zstandard()
+    except ImportError:
+        return "gzip"
+    return "zstd"
+
+
+def _hash64(data):
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def posting_hash(posting_id):
+    return _hash64(str(posting_id).encode("utf-8"))
+
+
+def _timestamp(value):
+    """Unix seconds from an epoch number, a date or an ISO timestamp (UTC if naive)"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _fetch_order(fetched_at, positions):
+    """Indices sorting entries by fetch time, then by append position"""
+    return np.lexsort((positions, fetched_at))
+
+
+def _month(timestamp):
+    moment = datetime.fromtimestamp(timestamp, timezone.utc)
+    return moment.year * 100 + moment.month
+
+
+class FeedArchive:
+    def __init__(self, root=ARCHIVE_DIR, codec=None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.codec = CODECS[codec or default_codec()]
+        self.fetched_at = int(time.time())
+        self._manifest_path = self.root / "manifest.json"
+        self.sources = []
+        if self._manifest_path.exists():
+            self.sources = json.loads(self._manifest_path.read_text(encoding="utf-8"))["sources"]
+        self._index_path = self.root / "index.bin"
+        self._repair()
+        self._last = None            # (source, posting hash) -> digest of the last version
+        self._writers = {}
+        self._pending = []
+        self._maps = {}
+        self._compress = None
+        self.stats = {"added": 0, "unchanged": 0, "raw_bytes": 0, "stored_bytes": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.commit()
+        for f in self._writers.values():
+            f.close()
+        self._writers = {}
+        self._close_maps()
+
+    def _repair(self):
+        """Cut off a partly written index entry left by a crash"""
+        if self._index_path.exists():
+            size = self._index_path.stat().st_size
+            if size % INDEX_DTYPE.itemsize:
+                with open(self._index_path, "r+b") as f:
+                    f.truncate(size - size % INDEX_DTYPE.itemsize)
+
+    def _segment_path(self, source, month, codec):
+        return self.root / self.sources[source] / f"{month // 100:04d}-{month % 100:02d}.jsonl.{EXTENSIONS[codec]}"
+
+    def _source_code(self, name):
+        if name not in self.sources:
+            if len(self.sources) >= 255:
+                raise ValueError("feed archive supports at most 255 sources")
+            self.sources.append(name)
+            tmp_path = self._manifest_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps({"sources": self.sources}), encoding="utf-8")
+            tmp_path.replace(self._manifest_path)
+        return self.sources.index(name)
+
+    def index(self):
+        """Committed index entries as a read-only memmap (an empty array for a new archive)"""
+        size = self._index_path.stat().st_size if self._index_path.exists() else 0
+        if size < INDEX_DTYPE.itemsize:
+            return np.empty(0, dtype=INDEX_DTYPE)
+        return np.memmap(self._index_path, dtype=INDEX_DTYPE, mode="r", shape=(size // INDEX_DTYPE.itemsize,))
+
+    def add(self, source, posting_id, raw, fetched_at=None):
+        """
+        Archive one raw posting unless it matches the posting's last archived
+        version; True if written. A backfill older than the last version is
+        kept as history (once) and does not become the last version.
+        """
+        if self._last is None:
+            index = self.index()
+            # In fetch order, so the most recently fetched version of each posting wins
+            order = _fetch_order(index["fetched_at"], np.arange(len(index)))
+            self._last = dict(zip(
+                zip(index["source"][order].tolist(), index["posting"][order].tolist()),
+                zip(index["fetched_at"][order].tolist(), index["digest"][order].tolist()),
+            ))
+        data = json.dumps(raw, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        digest = _hash64(source.encode("utf-8") + b"\0" + data)
+        code, posting = self._source_code(source), posting_hash(posting_id)
+        fetched_at = _timestamp(fetched_at) or self.fetched_at
+        last = self._last.get((code, posting))
+        if last is not None and fetched_at < last[0]:
+            if self._archived(posting, digest):
+                self.stats["unchanged"] += 1
+                return False
+        elif last is not None and last[1] == digest:
+            self.stats["unchanged"] += 1
+            return False
+        else:
+            self._last[(code, posting)] = (fetched_at, digest)
+        month = _month(fetched_at)
+        writer = self._writers.get((code, month))
+        if writer is None:
+            path = self._segment_path(code, month, self.codec)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            writer = self._writers[(code, month)] = open(path, "ab")
+        if self._compress is None:
+            if self.codec == CODECS["zstd"]:
+                self._compress = _zstandard().ZstdCompressor(level=6).compress
+            else:
+                self._compress = lambda payload: zlib.compress(payload, 6, 31)   # wbits 31: a gzip member
+        blob = self._compress(data + b"\n")
+        offset = writer.tell()
+        writer.write(blob)
+        self._pending.append((fetched_at, posting, digest, offset, len(blob), month, code, self.codec, b""))
+        self.stats["added"] += 1
+        self.stats["raw_bytes"] += len(data) + 1
+        self.stats["stored_bytes"] += len(blob)
+        if len(self._pending) >= COMMIT_EVERY:
+            self.commit()
+        return True
+
+    def _archived(self, posting, digest):
+        """Whether this exact version of a posting is stored already (a scan; only backfills need it)"""
+        index = self.index()
+        if np.any((index["digest"] == digest) & (index["posting"] == posting)):
+            return True
+        return any(entry[1] == posting and entry[2] == digest for entry in self._pending)
+
+    def commit(self):
+        """Flush written records, then append their index entries"""
+        if not self._pending:
+            return
+        for f in self._writers.values():
+            f.flush()
+        with open(self._index_path, "ab") as f:
+            f.write(np.array(self._pending, dtype=INDEX_DTYPE).tobytes())
+        metrics.inc("archive_records_total", len(self._pending))
+        self._pending = []
+
+    def select(self, since=None, until=None, sources=None, posting_ids=None, latest=False):
+        """
+        Positions of the index entries fetched in [since, until), optionally
+        limited to some sources or posting IDs, in fetch order. With
+        latest=True only the most recently fetched version of each posting in
+        the selection is kept (a backfilled older version never wins).
+        """
+        self.commit()
+        index = self.index()
+        mask = np.ones(len(index), dtype=bool)
+        since, until = _timestamp(since), _timestamp(until)
+        if since is not None:
+            mask &= index["fetched_at"] >= since
+        if until is not None:
+            mask &= index["fetched_at"] < until
+        if sources:
+            codes = [self.sources.index(s) for s in sources if s in self.sources]
+            mask &= np.isin(index["source"], codes)
+        if posting_ids is not None:
+            mask &= np.isin(index["posting"], np.array([posting_hash(p) for p in posting_ids], dtype=np.uint64))
+        positions = np.flatnonzero(mask)
+        positions = positions[_fetch_order(index["fetched_at"][positions], positions)]
+        if latest and len(positions):
+            # Keys of (source, posting); the first occurrence in reverse fetch order is the latest version
+            keys = index["posting"][positions] ^ (index["source"][positions].astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15))
+            _, last = np.unique(keys[::-1], return_index=True)
+            positions = positions[np.sort(len(positions) - 1 - last)]
+        return positions
+
+    def _close_maps(self):
+        for f, mapped in self._maps.values():
+            mapped.close()
+            f.close()
+        self._maps = {}
+
+    def _segment(self, source, month, codec):
+        key = (source, month, codec)
+        if key not in self._maps:
+            f = open(self._segment_path(source, month, codec), "rb")
+            self._maps[key] = (f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return self._maps[key][1]
+
+    def records(self, positions):
+        """Yield (source, fetched_at, raw posting) for index positions"""
+        entries = self.index()[positions]
+        decompressors = {CODECS["gzip"]: lambda blob: zlib.decompress(blob, 31)}
+        if np.any(entries["codec"] == CODECS["zstd"]):
+            decompressors[CODECS["zstd"]] = _zstandard().ZstdDecompressor().decompress
+        try:
+            columns = zip(*(entries[name].tolist() for name in ("source", "month", "codec", "offset", "length", "fetched_at")))
+            for source, month, codec, offset, length, fetched_at in columns:
+                segment = self._segment(source, month, codec)
+                raw = json.loads(decompressors[codec](segment[offset:offset + length]))
+                yield self.sources[source], fetched_at, raw
+        finally:
+            self._close_maps()
+
+    def replay(self, since=None, until=None, sources=None, latest=True):
+        """
+        Yield job records re-derived from archived postings through the source adapters.
+
+        By default each posting contributes its latest version in the range;
+        latest=False replays every archived version in fetch order.
+        """
+        from sources import ADAPTERS
+
+        self.replay_errors = 0
+        positions = self.select(since, until, sources, latest=latest)
+        for source, _, raw in self.records(positions):
+            try:
+                record = ADAPTERS[source].normalize(raw)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                self.replay_errors += 1
+                metrics.inc("parse_errors_total", source=source, stage="replay")
+                continue
+            if record:
+                yield record
+
+    def summary(self):
+        """Per source: records, distinct postings, first and last fetch time"""
+        self.commit()
+        index = self.index()
+        summary = {}
+        for code, name in enumerate(self.sources):
+            entries = index[index["source"] == code]
+            if not len(entries):
+                continue
+            summary[name] = {
+                "records": len(entries),
+                "postings": len(np.unique(entries["posting"])),
+                "first": datetime.fromtimestamp(int(entries["fetched_at"].min()), timezone.utc).isoformat(),
+                "last": datetime.fromtimestamp(int(entries["fetched_at"].max()), timezone.utc).isoformat(),
+            }
+        return summary
+
+    def disk_bytes(self):
+        return sum(p.stat().st_size for p in self.root.rglob("*") if p.is_file())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and replay the raw feed archive")
+    parser.add_argument("--archive", default=ARCHIVE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="records, postings and time span per source")
+    cmd = sub.add_parser("replay", help="re-derive job rows from archived postings")
+    cmd.add_argument("--since", help="fetched at or after (ISO date/time, UTC)")
+    cmd.add_argument("--until", help="fetched before (ISO date/time, UTC)")
+    cmd.add_argument("--source", action="append", help="limit to a source (repeatable)")
+    cmd.add_argument("--all-versions", action="store_true", help="one row per archived version, not per posting")
+    cmd.add_argument("-o", "--output", default="output/rss_jobs_replay.csv")
+    cmd = sub.add_parser("show", help="print every archived version of a posting")
+    cmd.add_argument("source")
+    cmd.add_argument("posting_id")
+    cmd = sub.add_parser("add", help="archive a saved raw feed payload")
+    cmd.add_argument("payload")
+    cmd.add_argument("--source", required=True)
+    cmd.add_argument("--fetched-at", help="when the payload was fetched (default: now)")
+    args = parser.parse_args()
+
+    with FeedArchive(args.archive) as archive:
+        if args.command == "stats":
+            for name, info in archive.summary().items():
+                print(f"📦 {name}: {info['records']} records, {info['postings']} postings,"
+                      f" {info['first']} .. {info['last']}")
+            print(f"   {archive.disk_bytes() / 1024 / 1024:.1f} MB on disk in {archive.root}")
+        elif args.command == "replay":
+            from pull_rss import save_csv
+
+            started = time.perf_counter()
+            count = save_csv(archive.replay(args.since, args.until, args.source, latest=not args.all_versions),
+                             args.output)
+            print(f"⏱️  Replayed {count} postings in {time.perf_counter() - started:.1f}s"
+                  f" ({archive.replay_errors} could not be normalized)")
+        elif args.command == "show":
+            positions = archive.select(sources=[args.source], posting_ids=[args.posting_id])
+            for source, fetched_at, raw in archive.records(positions):
+                print(f"# {source} fetched {datetime.fromtimestamp(fetched_at, timezone.utc).isoformat()}")
+                print(json.dumps(raw, indent=2, ensure_ascii=False))
+            if not len(positions):
+                print(f"No archived versions of {args.source} posting {args.posting_id}")
+                sys.exit(1)
+        else:
+            from sources import ADAPTERS
+
+            if args.fetched_at:
+                archive.fetched_at = _timestamp(args.fetched_at)
+            with open(args.payload, "rb") as f:
+                for _ in ADAPTERS[args.source].records(f, archive=archive):
+                    pass
+            print(f"📦 Archived {archive.stats['added']} postings ({archive.stats['unchanged']} already stored)")
+
+
+if __name__ == "__main__":
+    main()
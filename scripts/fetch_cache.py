@@ -0,0 +1,184 @@
+"""
+On-disk fetch cache and seen-posting index for incremental ingestion.
+
+FetchCache keeps the last body of each feed together with its ETag and
+Last-Modified validators so the next pull can send a conditional GET.
+SeenIndex remembers which posting IDs have already been written, so a
+changed feed only yields its new postings.
+"""
+
+import hashlib
+import json
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+
+CACHE_DIR = Path("output/.fetch_cache")
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+MAX_CACHE_AGE = 7 * 24 * 3600
+MAX_SEEN_AGE = 90 * 24 * 3600
+
+
+class FetchCache:
+    def __init__(self, root=CACHE_DIR, max_bytes=MAX_CACHE_BYTES, max_age=MAX_CACHE_AGE):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._pending = set()
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.root / f"{key}.json", self.root / f"{key}.body"
+
+    def _load_meta(self, url):
+        meta_path, body_path = self._paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except ValueError:
+            return None
+
+    def _save_meta(self, url, meta):
+        meta_path, _ = self._paths(url)
+        tmp_path = meta_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+        tmp_path.replace(meta_path)
+
+    def conditional_headers(self, url):
+        """Validators to send with the next request for url"""
+        meta = self._load_meta(url)
+        if not meta:
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, result):
+        """Persist a 200 response and return its cached body opened for reading"""
+        meta_path, body_path = self._paths(result.url)
+        tmp_path = body_path.with_suffix(".body.tmp")
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(result.open(), f)
+        tmp_path.replace(body_path)
+        now = time.time()
+        headers = {k.lower(): v for k, v in result.headers.items()}
+        self._save_meta(result.url, {
+            "url": result.url,
+            "etag": headers.get("etag", ""),
+            "last_modified": headers.get("last-modified", ""),
+            "fetched_at": now,
+            "accessed_at": now,
+            "size": body_path.stat().st_size,
+            "processed": False,
+        })
+        return open(body_path, "rb")
+
+    def open_body(self, url):
+        """Open the cached body for url after a 304, refreshing its access time"""
+        meta = self._load_meta(url)
+        if meta is None:
+            return None
+        meta["accessed_at"] = time.time()
+        self._save_meta(url, meta)
+        return open(self._paths(url)[1], "rb")
+
+    def is_processed(self, url):
+        meta = self._load_meta(url)
+        return bool(meta and meta.get("processed"))
+
+    def mark_processed(self, url):
+        """Record that url's cached body was fully ingested; applied on commit()"""
+        self._pending.add(url)
+
+    def commit(self):
+        for url in self._pending:
+            meta = self._load_meta(url)
+            if meta is not None:
+                meta["processed"] = True
+                self._save_meta(url, meta)
+        self._pending.clear()
+
+    def evict(self):
+        """Drop entries idle longer than max_age, then least recently used ones over max_bytes"""
+        entries = []
+        for meta_path in self.root.glob("*.json"):
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except ValueError:
+                meta = {}
+            entries.append((meta.get("accessed_at", 0), meta.get("size", 0), meta_path))
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for accessed_at, size, meta_path in sorted(entries):
+            if now - accessed_at <= self.max_age and total <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            meta_path.with_suffix(".body").unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        return evicted
+
+
+class SeenIndex:
+    def __init__(self, path=CACHE_DIR / "seen.sqlite"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " source TEXT NOT NULL, posting_id TEXT NOT NULL, first_seen REAL NOT NULL,"
+            " PRIMARY KEY (source, posting_id)) WITHOUT ROWID"
+        )
+        self._pending = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def is_empty(self, source=None):
+        if source is None:
+            row = self.conn.execute("SELECT 1 FROM seen LIMIT 1").fetchone()
+        else:
+            row = self.conn.execute("SELECT 1 FROM seen WHERE source = ? LIMIT 1", (source,)).fetchone()
+        return row is None
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM seen")
+        self._pending.clear()
+
+    def check_and_add(self, source, posting_id):
+        """Return True if posting_id is new for source; it is recorded on commit()"""
+        row = self.conn.execute(
+            "SELECT 1 FROM seen WHERE source = ? AND posting_id = ?", (source, posting_id)
+        ).fetchone()
+        if row is not None or (source, posting_id) in self._pending:
+            return False
+        self._pending[(source, posting_id)] = time.time()
+        return True
+
+    def commit(self):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen VALUES (?, ?, ?)",
+                ((source, posting_id, ts) for (source, posting_id), ts in self._pending.items()),
+            )
+        self._pending.clear()
+
+    def prune(self, max_age=MAX_SEEN_AGE):
+        """Forget postings first seen more than max_age seconds ago"""
+        with self.conn:
+            return self.conn.execute("DELETE FROM seen WHERE first_seen < ?", (time.time() - max_age,)).rowcount
@@ -0,0 +1,201 @@
+"""
+Concurrent HTTP fetch engine shared by the ingestion scripts.
+
+Fetches run on a thread pool over one pooled ``requests.Session``.
+Each request has its own timeout and retry budget, the number of
+requests in flight against the same host is capped, and requests to one
+host can be spaced a minimum interval apart. Large payloads can be
+spooled to a temporary file instead of being held as bytes.
+"""
+
+import io
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 2
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+SPOOL_MAX_MEMORY = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class FetchRequest:
+    name: str
+    url: str
+    headers: dict = field(default_factory=dict)
+    timeout: float = DEFAULT_TIMEOUT
+    retries: int = DEFAULT_RETRIES
+    spool: bool = False
+
+
+@dataclass
+class FetchResult:
+    name: str
+    url: str
+    status: int = 0
+    body: bytes = b""
+    headers: dict = field(default_factory=dict)
+    elapsed: float = 0.0
+    attempts: int = 0
+    error: str = ""
+    reason: str = ""            # short failure code: timeout, connection, http_404, ...
+    body_file: object = None
+
+    @property
+    def ok(self):
+        return not self.error and 200 <= self.status < 300
+
+    def open(self):
+        """Return the body as a binary file object, spooled or in memory"""
+        if self.body_file is not None:
+            self.body_file.seek(0)
+            return self.body_file
+        return io.BytesIO(self.body)
+
+    def close(self):
+        if self.body_file is not None:
+            self.body_file.close()
+            self.body_file = None
+
+
+def _error_reason(exc):
+    if isinstance(exc, requests.exceptions.Timeout):
+        return "timeout"
+    if isinstance(exc, requests.exceptions.TooManyRedirects):
+        return "redirects"
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        return "connection"
+    return "error"
+
+
+class FetchEngine:
+    def __init__(self, max_workers=8, per_host=2, backoff=0.5, session=None, host_interval=0.0):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.backoff = backoff
+        self.host_interval = host_interval
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._hosts = {}
+        self._host_intervals = {}
+        self._next_start = {}
+        self._hosts_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _host_slot(self, host):
+        with self._hosts_lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return self._hosts[host]
+
+    def set_host_interval(self, host, seconds):
+        """Space requests to one host at least `seconds` apart (e.g. its robots.txt Crawl-delay)"""
+        with self._hosts_lock:
+            self._host_intervals[host.lower()] = seconds
+
+    def _wait_turn(self, host):
+        interval = self._host_intervals.get(host, self.host_interval)
+        if not interval:
+            return
+        with self._hosts_lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start + interval
+        if start > now:
+            time.sleep(start - now)
+
+    def _retry_delay(self, attempt, response=None):
+        """Exponential backoff, honouring a numeric Retry-After header"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff * (2 ** attempt)
+
+    def _spool(self, response):
+        spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+        try:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                spooled.write(chunk)
+        except BaseException:
+            spooled.close()
+            raise
+        finally:
+            response.close()
+        spooled.seek(0)
+        return spooled
+
+    def fetch(self, req):
+        """Fetch one request, retrying transient failures with backoff"""
+        result = FetchResult(name=req.name, url=req.url)
+        started = time.perf_counter()
+        host = urlsplit(req.url).netloc.lower()
+        slot = self._host_slot(host)
+
+        for attempt in range(req.retries + 1):
+            result.attempts = attempt + 1
+            response = None
+            result.close()
+            attempt_started = time.perf_counter()
+            try:
+                with slot:
+                    self._wait_turn(host)
+                    response = self.session.get(
+                        req.url, headers=req.headers, timeout=req.timeout, stream=req.spool
+                    )
+                    if req.spool:
+                        result.body_file = self._spool(response)
+                    else:
+                        result.body = response.content
+            except requests.exceptions.RequestException as e:
+                result.close()
+                result.error = str(e)
+                result.reason = _error_reason(e)
+                status, retry = "error", True
+            else:
+                result.status = status = response.status_code
+                result.headers = dict(response.headers)
+                result.error = f"HTTP {response.status_code}" if response.status_code >= 400 else ""
+                result.reason = f"http_{response.status_code}" if result.error else ""
+                retry = response.status_code in RETRY_STATUSES
+            metrics.inc("http_requests_total", source=req.name, status=status)
+            metrics.observe("http_request_duration_seconds", time.perf_counter() - attempt_started, source=req.name)
+            if not retry:
+                break
+
+            if attempt < req.retries:
+                time.sleep(self._retry_delay(attempt, response))
+
+        result.elapsed = time.perf_counter() - started
+        metrics.event("fetch", source=req.name, status=result.status, attempts=result.attempts,
+                      seconds=round(result.elapsed, 4), error=result.error)
+        return result
+
+    def fetch_all(self, reqs):
+        """Fetch every request concurrently; results keep the input order"""
+        reqs = list(reqs)
+        if not reqs:
+            return []
+        workers = min(self.max_workers, len(reqs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.fetch, reqs))
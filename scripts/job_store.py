@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Embedded SQLite store for jobs and contacts.
+
+Stages upsert into the store instead of only overwriting flat files, so
+history is kept and enrichment queries ("jobs with org_search_status
+empty") hit an index instead of scanning CSVs. A scaffold row maps to a
+job, its primary contact and the job_contacts link between them.
+Re-ingesting a job never clears enrichment that is already stored.
+
+    python scripts/job_store.py stats
+    python scripts/job_store.py pending org_search_status --limit 20
+    python scripts/job_store.py export output/scaffold_export.csv
+    python scripts/job_store.py rekey
+"""
+
+import argparse
+import math
+import sqlite3
+import time
+from pathlib import Path
+
+from dedup import normalize_company
+from scaffold_schema import SCAFFOLD_COLUMNS, canonical_name
+from urls import canonical_url
+
+STORE_PATH = Path("output/pipeline.db")
+BATCH_SIZE = 1000
+SQL_IN_LIMIT = 500
+
+STATUS_COLUMNS = ("meta_scrape_status", "org_search_status")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    canonical_url TEXT NOT NULL UNIQUE,
+    original_url TEXT,
+    job_title TEXT,
+    company TEXT,
+    company_norm TEXT,
+    platform TEXT,
+    location TEXT,
+    post_date TEXT,
+    confidence INTEGER,
+    reason TEXT,
+    meta_scrape_status TEXT,
+    org_search_status TEXT,
+    contact_source TEXT,
+    primary_contact_id INTEGER REFERENCES contacts(id),
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs(company_norm);
+CREATE INDEX IF NOT EXISTS jobs_meta_status ON jobs(meta_scrape_status);
+CREATE INDEX IF NOT EXISTS jobs_org_status ON jobs(org_search_status);
+
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    contact_key TEXT NOT NULL UNIQUE,
+    name TEXT,
+    linkedin TEXT,
+    title TEXT,
+    poster_type TEXT,
+    email TEXT,
+    phone TEXT,
+    twitter TEXT,
+    github TEXT,
+    company TEXT,
+    location TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contacts_company ON contacts(company);
+
+CREATE TABLE IF NOT EXISTS job_contacts (
+    job_id INTEGER NOT NULL REFERENCES jobs(id),
+    contact_id INTEGER NOT NULL REFERENCES contacts(id),
+    confidence INTEGER,
+    reason TEXT,
+    contact_source TEXT,
+    PRIMARY KEY (job_id, contact_id)
+);
+CREATE INDEX IF NOT EXISTS job_contacts_contact ON job_contacts(contact_id);
+"""
+
+# Columns added since a table was first created; CREATE TABLE IF NOT
+# EXISTS leaves older stores without them
+ADDED_COLUMNS = {
+    "contacts": {"location": "TEXT"},
+}
+
+JOB_FIELDS = (
+    "original_url", "job_title", "company", "company_norm", "platform", "location", "post_date",
+    "confidence", "reason", "meta_scrape_status", "org_search_status", "contact_source",
+)
+CONTACT_FIELDS = (
+    "name", "linkedin", "title", "poster_type", "email", "phone", "twitter", "github", "company", "location",
+)
+
+# contacts column -> scaffold column
+CONTACT_COLUMNS = {
+    "name": "poster_name",
+    "linkedin": "poster_linkedin",
+    "title": "poster_title",
+    "poster_type": "poster_type",
+    "email": "poster_email",
+    "phone": "poster_phone",
+    "twitter": "poster_twitter",
+    "github": "poster_github",
+    "location": "poster_location",
+}
+
+EXPORT_QUERY = """
+SELECT j.job_title, j.company, j.original_url,
+       c.name AS poster_name, c.linkedin AS poster_linkedin, c.title AS poster_title,
+       c.poster_type, j.confidence, j.reason, j.meta_scrape_status, j.org_search_status,
+       c.email AS poster_email, c.phone AS poster_phone, c.twitter AS poster_twitter,
+       c.github AS poster_github, j.contact_source, j.location, c.location AS poster_location
+FROM jobs j LEFT JOIN contacts c ON c.id = j.primary_contact_id
+"""
+
+
+def _fill_from(table, fields):
+    """Statement filling the keeper's (?1) empty fields from the merged row (?2)"""
+    updates = ", ".join(f"{f} = COALESCE({f}, (SELECT {f} FROM {table} WHERE id = ?2))" for f in fields)
+    return f"UPDATE {table} SET {updates} WHERE id = ?1"
+
+
+# Statements run with (keeper id, merged id) before a duplicate left by a rekey is deleted
+MERGE_STATEMENTS = {
+    "jobs": (
+        _fill_from("jobs", JOB_FIELDS + ("primary_contact_id",)),
+        "INSERT OR IGNORE INTO job_contacts"
+        " SELECT ?, contact_id, confidence, reason, contact_source FROM job_contacts WHERE job_id = ?",
+    ),
+    "contacts": (
+        _fill_from("contacts", CONTACT_FIELDS),
+        "INSERT OR IGNORE INTO job_contacts"
+        " SELECT job_id, ?, confidence, reason, contact_source FROM job_contacts WHERE contact_id = ?",
+        "UPDATE jobs SET primary_contact_id = ? WHERE primary_contact_id = ?",
+    ),
+}
+
+
+def _clean(value):
+    """Missing values (None, NaN, pd.NA, blank) become NULL"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    try:
+        if value != value:  # pd.NA and other NaN-likes
+            return None
+    except TypeError:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _clean_int(value):
+    value = _clean(value)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def job_key(row):
+    """Canonical URL, or a synthetic key for rows without one"""
+    url = canonical_url(_clean(row.get("original_url")) or "")
+    if url:
+        return url
+    return f"urn:job:{normalize_company(row.get('company'))}|{(_clean(row.get('job_title')) or '').casefold()}"
+
+
+def contact_key(row):
+    linkedin = _clean(row.get("poster_linkedin"))
+    if linkedin:
+        return canonical_url(linkedin)
+    name = _clean(row.get("poster_name"))
+    if name:
+        return f"name:{name.casefold()}|{normalize_company(row.get('company'))}"
+    return None
+
+
+class JobStore:
+    def __init__(self, path=STORE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        for table, columns in ADDED_COLUMNS.items():
+            present = {row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            for name, decl in columns.items():
+                if name not in present:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {decl}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _ids(self, table, key_column, keys):
+        ids = {}
+        keys = list(set(keys))
+        for i in range(0, len(keys), SQL_IN_LIMIT):
+            chunk = keys[i:i + SQL_IN_LIMIT]
+            placeholders = ",".join("?" * len(chunk))
+            ids.update(self.conn.execute(
+                f"SELECT {key_column}, id FROM {table} WHERE {key_column} IN ({placeholders})", chunk
+            ).fetchall())
+        return ids
+
+    def upsert_rows(self, rows, source=None):
+        """
+        Upsert job or scaffold rows (canonical or alias column names).
+
+        Non-empty values overwrite stored ones; empty values never clear
+        existing data. Rows with a poster become the job's primary contact.
+        Returns the number of rows written.
+        """
+        now = time.time()
+        jobs, contacts, links = {}, {}, []
+        for raw in rows:
+            row = {canonical_name(k): v for k, v in raw.items()}
+            key = job_key(row)
+            job = {field: _clean(row.get(field)) for field in JOB_FIELDS}
+            job["confidence"] = _clean_int(row.get("confidence"))
+            job["company_norm"] = normalize_company(row.get("company")) or None
+            job["platform"] = job["platform"] or _clean(row.get("source")) or source
+            job.update(canonical_url=key, now=now)
+            jobs[key] = job
+
+            ckey = contact_key(row)
+            if ckey:
+                contact = {field: _clean(row.get(col)) for field, col in CONTACT_COLUMNS.items()}
+                contact.update(contact_key=ckey, company=_clean(row.get("company")), now=now)
+                contacts[ckey] = contact
+                links.append((key, ckey, job["confidence"], job["reason"], job["contact_source"]))
+        if not jobs:
+            return 0
+
+        job_updates = ", ".join(
+            f"{f} = COALESCE(excluded.{f}, jobs.{f})" for f in JOB_FIELDS
+        )
+        contact_updates = ", ".join(
+            f"{f} = COALESCE(excluded.{f}, contacts.{f})" for f in CONTACT_FIELDS
+        )
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO jobs (canonical_url, {', '.join(JOB_FIELDS)}, first_seen, updated_at) "
+                f"VALUES (:canonical_url, {', '.join(':' + f for f in JOB_FIELDS)}, :now, :now) "
+                f"ON CONFLICT(canonical_url) DO UPDATE SET {job_updates}, updated_at = excluded.updated_at",
+                jobs.values(),
+            )
+            if contacts:
+                self.conn.executemany(
+                    f"INSERT INTO contacts (contact_key, {', '.join(CONTACT_FIELDS)}, updated_at) "
+                    f"VALUES (:contact_key, {', '.join(':' + f for f in CONTACT_FIELDS)}, :now) "
+                    f"ON CONFLICT(contact_key) DO UPDATE SET {contact_updates}, updated_at = excluded.updated_at",
+                    contacts.values(),
+                )
+                job_ids = self._ids("jobs", "canonical_url", [link[0] for link in links])
+                contact_ids = self._ids("contacts", "contact_key", [link[1] for link in links])
+                resolved = [
+                    (job_ids[jk], contact_ids[ck], conf, reason, src) for jk, ck, conf, reason, src in links
+                ]
+                self.conn.executemany(
+                    "INSERT INTO job_contacts VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(job_id, contact_id) DO UPDATE SET "
+                    "confidence = COALESCE(excluded.confidence, job_contacts.confidence), "
+                    "reason = COALESCE(excluded.reason, job_contacts.reason), "
+                    "contact_source = COALESCE(excluded.contact_source, job_contacts.contact_source)",
+                    resolved,
+                )
+                self.conn.executemany(
+                    "UPDATE jobs SET primary_contact_id = ? WHERE id = ?",
+                    ((contact_id, job_id) for job_id, contact_id, *_ in resolved),
+                )
+        return len(jobs)
+
+    def upsert_frame(self, df, source=None):
+        """Upsert a DataFrame of job or scaffold rows in batches"""
+        written = 0
+        for start in range(0, len(df), BATCH_SIZE):
+            written += self.upsert_rows(df.iloc[start:start + BATCH_SIZE].to_dict("records"), source)
+        return written
+
+    def tee(self, rows, source=None, batch_size=BATCH_SIZE, new_only=False):
+        """
+        Pass rows through unchanged while upserting them in batches.
+
+        With new_only=True, only rows whose job was not already stored are
+        passed on (each batch is checked before it is upserted).
+        """
+        if new_only:
+            yield from self._tee_new(rows, source, batch_size)
+            return
+        batch = []
+        for row in rows:
+            batch.append(row)
+            yield row
+            if len(batch) >= batch_size:
+                self.upsert_rows(batch, source)
+                batch = []
+        if batch:
+            self.upsert_rows(batch, source)
+
+    def _tee_new(self, rows, source, batch_size):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield from self._upsert_new(batch, source)
+                batch = []
+        if batch:
+            yield from self._upsert_new(batch, source)
+
+    def _upsert_new(self, batch, source):
+        keys = [job_key({canonical_name(k): v for k, v in row.items()}) for row in batch]
+        known = set(self._ids("jobs", "canonical_url", keys))
+        self.upsert_rows(batch, source)
+        for key, row in zip(keys, batch):
+            if key not in known:
+                known.add(key)
+                yield row
+
+    def pending(self, status_column, limit=None):
+        """Jobs whose status column is still empty, oldest first"""
+        if status_column not in STATUS_COLUMNS:
+            raise ValueError(f"Unknown status column: {status_column}")
+        query = f"SELECT * FROM jobs WHERE {status_column} IS NULL ORDER BY id"
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return self.conn.execute(query).fetchall()
+
+    def iter_pending(self, status_column, page_size=BATCH_SIZE):
+        """Page through pending jobs by id, so rows written back meanwhile are not revisited"""
+        if status_column not in STATUS_COLUMNS:
+            raise ValueError(f"Unknown status column: {status_column}")
+        last_id = 0
+        while True:
+            rows = self.conn.execute(
+                f"SELECT * FROM jobs WHERE {status_column} IS NULL AND id > ? ORDER BY id LIMIT ?",
+                (last_id, page_size),
+            ).fetchall()
+            if not rows:
+                return
+            yield from rows
+            last_id = rows[-1]["id"]
+
+    def update_status(self, status_column, updates):
+        """Set a status column for many jobs: updates is an iterable of (canonical_url, status)"""
+        if status_column not in STATUS_COLUMNS:
+            raise ValueError(f"Unknown status column: {status_column}")
+        with self.conn:
+            self.conn.executemany(
+                f"UPDATE jobs SET {status_column} = ?, updated_at = ? WHERE canonical_url = ?",
+                ((status, time.time(), key) for key, status in updates),
+            )
+
+    def iter_scaffold(self, where="", params=(), chunksize=50_000):
+        """Yield scaffold DataFrames built from the store"""
+        import pandas as pd
+
+        from storage import apply_scaffold_dtypes
+
+        query = EXPORT_QUERY + (f" WHERE {where}" if where else "") + " ORDER BY j.id"
+        for chunk in pd.read_sql_query(query, self.conn, params=params, chunksize=chunksize):
+            yield apply_scaffold_dtypes(chunk[SCAFFOLD_COLUMNS].copy())
+
+    def export_scaffold(self, path, where="", params=(), fmt=None):
+        """Write the store (or a filtered part of it) out as a scaffold table"""
+        from storage import TableWriter
+
+        with TableWriter(path, fmt) as writer:
+            for chunk in self.iter_scaffold(where, params):
+                writer.write(chunk)
+        return writer.rows
+
+    def _rekey(self, table, key_column, link_column, rows, key_fn):
+        """
+        Recompute keys; rows that end up on the same key are merged into one.
+
+        All new keys are computed first, so chains (A: K1 -> K2 while B:
+        K2 -> K3) resolve against the final key set, not against keys a row
+        is about to give up. The row already holding a final key keeps it,
+        otherwise the oldest row of the group does.
+        """
+        current, groups = {}, {}
+        for row in rows:
+            old_key = row[key_column]
+            current[row["id"]] = old_key
+            groups.setdefault(key_fn(row) or old_key, []).append(row["id"])
+        moves, merged = [], 0
+        for final_key, ids in groups.items():
+            keeper = next((i for i in ids if current[i] == final_key), min(ids))
+            for row_id in ids:
+                if row_id == keeper:
+                    continue
+                for statement in MERGE_STATEMENTS[table]:
+                    self.conn.execute(statement, (keeper, row_id))
+                self.conn.execute(f"DELETE FROM job_contacts WHERE {link_column} = ?", (row_id,))
+                self.conn.execute(f"DELETE FROM {table} WHERE id = ?", (row_id,))
+                merged += 1
+            if current[keeper] != final_key:
+                moves.append((final_key, keeper))
+        # Through placeholders, so a key is never taken twice in the middle of a chain
+        self.conn.executemany(f"UPDATE {table} SET {key_column} = '~rekey:' || id WHERE id = ?",
+                              ((row_id,) for _, row_id in moves))
+        self.conn.executemany(f"UPDATE {table} SET {key_column} = ? WHERE id = ?", moves)
+        return len(moves), merged
+
+    def rekey(self):
+        """
+        Recompute job and contact keys after canonical_url rules change.
+
+        A row whose new key already belongs to another row is merged into
+        it: stored values win, empty ones are filled from the merged row,
+        and its contact links move over. Returns {table: (rekeyed, merged)}.
+        """
+        with self.conn:
+            jobs = map(dict, self.conn.execute(
+                "SELECT id, canonical_url, original_url, company, job_title FROM jobs ORDER BY id"
+            ).fetchall())
+            contacts = self.conn.execute(
+                "SELECT id, contact_key, linkedin, name, company FROM contacts ORDER BY id"
+            ).fetchall()
+            return {
+                "jobs": self._rekey("jobs", "canonical_url", "job_id", jobs, job_key),
+                "contacts": self._rekey(
+                    "contacts", "contact_key", "contact_id", contacts,
+                    lambda c: contact_key({"poster_linkedin": c["linkedin"], "poster_name": c["name"],
+                                           "company": c["company"]}),
+                ),
+            }
+
+    def stats(self):
+        counts = {
+            table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("jobs", "contacts", "job_contacts")
+        }
+        for col in STATUS_COLUMNS:
+            counts[f"{col}_pending"] = self.conn.execute(
+                f"SELECT COUNT(*) FROM jobs WHERE {col} IS NULL"
+            ).fetchone()[0]
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query and export the pipeline job store")
+    parser.add_argument("--db", default=STORE_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="row counts and pending enrichment")
+    pending = sub.add_parser("pending", help="jobs whose status column is empty")
+    pending.add_argument("status_column", choices=STATUS_COLUMNS)
+    pending.add_argument("--limit", type=int, default=20)
+    export = sub.add_parser("export", help="export jobs as a scaffold table")
+    export.add_argument("path")
+    export.add_argument("--pending", choices=STATUS_COLUMNS, help="only jobs with this status empty")
+    sub.add_parser("rekey", help="recompute job/contact keys after URL normalization changes")
+    args = parser.parse_args()
+
+    with JobStore(args.db) as store:
+        if args.command == "stats":
+            for name, count in store.stats().items():
+                print(f"{name:>28}: {count}")
+        elif args.command == "pending":
+            for row in store.pending(args.status_column, args.limit):
+                print(f"{row['company']} | {row['job_title']} | {row['original_url']}")
+        elif args.command == "rekey":
+            for table, (changed, merged) in store.rekey().items():
+                print(f"🔑 {table}: {changed} rekeyed, {merged} merged into existing rows")
+        else:
+            where = f"j.{args.pending} IS NULL" if args.pending else ""
+            rows = store.export_scaffold(args.path, where)
+            print(f"✅ Exported {rows} scaffold rows to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Poster-to-job matching.
+
+Ranks candidate contacts (people with a title at a company) for every job
+in a scaffold table and fills poster_* columns from the best match, e.g.
+"Engineering Lead – AIGC Infra, Monetization Tech" for "Software Engineer
+– AIGC Infrastructure, TikTok Monetization GenAI".
+
+Titles become TF-IDF vectors over words (abbreviations expanded) and
+word-boundary character trigrams, so "Infra" still meets
+"Infrastructure". Contacts are indexed by (company, term): a job only
+meets contacts at the same company that share at least one term, and
+cosine scores are accumulated for those pairs with array operations, in
+bounded chunks. Nothing compares all pairs, and titles are tokenized once
+per distinct value.
+
+Contacts come from a CSV/Parquet/Arrow table (poster_name or name,
+poster_title or title, company, poster_linkedin, poster_email,
+poster_type) or from the job store's contacts table.
+
+    python scripts/matching.py output/rss_jobs_scaffold.csv --contacts data/contacts.csv
+    python scripts/matching.py output/rss_jobs_scaffold.csv --contacts output/pipeline.db --top-k 3 \\
+        --candidates output/match_candidates.csv
+"""
+
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dedup import normalize_company, normalize_title
+from job_store import CONTACT_COLUMNS
+from scaffold_schema import canonical_name
+from storage import read_table, write_table
+
+MIN_SCORE = 0.2
+TOP_K = 3
+MAX_PAIRS = 5_000_000       # candidate pairs scored per chunk
+STOPWORDS = {"a", "an", "and", "at", "for", "in", "of", "on", "the", "to", "with", "remote"}
+CONTACT_ALIASES = {"name": "poster_name", "type": "poster_type", **{k: v for k, v in CONTACT_COLUMNS.items()}}
+CONTACT_FIELDS = ["poster_name", "poster_linkedin", "poster_title", "poster_type", "poster_email"]
+
+# First matching keyword decides the poster_type of a contact without one
+POSTER_TYPE_KEYWORDS = (
+    ("recruiter", ("recruiter", "recruiting", "talent", "sourcer")),
+    ("founder", ("founder", "cofounder")),
+    ("executive", ("ceo", "cto", "coo", "chief", "vp", "vice president", "president", "director")),
+    ("hiring_manager", ("manager", "head")),
+    ("team_lead", ("lead", "tech lead", "principal", "staff")),
+    ("engineer", ("engineer", "developer", "scientist", "researcher")),
+)
+
+
+def title_words(title):
+    return [w for w in normalize_title(title).split() if w not in STOPWORDS]
+
+
+def title_terms(title):
+    """Words plus word-boundary character trigrams of the longer words"""
+    words = title_words(title)
+    terms = list(words)
+    for word in words:
+        if len(word) > 3:
+            padded = f"#{word}#"
+            terms.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return terms
+
+
+def infer_poster_type(title):
+    padded = f" {normalize_title(title)} "
+    for poster_type, keywords in POSTER_TYPE_KEYWORDS:
+        if any(f" {keyword} " in padded for keyword in keywords):
+            return poster_type
+    return "unknown"
+
+
+def load_contacts(path):
+    """Contacts as a DataFrame with scaffold poster_* column names plus company"""
+    path = Path(path)
+    if path.suffix in (".db", ".sqlite", ".sqlite3"):
+        with sqlite3.connect(path) as conn:
+            df = pd.read_sql_query("SELECT * FROM contacts", conn)
+    else:
+        df = read_table(path)
+    df = df.rename(columns=lambda c: CONTACT_ALIASES.get(c, canonical_name(c)))
+    missing = {"poster_title", "company"} - set(df.columns)
+    if missing:
+        raise ValueError(f"Contacts table {path} is missing {sorted(missing)}")
+    for col in CONTACT_FIELDS:
+        if col not in df.columns:
+            df[col] = None
+    return df.reset_index(drop=True)
+
+
+class _Docs:
+    """Distinct (company, title) documents of a table and the rows behind them"""
+
+    def __init__(self, company_ids, title_ids):
+        pairs = company_ids.astype(np.int64) << 32 | title_ids.astype(np.int64)
+        self.row_doc, uniques = pd.factorize(pairs, sort=False)
+        self.company = (uniques >> 32).astype(np.int64)
+        self.title = (uniques & 0xFFFFFFFF).astype(np.int64)
+
+
+class MatchIndex:
+    def __init__(self, contacts, any_company=False, min_score=MIN_SCORE, max_pairs=MAX_PAIRS):
+        self.contacts = contacts
+        self.any_company = any_company
+        self.min_score = min_score
+        self.max_pairs = max_pairs
+
+    def _vectorize(self, titles):
+        """TF-IDF rows (CSR arrays) for each distinct title; idf over all rows"""
+        codes, uniques = pd.factorize(titles, sort=False)
+        vocab, indptr, terms = {}, [0], []
+        for title in uniques:
+            terms.extend(vocab.setdefault(t, len(vocab)) for t in title_terms(title))
+            indptr.append(len(terms))
+        indptr = np.asarray(indptr, dtype=np.int64)
+        terms = np.asarray(terms, dtype=np.int64)
+        owner = np.repeat(np.arange(len(uniques)), np.diff(indptr))
+        # Collapse repeated terms in a title into term frequencies
+        keyed, tf = np.unique(owner * max(len(vocab), 1) + terms, return_counts=True)
+        owner, terms = keyed // max(len(vocab), 1), keyed % max(len(vocab), 1)
+        indptr = np.searchsorted(owner, np.arange(len(uniques) + 1))
+        rows_per_title = np.bincount(codes, minlength=len(uniques))
+        df = np.bincount(terms, weights=rows_per_title[owner], minlength=len(vocab))
+        weights = tf * (np.log((1 + len(titles)) / (1 + df[terms])) + 1)
+        weights /= np.sqrt(np.bincount(owner, weights=weights ** 2, minlength=len(uniques)))[owner]
+        return codes, uniques, indptr, terms, weights, len(vocab)
+
+    def match(self, jobs, top_k=TOP_K):
+        """
+        Ranked candidates: DataFrame(job, contact, score, rank) with job and
+        contact as positions in jobs / self.contacts, best first per job
+        """
+        contacts = self.contacts
+        titles = pd.concat([jobs["job_title"], contacts["poster_title"]], ignore_index=True)
+        titles = titles.astype(object).where(titles.notna(), "").to_numpy()
+        codes, self._titles, indptr, terms, weights, vocab_size = self._vectorize(titles)
+        companies = pd.concat([jobs["company"], contacts["company"]], ignore_index=True).astype(object)
+        company_codes, company_uniques = pd.factorize(companies.where(companies.notna(), ""), sort=False)
+        normalized = pd.Series([normalize_company(c) for c in company_uniques], dtype=object)
+        company_ids = pd.factorize(normalized)[0][company_codes] if len(company_uniques) else company_codes
+        if self.any_company:
+            company_ids = np.zeros_like(company_ids)
+
+        n_jobs = len(jobs)
+        job_docs = _Docs(company_ids[:n_jobs], codes[:n_jobs])
+        contact_docs = _Docs(company_ids[n_jobs:], codes[n_jobs:])
+
+        # Inverted index over contact documents, keyed by (company, term)
+        c_lengths = indptr[contact_docs.title + 1] - indptr[contact_docs.title]
+        c_doc = np.repeat(np.arange(len(contact_docs.title)), c_lengths)
+        c_pos = _ranges(indptr[contact_docs.title], c_lengths)
+        c_key = contact_docs.company[c_doc] * vocab_size + terms[c_pos]
+        order = np.argsort(c_key, kind="stable")
+        c_key, c_doc, c_weight = c_key[order], c_doc[order], weights[c_pos][order]
+
+        j_lengths = indptr[job_docs.title + 1] - indptr[job_docs.title]
+        j_doc = np.repeat(np.arange(len(job_docs.title)), j_lengths)
+        j_pos = _ranges(indptr[job_docs.title], j_lengths)
+        j_key = job_docs.company[j_doc] * vocab_size + terms[j_pos]
+        lo = np.searchsorted(c_key, j_key, side="left")
+        hits = np.searchsorted(c_key, j_key, side="right") - lo
+        j_weight = weights[j_pos]
+
+        # Chunk on job-document boundaries so each chunk holds every pair of its documents
+        doc_pairs = np.bincount(j_doc, weights=hits, minlength=len(job_docs.title))
+        doc_end = np.cumsum(doc_pairs)
+        nz_end = np.searchsorted(j_doc, np.arange(len(job_docs.title)), side="right")
+        results = []
+        start_doc = 0
+        while start_doc < len(job_docs.title):
+            base = doc_end[start_doc - 1] if start_doc else 0
+            stop_doc = max(start_doc + 1, int(np.searchsorted(doc_end, base + self.max_pairs, side="right")))
+            stop_doc = min(stop_doc, len(job_docs.title))
+            a = nz_end[start_doc - 1] if start_doc else 0
+            b = nz_end[stop_doc - 1]
+            results.append(self._score_chunk(j_doc[a:b], lo[a:b], hits[a:b], j_weight[a:b],
+                                             c_doc, c_weight, len(contact_docs.title), top_k))
+            start_doc = stop_doc
+
+        cand = pd.concat(results, ignore_index=True) if results else pd.DataFrame(
+            {"job_doc": [], "contact_doc": [], "score": [], "rank": []})
+        # Back from documents to rows: every job row of a document shares its candidates,
+        # each contact document stands for all of its contact rows
+        job_rows = pd.DataFrame({"job": np.arange(n_jobs), "job_doc": job_docs.row_doc})
+        contact_rows = pd.DataFrame({"contact": np.arange(len(contacts)), "contact_doc": contact_docs.row_doc})
+        ranked = (job_rows.merge(cand, on="job_doc").merge(contact_rows, on="contact_doc")
+                  .sort_values(["job", "rank", "contact"], kind="stable"))
+        ranked["rank"] = ranked.groupby("job", sort=False).cumcount()
+        ranked = ranked[ranked["rank"] < top_k]
+        self._title_codes = codes
+        return ranked[["job", "contact", "score", "rank"]].reset_index(drop=True)
+
+    def _score_chunk(self, j_doc, lo, hits, j_weight, c_doc, c_weight, n_contact_docs, top_k):
+        pos = _ranges(lo, hits)
+        pair = np.repeat(j_doc, hits) * n_contact_docs + c_doc[pos]
+        products = np.repeat(j_weight, hits) * c_weight[pos]
+        pairs, inverse = np.unique(pair, return_inverse=True)
+        scores = np.bincount(inverse, weights=products, minlength=len(pairs))
+        keep = scores >= self.min_score
+        pairs, scores = pairs[keep], scores[keep]
+        job_doc, contact_doc = pairs // n_contact_docs, pairs % n_contact_docs
+        order = np.lexsort((-scores, job_doc))
+        job_doc, contact_doc, scores = job_doc[order], contact_doc[order], scores[order]
+        first = np.searchsorted(job_doc, job_doc, side="left")
+        rank = np.arange(len(job_doc)) - first
+        keep = rank < top_k
+        return pd.DataFrame({"job_doc": job_doc[keep], "contact_doc": contact_doc[keep],
+                             "score": scores[keep], "rank": rank[keep]})
+
+    def shared_words(self, job_title_code, contact_title_code):
+        words = set(title_words(self._titles[job_title_code]))
+        return [w for w in title_words(self._titles[contact_title_code]) if w in words]
+
+
+def _ranges(starts, lengths):
+    """Concatenated np.arange(start, start + length) for each pair, without a loop"""
+    lengths = np.asarray(lengths, dtype=np.int64)
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(np.asarray(starts, dtype=np.int64), lengths) + np.arange(total) - offsets
+
+
+def fill_scaffold(jobs, contacts, ranked, index, overwrite=False):
+    """Copy the best contact into each job's poster_* columns; returns (frame, filled rows)"""
+    best = ranked[ranked["rank"] == 0]
+    target = jobs["poster_title"] if "poster_title" in jobs.columns else pd.Series(index=jobs.index, dtype=object)
+    empty = (target.isna() | (target.astype("string").str.strip() == "")).to_numpy(dtype=bool)
+    if not overwrite:
+        best = best[empty[best["job"].to_numpy()]]
+    job_pos, contact_pos = best["job"].to_numpy(), best["contact"].to_numpy()
+
+    out = jobs.copy()
+    for col in CONTACT_FIELDS + ["reason", "contact_source"]:
+        if col not in out.columns:
+            out[col] = pd.Series(pd.NA, index=out.index, dtype="string")
+        elif isinstance(out[col].dtype, pd.CategoricalDtype):
+            out[col] = out[col].astype("string")
+    picked = contacts.iloc[contact_pos]
+    for col in CONTACT_FIELDS:
+        values = picked[col].astype(object).to_numpy()
+        if col == "poster_type":
+            titles = picked["poster_title"].astype(object).to_numpy()
+            values = np.array([v if isinstance(v, str) and v else infer_poster_type(t) for v, t in zip(values, titles)],
+                              dtype=object)
+        out.iloc[job_pos, out.columns.get_loc(col)] = values
+
+    n_jobs = len(jobs)
+    reasons = {}
+    job_codes = index._title_codes[:n_jobs][job_pos]
+    contact_codes = index._title_codes[n_jobs:][contact_pos]
+    column = []
+    for j, c, score in zip(job_codes, contact_codes, best["score"].to_numpy()):
+        if (j, c) not in reasons:
+            reasons[(j, c)] = ",".join(index.shared_words(j, c)[:4])
+        column.append(f"match|cos={score:.2f}|{reasons[(j, c)]}")
+    out.iloc[job_pos, out.columns.get_loc("reason")] = np.array(column, dtype=object)
+    out.iloc[job_pos, out.columns.get_loc("contact_source")] = "title_match"
+    return out, len(job_pos)
+
+
+def match_file(jobs_path, contacts_path, output_path, top_k=TOP_K, min_score=MIN_SCORE, any_company=False,
+               overwrite=False, candidates_path=None):
+    """Match a scaffold table against contacts and write the filled table; returns a stats dict"""
+    started = time.perf_counter()
+    jobs = read_table(jobs_path)
+    contacts = load_contacts(contacts_path)
+    index = MatchIndex(contacts, any_company=any_company, min_score=min_score)
+    ranked = index.match(jobs, top_k)
+    matched_at = time.perf_counter()
+    filled, count = fill_scaffold(jobs, contacts, ranked, index, overwrite)
+    write_table(filled, output_path)
+    if candidates_path:
+        view = ranked.assign(
+            job_title=jobs["job_title"].to_numpy()[ranked["job"]],
+            company=jobs["company"].to_numpy()[ranked["job"]],
+            original_url=jobs["original_url"].to_numpy()[ranked["job"]],
+            poster_name=contacts["poster_name"].to_numpy()[ranked["contact"]],
+            poster_title=contacts["poster_title"].to_numpy()[ranked["contact"]],
+        )
+        write_table(view.drop(columns=["job", "contact"]), candidates_path)
+    return {
+        "jobs": len(jobs),
+        "contacts": len(contacts),
+        "candidates": len(ranked),
+        "filled": count,
+        "match_seconds": matched_at - started,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank contacts for each job by title similarity and fill poster_*")
+    parser.add_argument("jobs", help="scaffold or job table (.csv, .parquet or .arrow)")
+    parser.add_argument("--contacts", required=True, help="contacts table, or the job store (.db/.sqlite)")
+    parser.add_argument("-o", "--output", help="filled scaffold (default: <jobs>_matched)")
+    parser.add_argument("--candidates", help="also write the top-k candidates per job here")
+    parser.add_argument("--top-k", type=int, default=TOP_K)
+    parser.add_argument("--min-score", type=float, default=MIN_SCORE, help="minimum cosine similarity")
+    parser.add_argument("--any-company", action="store_true", help="match contacts across companies")
+    parser.add_argument("--overwrite", action="store_true", help="replace poster_* already filled in")
+    args = parser.parse_args()
+
+    jobs_path = Path(args.jobs)
+    output = Path(args.output or jobs_path.with_name(f"{jobs_path.stem}_matched{jobs_path.suffix}"))
+    stats = match_file(jobs_path, args.contacts, output, args.top_k, args.min_score, args.any_company,
+                       args.overwrite, args.candidates)
+    print(f"🔗 Ranked {stats['contacts']} contacts for {stats['jobs']} jobs: {stats['candidates']} candidates"
+          f" in {stats['match_seconds']:.2f}s")
+    print(f"✅ Filled {stats['filled']} jobs in {output} ({stats['seconds']:.2f}s total)")
+
+
+if __name__ == "__main__":
+    main()
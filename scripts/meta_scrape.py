@@ -0,0 +1,598 @@
+#!/usr/bin/env python3
+"""
+Job page metadata scraper.
+
+Fetches each job's original_url and pulls out the schema.org JobPosting
+JSON-LD, the OpenGraph tags and hiring-team hints (hiringManager and
+applicationContact in the JSON-LD, LinkedIn profile links on the page).
+Pages go through FetchEngine: one pooled session, a thread pool, at most
+per_host requests in flight to a host, an optional minimum interval
+between them (raised to the host's robots.txt Crawl-delay), and pages
+robots.txt disallows are not fetched.
+
+Parsing is a handful of compiled regexes over the decoded page (meta,
+link, title and ld+json script tags), not a DOM build, so it costs well
+under a millisecond for a typical posting.
+
+Results go into a content-addressed cache (SQLite): parsed metadata is
+keyed by a hash of the page body, and each canonical URL points at the
+body it returned, so a URL is fetched once across runs and mirrored
+pages are parsed once. Transient failures (timeouts, 429, 5xx) are
+retried after a day; everything else is final. A transient failure is
+not written back, so the job stays pending until that retry.
+
+meta_scrape_status is written back as
+    success            a JobPosting was found
+    partial            OpenGraph tags only
+    fail:<reason>      no_metadata, not_html, robots, http_404, timeout, ...
+    skipped:no_url     the job has no URL to fetch
+Empty job_title/company/location/post_date are filled from the JobPosting,
+and a hiring-team hint becomes the poster (with poster_location when the
+person has an address or work location) when the job has none yet.
+
+    python scripts/meta_scrape.py --workers 32 --per-host 4 --limit 500
+    python scripts/meta_scrape.py --scaffold output/teal_jobs_scaffold.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import html
+import json
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import metrics
+from urls import canonical_url, clean_url
+
+CACHE_PATH = Path("output/meta_pages.sqlite")
+STORE_PATH = Path("output/pipeline.db")
+USER_AGENT = "job-pipeline-meta/1.0"
+DEFAULT_WORKERS = 16
+DEFAULT_PER_HOST = 4
+PAGE_TIMEOUT = 15
+RETRY_AFTER = 24 * 3600
+BATCH_SIZE = 200
+MAX_PROFILE_LINKS = 5
+TRANSIENT_REASONS = ("timeout", "connection", "error", "http_429", "http_5")
+
+_LD_JSON = re.compile(
+    r"<script\b[^>]*?\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>", re.I | re.S
+)
+_META_TAG = re.compile(r"<meta\b([^>]*)>", re.I)
+_LINK_TAG = re.compile(r"<link\b([^>]*)>", re.I)
+_TITLE_TAG = re.compile(r"<title\b[^>]*>(.*?)</title\s*>", re.I | re.S)
+_ATTR = re.compile(r"([\w:.-]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s\"'>]+))")
+_PROFILE_LINK = re.compile(
+    r"<a\b[^>]*?\bhref\s*=\s*[\"']?((?:https?:)?//(?:[a-z]{2,3}\.)?linkedin\.com/in/[^\"'\s>]+)[^>]*>(.*?)</a\s*>",
+    re.I | re.S,
+)
+_TAG = re.compile(r"<[^>]+>")
+_SPACE = re.compile(r"\s+")
+_CHARSET = re.compile(r"charset=[\"']?([\w-]+)", re.I)
+
+# JSON-LD properties that name a person on the hiring side, and the poster_type they imply
+PERSON_PROPERTIES = {
+    "hiringManager": "hiring_manager",
+    "recruiter": "recruiter",
+    "applicationContact": "recruiter",
+    "author": "unknown",
+}
+# Scaffold columns a JobPosting can fill when the job row has them empty
+POSTING_COLUMNS = {"job_title": "title", "company": "company", "location": "location", "post_date": "date_posted"}
+POSTER_COLUMNS = {
+    "poster_name": "name", "poster_linkedin": "linkedin", "poster_title": "title",
+    "poster_email": "email", "poster_phone": "phone", "poster_type": "poster_type",
+    "poster_location": "location",
+}
+
+
+def _text(value):
+    """Plain text of a JSON-LD or HTML value: tags stripped, entities decoded, spaces collapsed"""
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("@value") or ""
+    elif isinstance(value, list):
+        value = ", ".join(t for t in map(_text, value) if t)
+    text = str(value or "")
+    if "<" in text:
+        text = _TAG.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return _SPACE.sub(" ", text).strip()
+
+
+def _attrs(tag):
+    return {m[1].lower(): html.unescape(m[2] or m[3] or m[4]) for m in _ATTR.finditer(tag)}
+
+
+def _ld_nodes(data):
+    """Every object in a JSON-LD document, including @graph members"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _ld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _ld_nodes(data["@graph"])
+
+
+def _is_type(node, name):
+    kind = node.get("@type")
+    return kind == name or (isinstance(kind, list) and name in kind)
+
+
+def _first(value):
+    return value[0] if isinstance(value, list) and value else value
+
+
+def _address(place):
+    """"Locality, Region, Country" of a Place or PostalAddress, or its plain text"""
+    address = place.get("address") if isinstance(place, dict) else place
+    if isinstance(address, dict):
+        fields = (address.get(k) for k in ("addressLocality", "addressRegion", "addressCountry"))
+        return ", ".join(t for t in map(_text, fields) if t)
+    return _text(address)
+
+
+def _location(node):
+    places = node.get("jobLocation")
+    parts = []
+    for place in places if isinstance(places, list) else [places]:
+        text = _address(place)
+        if text and text not in parts:
+            parts.append(text)
+    if not parts and _text(node.get("jobLocationType")).upper() == "TELECOMMUTE":
+        parts.append("Remote")
+    return "; ".join(parts)
+
+
+def _salary(node):
+    salary = _first(node.get("baseSalary"))
+    if not isinstance(salary, dict):
+        return _text(salary)
+    value = salary.get("value")
+    if isinstance(value, dict):
+        low, high = value.get("minValue"), value.get("maxValue")
+        amount = f"{low}-{high}" if low and high else str(low or high or value.get("value") or "")
+        unit = _text(value.get("unitText"))
+    else:
+        amount, unit = str(value or ""), ""
+    return " ".join(t for t in (_text(salary.get("currency")), amount, unit) if t)
+
+
+def _person(node, poster_type, source):
+    if not isinstance(node, dict):
+        name = _text(node)
+        return {"name": name, "poster_type": poster_type, "source": source} if name else None
+    # workLocation/homeLocation are Places; a Person's own address is a PostalAddress
+    place = _first(node.get("workLocation") or node.get("homeLocation")) or {"address": node.get("address")}
+    links = [node.get("url"), *(node.get("sameAs") if isinstance(node.get("sameAs"), list) else [node.get("sameAs")])]
+    hint = {
+        "name": _text(node.get("name")),
+        "title": _text(node.get("jobTitle")),
+        "email": _text(node.get("email")).removeprefix("mailto:"),
+        "phone": _text(node.get("telephone")),
+        "linkedin": next((canonical_url(u) for u in links if isinstance(u, str) and "linkedin.com/in/" in u), ""),
+        "location": _address(place),
+        "poster_type": poster_type,
+        "source": source,
+    }
+    return hint if hint["name"] or hint["email"] or hint["linkedin"] else None
+
+
+def _job_posting(node):
+    org = _first(node.get("hiringOrganization"))
+    org_url = org.get("sameAs") or org.get("url") if isinstance(org, dict) else ""
+    return {
+        "title": _text(node.get("title")),
+        "company": _text(org),
+        "company_url": _text(_first(org_url)),
+        "date_posted": _text(node.get("datePosted"))[:10],
+        "valid_through": _text(node.get("validThrough"))[:10],
+        "employment_type": _text(node.get("employmentType")),
+        "location": _location(node),
+        "remote": _text(node.get("jobLocationType")).upper() == "TELECOMMUTE",
+        "salary": _salary(node),
+    }
+
+
+def parse_page(text):
+    """Metadata of one HTML page: {"job", "og", "title", "canonical", "hints", "ld_errors"}"""
+    meta = {"job": None, "og": {}, "title": "", "canonical": "", "hints": [], "ld_errors": 0}
+    hints = meta["hints"]
+    for block in _LD_JSON.findall(text):
+        block = block.strip().removeprefix("<!--").removesuffix("-->").strip()
+        try:
+            data = json.loads(block, strict=False)
+        except ValueError:
+            meta["ld_errors"] += 1
+            continue
+        for node in _ld_nodes(data):
+            if meta["job"] is None and _is_type(node, "JobPosting"):
+                meta["job"] = _job_posting(node)
+                for prop, poster_type in PERSON_PROPERTIES.items():
+                    for person in node.get(prop) if isinstance(node.get(prop), list) else [node.get(prop)]:
+                        hint = _person(person, poster_type, f"ld:{prop}") if person else None
+                        if hint:
+                            hints.append(hint)
+
+    for tag in _META_TAG.findall(text):
+        attrs = _attrs(tag)
+        key = attrs.get("property") or attrs.get("name") or ""
+        if key.startswith(("og:", "twitter:")) and "content" in attrs:
+            meta["og"].setdefault(key, _text(attrs["content"]))
+    for tag in _LINK_TAG.findall(text):
+        attrs = _attrs(tag)
+        if attrs.get("rel", "").lower() == "canonical" and attrs.get("href"):
+            meta["canonical"] = clean_url(attrs["href"])
+            break
+    title = _TITLE_TAG.search(text)
+    meta["title"] = _text(title.group(1)) if title else ""
+
+    # "Meet the hiring team" style cards: a LinkedIn profile link whose text is the person's name
+    seen = {hint["linkedin"] for hint in hints if hint.get("linkedin")}
+    for href, label in _PROFILE_LINK.findall(text):
+        profile = canonical_url(html.unescape(href))
+        if profile in seen:
+            continue
+        seen.add(profile)
+        hints.append({"name": _text(label), "linkedin": profile, "poster_type": "unknown", "source": "profile_link"})
+        if len(seen) >= MAX_PROFILE_LINKS:
+            break
+    return meta
+
+
+def page_status(meta):
+    if meta["job"]:
+        return "success"
+    if meta["og"].get("og:title"):
+        return "partial"
+    return "fail:no_metadata"
+
+
+def decode(body, content_type=""):
+    match = _CHARSET.search(content_type or "")
+    try:
+        return body.decode(match.group(1) if match else "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _transient(status):
+    reason = status.partition(":")[2]
+    return reason.startswith(TRANSIENT_REASONS)
+
+
+class PageCache:
+    """Content-addressed page metadata: url -> body digest -> parsed metadata"""
+
+    def __init__(self, path=CACHE_PATH, retry_after=RETRY_AFTER):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.retry_after = retry_after
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " url TEXT PRIMARY KEY, digest BLOB, status TEXT NOT NULL, fetched_at REAL NOT NULL) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS documents (digest BLOB PRIMARY KEY, meta TEXT NOT NULL) WITHOUT ROWID;"
+        )
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "parsed": 0, "reused": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def commit(self):
+        with self._lock:
+            self.conn.commit()
+
+    def get(self, url):
+        """(status, meta) recorded for url, or None if it has to be fetched (again)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT p.status, p.fetched_at, d.meta FROM pages p LEFT JOIN documents d ON d.digest = p.digest"
+                " WHERE p.url = ?", (url,)
+            ).fetchone()
+            hit = row is not None and not (_transient(row[0]) and time.time() - row[1] >= self.retry_after)
+            self.stats["hits" if hit else "misses"] += 1
+        if not hit:
+            metrics.inc("cache_lookups_total", cache="meta_pages", result="miss")
+            return None
+        metrics.inc("cache_lookups_total", cache="meta_pages", result="hit")
+        return row[0], json.loads(row[2]) if row[2] else None
+
+    def document(self, body, parse):
+        """(digest, meta) for a page body, parsing it only if no identical body was seen before"""
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        with self._lock:
+            row = self.conn.execute("SELECT meta FROM documents WHERE digest = ?", (digest,)).fetchone()
+            if row is not None:
+                self.stats["reused"] += 1
+        if row is not None:
+            return digest, json.loads(row[0])
+        meta = parse()
+        with self._lock:
+            self.stats["parsed"] += 1
+            self.conn.execute("INSERT OR IGNORE INTO documents VALUES (?, ?)", (digest, json.dumps(meta)))
+        return digest, meta
+
+    def put(self, url, status, digest=None):
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)", (url, digest, status, time.time()))
+
+    def size(self):
+        with self._lock:
+            pages, documents = (self.conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0]
+                                for t in ("pages", "documents"))
+        return pages, documents
+
+
+class MetaScraper:
+    def __init__(self, cache, workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST, host_interval=0.0,
+                 timeout=PAGE_TIMEOUT, retries=1, robots=True, user_agent=USER_AGENT, engine=None):
+        from fetch_engine import FetchEngine
+
+        self.cache = cache
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.user_agent = user_agent
+        self.engine = engine or FetchEngine(max_workers=workers, per_host=per_host, host_interval=host_interval)
+        self.engine.session.headers.update({
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.5",
+        })
+        self.robots = {} if robots else None
+        self._robots_locks = {}
+        self._lock = threading.Lock()
+        self.stats = {"done": 0, "fetched": 0, "cached": 0, "statuses": {}, "elapsed": 0.0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.engine.close()
+
+    def _robots_for(self, url):
+        """Parsed robots.txt of url's site, fetched once per run"""
+        from fetch_engine import FetchRequest
+
+        parts = urlsplit(url)
+        site = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            lock = self._robots_locks.setdefault(site, threading.Lock())
+        with lock:
+            if site not in self.robots:
+                rules = RobotFileParser(site + "/robots.txt")
+                result = self.engine.fetch(FetchRequest("robots", site + "/robots.txt", timeout=self.timeout, retries=0))
+                if result.status in (401, 403):
+                    rules.disallow_all = True
+                elif result.ok:
+                    rules.parse(decode(result.body).splitlines())
+                else:
+                    rules.allow_all = True
+                delay = rules.crawl_delay(self.user_agent)
+                if delay:
+                    self.engine.set_host_interval(parts.netloc, max(float(delay), self.engine.host_interval))
+                self.robots[site] = rules
+            return self.robots[site]
+
+    def _fetch(self, url):
+        """(status, digest, meta) of a page fetched from the web"""
+        from fetch_engine import FetchRequest
+
+        if self.robots is not None and not self._robots_for(url).can_fetch(self.user_agent, url):
+            return "fail:robots", None, None
+        result = self.engine.fetch(FetchRequest("meta", url, timeout=self.timeout, retries=self.retries))
+        if not result.ok:
+            return f"fail:{result.reason or 'error'}", None, None
+        content_type = next((v for k, v in result.headers.items() if k.lower() == "content-type"), "")
+        if content_type and "html" not in content_type.lower():
+            return "fail:not_html", None, None
+        digest, meta = self.cache.document(result.body, lambda: parse_page(decode(result.body, content_type)))
+        return page_status(meta), digest, meta
+
+    def scrape(self, url):
+        """(status, meta) for one job page, from the cache when the URL was fetched before"""
+        url = (url or "").strip()
+        if not url.startswith(("http://", "https://")):
+            url = clean_url(url) if "." in url.partition("/")[0] else ""
+        if not url:
+            return "skipped:no_url", None
+        key = canonical_url(url)
+        cached = self.cache.get(key)
+        if cached is not None:
+            with self._lock:
+                self.stats["cached"] += 1
+            return cached
+        status, digest, meta = self._fetch(url)
+        self.cache.put(key, status, digest)
+        with self._lock:
+            self.stats["fetched"] += 1
+        return status, meta
+
+    def update_for(self, job, status, meta):
+        """Write-back row for a job: the status, plus empty posting fields and a poster filled from meta"""
+        # A transient failure leaves the status empty; the page cache holds off the retry
+        update = {"original_url": job["original_url"], "meta_scrape_status": "" if _transient(status) else status}
+        if not meta:
+            return update
+        posting = meta["job"] or {}
+        for column, field in POSTING_COLUMNS.items():
+            if posting.get(field) and not job.get(column):
+                update[column] = posting[field]
+        has_poster = job.get("primary_contact_id") or job.get("poster_name") or job.get("poster_linkedin")
+        hint = next((h for h in meta["hints"] if h.get("name")), None)
+        if hint and not has_poster:
+            update.update({column: hint[field] for column, field in POSTER_COLUMNS.items() if hint.get(field)})
+            update["contact_source"] = "meta_scrape"
+            update["reason"] = f"Listed on the job page ({hint['source']})."
+        return update
+
+    def _process(self, job):
+        return (job, *self.scrape(job.get("original_url")))
+
+    def _record(self, done):
+        status = done[1]
+        self.stats["done"] += 1
+        self.stats["statuses"][status] = self.stats["statuses"].get(status, 0) + 1
+        metrics.inc("meta_scrape_total", status=status.partition(":")[0], reason=status.partition(":")[2])
+        return done
+
+    def run(self, jobs, limit=None):
+        """Scrape jobs (dicts with original_url) concurrently, yielding (job, status, meta) as they finish"""
+        started = time.perf_counter()
+        in_flight, submitted = set(), 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for job in jobs:
+                    if limit is not None and submitted >= limit:
+                        break
+                    in_flight.add(pool.submit(self._process, job))
+                    submitted += 1
+                    if len(in_flight) >= self.workers * 2:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield self._record(future.result())
+                for future in in_flight:
+                    yield self._record(future.result())
+        finally:
+            self.stats["elapsed"] += time.perf_counter() - started
+
+    def report(self):
+        s = self.stats
+        rate = s["done"] / s["elapsed"] if s["elapsed"] else 0
+        statuses = ", ".join(f"{status} {count}" for status, count in sorted(s["statuses"].items()))
+        print(f"🏷️  Meta scrape: {s['done']} jobs ({s['fetched']} fetched, {s['cached']} cached)"
+              f" in {s['elapsed']:.2f}s ({rate:.1f} jobs/s)")
+        if statuses:
+            print(f"   {statuses}")
+
+
+def scrape_store(store, scraper, limit=None, batch_size=BATCH_SIZE):
+    """Scrape the store's jobs with meta_scrape_status unset and write the results back"""
+    statuses, filled = [], []
+
+    def flush():
+        # Statuses go by the stored key; only rows with posting/poster fields go through upsert
+        store.upsert_rows(filled)
+        store.update_status("meta_scrape_status", statuses)
+        scraper.cache.commit()
+        statuses.clear()
+        filled.clear()
+
+    jobs = (dict(row) for row in store.iter_pending("meta_scrape_status"))
+    for job, status, meta in scraper.run(jobs, limit):
+        update = scraper.update_for(job, status, meta)
+        if update["meta_scrape_status"]:
+            statuses.append((job["canonical_url"], status))
+        if len(update) > 2:
+            filled.append(update)
+        if len(statuses) >= batch_size or len(filled) >= batch_size:
+            flush()
+    flush()
+    return scraper.stats
+
+
+def scrape_csv(path, scraper, output=None, limit=None):
+    """Scrape the rows of a scaffold CSV with meta_scrape_status empty; rewrites it (or writes output)"""
+    from scaffold_schema import canonical_name
+
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames or [])
+        rows = list(reader)
+    columns = {canonical_name(name): name for name in fieldnames}
+    # poster_location is optional in scaffolds; add it so a hint's location is not dropped
+    for name in ("meta_scrape_status", "poster_location"):
+        if name not in columns:
+            fieldnames.append(name)
+            columns[name] = name
+    url_column = columns.get("original_url", "original_url")
+
+    def as_job(row):
+        return {name: row.get(column) for name, column in columns.items()}
+
+    # One scrape per distinct posting; each duplicate row gets its own write-back
+    groups = {}
+    for row in rows:
+        if not row.get(columns["meta_scrape_status"]):
+            groups.setdefault(canonical_url(row.get(url_column) or "") or id(row), []).append(row)
+    jobs = {}
+    for group in groups.values():
+        job = as_job(group[0])
+        jobs[id(job)] = (job, group)
+    for job, status, meta in scraper.run((job for job, _ in jobs.values()), limit):
+        for row in jobs[id(job)][1]:
+            for name, value in scraper.update_for(as_job(row), status, meta).items():
+                if name in columns and name != "original_url":
+                    row[columns[name]] = value
+    scraper.cache.commit()
+
+    output = Path(output or path)
+    tmp_path = output.with_suffix(output.suffix + ".tmp")
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    tmp_path.replace(output)
+    return scraper.stats
+
+
+def meta_scrape(db=STORE_PATH, scaffold=None, output=None, cache_path=CACHE_PATH, limit=None, **options):
+    """Scrape the job store (or a scaffold CSV) and print a summary; options go to MetaScraper"""
+    with PageCache(cache_path) as cache, MetaScraper(cache, **options) as scraper:
+        if scaffold:
+            scrape_csv(scaffold, scraper, output, limit)
+            print(f"✅ Updated {output or scaffold}")
+        else:
+            from job_store import JobStore
+
+            with JobStore(db) as store:
+                scrape_store(store, scraper, limit)
+        scraper.report()
+        pages, documents = cache.size()
+        print(f"🗃️  Page cache: {pages} URLs, {documents} distinct pages"
+              f" ({cache.stats['parsed']} parsed, {cache.stats['reused']} reused this run)")
+        return scraper.stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape job pages for JSON-LD/OpenGraph metadata and hiring hints")
+    parser.add_argument("--scaffold", help="scrape this scaffold CSV instead of the job store")
+    parser.add_argument("-o", "--output", help="with --scaffold: write here instead of in place")
+    parser.add_argument("--db", default=STORE_PATH, help="job store to scrape")
+    parser.add_argument("--cache", default=CACHE_PATH, help="page metadata cache (SQLite)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help="requests in flight per host")
+    parser.add_argument("--host-interval", type=float, default=0.0, help="minimum seconds between requests to one host")
+    parser.add_argument("--timeout", type=float, default=PAGE_TIMEOUT)
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--ignore-robots", action="store_true", help="do not fetch or obey robots.txt")
+    parser.add_argument("--user-agent", default=USER_AGENT)
+    args = parser.parse_args()
+    meta_scrape(args.db, args.scaffold, args.output, args.cache, args.limit, workers=args.workers,
+                per_host=args.per_host, host_interval=args.host_interval, timeout=args.timeout,
+                robots=not args.ignore_robots, user_agent=args.user_agent)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Lightweight instrumentation shared by the pipeline scripts.
+
+Modules record spans (timed blocks), counters, gauges and histograms
+through the functions below. Nothing is recorded unless metrics are
+enabled, and every call returns after a single flag check when they are
+not, so instrumented code can stay in hot paths.
+
+Enable with metrics.enable(...) or from the environment, which works for
+any script without code changes:
+
+    PIPELINE_METRICS=output/metrics.jsonl   # JSON event log ("-" for stderr)
+    PIPELINE_METRICS_PROM=output/metrics.prom   # Prometheus text dump at exit (.om for OpenMetrics)
+
+Span events are written to the JSON log as they finish; counters and
+histograms are summarised in the log and dumped to the Prometheus file
+when the process exits (or when dump() is called).
+"""
+
+import atexit
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+NAMESPACE = "pipeline"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+enabled = False
+_lock = threading.Lock()
+_log = None
+_prom_path = None
+_counters = {}
+_gauges = {}
+_histograms = {}
+
+
+def _key(name, labels):
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def inc(name, value=1, **labels):
+    """Add value to a counter (names end in _total)"""
+    if not enabled or not value:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def set_gauge(name, value, **labels):
+    if not enabled:
+        return
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+
+def observe(name, value, buckets=LATENCY_BUCKETS, **labels):
+    """Record one observation in a histogram"""
+    if not enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = {"buckets": buckets, "counts": [0] * len(buckets), "sum": 0.0, "count": 0}
+        for i, bound in enumerate(hist["buckets"]):
+            if value <= bound:
+                hist["counts"][i] += 1
+                break
+        hist["sum"] += value
+        hist["count"] += 1
+
+
+def event(name, **fields):
+    """Write one structured event to the JSON log"""
+    if not enabled or _log is None:
+        return
+    line = json.dumps({"ts": round(time.time(), 3), "event": name, **fields}, default=str)
+    with _lock:
+        _log.write(line + "\n")
+        _log.flush()
+
+
+class _Span:
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+        self.fields = {}
+
+    def set(self, **fields):
+        """Attach fields (e.g. row counts) to the span's log event"""
+        self.fields.update(fields)
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        observe(f"{self.name}_duration_seconds", elapsed, **self.labels)
+        status = "ok" if exc_type is None else "error"
+        if exc_type is not None:
+            inc(f"{self.name}_errors_total", **self.labels)
+        event("span", span=self.name, seconds=round(elapsed, 6), status=status, **self.labels, **self.fields)
+        return False
+
+
+class _NoopSpan:
+    def set(self, **fields):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(name, **labels):
+    """Time a block: records <name>_duration_seconds and logs a span event"""
+    if not enabled:
+        return _NOOP_SPAN
+    return _Span(name, labels)
+
+
+def snapshot():
+    """Current counters, gauges and histograms as plain dicts"""
+    def label_str(labels):
+        return ",".join(f"{k}={v}" for k, v in labels)
+
+    with _lock:
+        return {
+            "counters": {f"{n}{{{label_str(l)}}}": v for (n, l), v in sorted(_counters.items())},
+            "gauges": {f"{n}{{{label_str(l)}}}": v for (n, l), v in sorted(_gauges.items())},
+            "histograms": {
+                f"{n}{{{label_str(l)}}}": {"count": h["count"], "sum": round(h["sum"], 6)}
+                for (n, l), h in sorted(_histograms.items())
+            },
+        }
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _histograms.clear()
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _number(value):
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(openmetrics=False):
+    """Render everything recorded so far in Prometheus text (or OpenMetrics) format"""
+    lines, typed = [], set()
+
+    def declare(family, kind):
+        if family not in typed:
+            typed.add(family)
+            lines.append(f"# TYPE {family} {kind}")
+
+    with _lock:
+        for (name, labels), value in sorted(_counters.items()):
+            full = f"{NAMESPACE}_{name}"
+            family = full[:-len("_total")] if openmetrics and full.endswith("_total") else full
+            declare(family, "counter")
+            lines.append(f"{full}{_labels(labels)} {_number(value)}")
+        for (name, labels), value in sorted(_gauges.items()):
+            full = f"{NAMESPACE}_{name}"
+            declare(full, "gauge")
+            lines.append(f"{full}{_labels(labels)} {_number(value)}")
+        for (name, labels), hist in sorted(_histograms.items()):
+            full = f"{NAMESPACE}_{name}"
+            declare(full, "histogram")
+            cumulative = 0
+            for bound, count in zip(hist["buckets"], hist["counts"]):
+                cumulative += count
+                lines.append(f"{full}_bucket{_labels(labels, [('le', _number(bound))])} {cumulative}")
+            lines.append(f"{full}_bucket{_labels(labels, [('le', '+Inf')])} {hist['count']}")
+            lines.append(f"{full}_sum{_labels(labels)} {_number(hist['sum'])}")
+            lines.append(f"{full}_count{_labels(labels)} {hist['count']}")
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path=None):
+    """Write the Prometheus/OpenMetrics file (format picked by a .om suffix)"""
+    path = path or _prom_path
+    if not path:
+        return None
+    path = str(path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render(openmetrics=path.endswith(".om")))
+    os.replace(tmp_path, path)
+    return path
+
+
+def _at_exit():
+    if not enabled:
+        return
+    event("summary", **snapshot())
+    dump()
+    if _log is not None and _log is not sys.stderr:
+        _log.close()
+
+
+def enable(log_path="-", prom_path=None):
+    """Start recording; log_path "-" logs to stderr, None disables the JSON log"""
+    global enabled, _log, _prom_path
+    with _lock:
+        if _log is not None and _log is not sys.stderr:
+            _log.close()
+        if log_path is None:
+            _log = None
+        elif str(log_path) == "-":
+            _log = sys.stderr
+        else:
+            os.makedirs(os.path.dirname(str(log_path)) or ".", exist_ok=True)
+            _log = open(log_path, "a", encoding="utf-8")
+        _prom_path = prom_path or _prom_path
+        if not enabled:
+            atexit.register(_at_exit)
+        enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+if os.environ.get("PIPELINE_METRICS") or os.environ.get("PIPELINE_METRICS_PROM"):
+    _env_log = os.environ.get("PIPELINE_METRICS")
+    enable(None if _env_log in (None, "", "0") else ("-" if _env_log == "1" else _env_log),
+           os.environ.get("PIPELINE_METRICS_PROM"))
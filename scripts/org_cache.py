@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Persistent org-search cache for contact enrichment.
+
+Postings from the same company and team share one hiring contact, so an
+org search is cached on (provider, normalized company, team) rather than
+repeated for every posting. Entries expire after a TTL; misses are
+cached too, with a shorter TTL, so companies with no findable poster are
+not searched again on every run. A bounded in-memory LRU sits in front
+of the SQLite table, and the table itself is trimmed to max_entries by
+last use.
+
+Concurrent workers asking for the same key wait on a single lookup, so
+100 postings from 15 companies cost about 15 provider calls.
+
+    python scripts/org_cache.py stats
+    python scripts/org_cache.py evict
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import metrics
+from dedup import normalize_company, normalize_title
+
+CACHE_PATH = Path("output/org_cache.sqlite")
+TTL = 30 * 24 * 3600
+NEGATIVE_TTL = 3 * 24 * 3600
+MAX_ENTRIES = 50_000
+MEMORY_ENTRIES = 4096
+
+# First matching keyword decides the team a title belongs to
+TEAMS = (
+    ("data", ("data", "analytics", "analyst", "scientist")),
+    ("ml", ("machine learning", "ai", "aigc", "genai", "llm", "research")),
+    ("design", ("design", "designer", "ux", "ui")),
+    ("product", ("product",)),
+    ("engineering", ("engineer", "developer", "devops", "sre", "infrastructure", "software", "backend",
+                     "frontend", "platform", "security")),
+    ("sales", ("sales", "account", "business development", "partnership")),
+    ("marketing", ("marketing", "growth", "content", "seo", "brand")),
+    ("support", ("support", "customer", "success", "annotator")),
+    ("operations", ("operations", "finance", "legal", "recruit", "talent", "hr", "people")),
+)
+
+
+def team_key(title):
+    """Coarse team for a job title, e.g. 'Sr. Backend Engineer' -> 'engineering'"""
+    padded = f" {normalize_title(title)} "
+    for team, keywords in TEAMS:
+        if any(f" {keyword} " in padded for keyword in keywords):
+            return team
+    return "general"
+
+
+class OrgSearchCache:
+    def __init__(self, path=CACHE_PATH, ttl=TTL, negative_ttl=NEGATIVE_TTL,
+                 max_entries=MAX_ENTRIES, memory_entries=MEMORY_ENTRIES):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS org_cache ("
+            " key TEXT PRIMARY KEY, result TEXT, fetched_at REAL NOT NULL, last_used REAL NOT NULL"
+            ") WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS org_cache_last_used ON org_cache(last_used);"
+        )
+        self._memory = OrderedDict()
+        self._inflight = {}
+        self._touched = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "negative_hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    @staticmethod
+    def key(provider, company, title):
+        return f"{provider}|{normalize_company(company)}|{team_key(title)}"
+
+    @property
+    def lookups(self):
+        return self.stats["hits"] + self.stats["negative_hits"] + self.stats["misses"]
+
+    @property
+    def hit_rate(self):
+        return (self.stats["hits"] + self.stats["negative_hits"]) / self.lookups if self.lookups else 0.0
+
+    def _fresh(self, result, fetched_at, now):
+        ttl = self.ttl if result is not None else self.negative_ttl
+        return now - fetched_at < ttl
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _cached(self, key, now):
+        """(found, result) for a fresh entry; caller holds the lock"""
+        entry = self._memory.get(key)
+        if entry is None:
+            row = self.conn.execute("SELECT result, fetched_at FROM org_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                entry = (json.loads(row[0]) if row[0] is not None else None, row[1])
+        if entry is None:
+            return False, None
+        result, fetched_at = entry
+        if not self._fresh(result, fetched_at, now):
+            self._memory.pop(key, None)
+            self.stats["expired"] += 1
+            return False, None
+        self._remember(key, entry)
+        self._touched[key] = now
+        self.stats["hits" if result is not None else "negative_hits"] += 1
+        metrics.inc("cache_lookups_total", cache="org_search", result="hit")
+        return True, result
+
+    def get_or_fetch(self, provider, company, title, fetch):
+        """
+        Cached org-search result for a posting, calling fetch() on a miss.
+
+        fetch returns a contact dict or None (cached as a negative result);
+        exceptions propagate and nothing is cached.
+        """
+        key = self.key(provider, company, title)
+        while True:
+            with self._lock:
+                found, result = self._cached(key, time.time())
+                if found:
+                    return result
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    self._inflight[key] = threading.Event()
+                    self.stats["misses"] += 1
+                    metrics.inc("cache_lookups_total", cache="org_search", result="miss")
+                    break
+            waiter.wait()
+
+        try:
+            result = fetch()
+        except BaseException:
+            with self._lock:
+                self._inflight.pop(key).set()
+            raise
+        now = time.time()
+        with self._lock:
+            self._remember(key, (result, now))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO org_cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result) if result is not None else None, now, now),
+            )
+            self._inflight.pop(key).set()
+        return result
+
+    def commit(self):
+        with self._lock:
+            self.conn.executemany(
+                "UPDATE org_cache SET last_used = ? WHERE key = ?",
+                ((used, key) for key, used in self._touched.items()),
+            )
+            self._touched.clear()
+            self.conn.commit()
+        metrics.set_gauge("cache_hit_ratio", round(self.hit_rate, 4), cache="org_search")
+
+    def evict(self):
+        """Drop expired entries, then the least recently used beyond max_entries"""
+        self.commit()
+        now = time.time()
+        with self._lock, self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM org_cache WHERE (result IS NOT NULL AND fetched_at < ?)"
+                " OR (result IS NULL AND fetched_at < ?)",
+                (now - self.ttl, now - self.negative_ttl),
+            ).rowcount
+            (count,) = self.conn.execute("SELECT COUNT(*) FROM org_cache").fetchone()
+            if count > self.max_entries:
+                removed += self.conn.execute(
+                    "DELETE FROM org_cache WHERE key IN"
+                    " (SELECT key FROM org_cache ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                ).rowcount
+            self._memory.clear()
+        self.stats["evicted"] += removed
+        return removed
+
+    def clear(self):
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM org_cache")
+            self._memory.clear()
+
+    def size(self):
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*), COUNT(result) FROM org_cache"
+            ).fetchone()
+
+    def report(self):
+        s = self.stats
+        print(
+            f"🗂️  Org cache: {self.lookups} lookups, {s['hits']} hits + {s['negative_hits']} negative hits"
+            f" ({self.hit_rate:.0%}), {s['misses']} misses, {s['expired']} expired"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or trim the org-search cache")
+    parser.add_argument("command", choices=["stats", "evict", "clear"])
+    parser.add_argument("--path", default=CACHE_PATH)
+    parser.add_argument("--max-entries", type=int, default=MAX_ENTRIES)
+    args = parser.parse_args()
+
+    with OrgSearchCache(args.path, max_entries=args.max_entries) as cache:
+        if args.command == "evict":
+            print(f"🧹 Evicted {cache.evict()} org cache entries")
+        elif args.command == "clear":
+            cache.clear()
+            print("🧹 Org cache cleared")
+        total, positive = cache.size()
+        print(f"🗂️  {total} cached org searches ({positive} contacts, {total - positive} negative)")
+
+
+if __name__ == "__main__":
+    main()
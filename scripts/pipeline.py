@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the job pipeline.
+
+Every subcommand imports only what it needs, so quick commands (status,
+validate-header, --help) start in tens of milliseconds instead of paying
+for pandas, numpy and requests on every call from cron or an agent.
+
+    python scripts/pipeline.py status
+    python scripts/pipeline.py validate-header output/rss_jobs_scaffold.csv
+    python scripts/pipeline.py pull [--full]
+    python scripts/pipeline.py convert [--input output/rss_jobs.csv] [--validate]
+    python scripts/pipeline.py validate [output/rss_jobs_scaffold.csv]
+    python scripts/pipeline.py teal-import data/teal_exports
+    python scripts/pipeline.py mcp-export output/teal_jobs_scaffold.csv
+    python scripts/pipeline.py meta-scrape [--scaffold output/teal_jobs_scaffold.csv]
+    python scripts/pipeline.py airtable-sync output/teal_jobs_scaffold.csv [--base appXXXX | --fake]
+    python scripts/pipeline.py replay [--since 2025-06-01] [--source remotive] [-o output/rss_jobs_replay.csv]
+    python scripts/pipeline.py run [stages] [--pull] [--force]
+
+`run` executes the end-to-end pipeline as a DAG of stages (see dag.py):
+
+    pull ──> rss_scaffold ──> validate
+                   └──> teal_import ──> mcp_export
+
+The Teal import runs after the RSS scaffold, since both write the dedup
+index and the job store; validate then overlaps with the Teal branch.
+A stage is skipped when its code, the modules it imports, params and
+inputs hash the same as on its last successful run, and tables pass
+between stages in memory. The network pull is volatile: it only runs
+with --pull (or when named); otherwise the existing output/rss_jobs.csv
+stands in for it. Arguments that do not start with a subcommand go to
+`run`, so `pipeline.py --pull` works as before.
+
+    python scripts/pipeline.py run validate     # one stage and what it needs
+    python scripts/pipeline.py --metrics output/metrics.prom --metrics-log output/metrics.jsonl
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+
+import metrics
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+OUTPUT_DIR = Path("output")
+TEAL_EXPORTS = Path("data/teal_exports")
+RSS_JOBS = OUTPUT_DIR / "rss_jobs.csv"
+RSS_SCAFFOLD = OUTPUT_DIR / "rss_jobs_scaffold.csv"
+TEAL_SCAFFOLD = OUTPUT_DIR / "teal_jobs_scaffold.csv"
+QUERIES = Path("data/saved_searches.json")
+STORE_PATH = OUTPUT_DIR / "pipeline.db"
+STATE_PATH = OUTPUT_DIR / ".pipeline_state.json"
+COMMANDS = (
+    "pull", "convert", "validate", "validate-header", "status", "teal-import", "mcp-export", "meta-scrape",
+    "airtable-sync", "replay", "run",
+)
+
+
+def build_pipeline(output_dir=OUTPUT_DIR, teal_exports=TEAL_EXPORTS, dedup=True, max_workers=4):
+    from dag import Pipeline, Stage, StageError
+
+    # Stage fingerprints resolve the modules each stage imports, the Teal ones included
+    _teal_path()
+    out = Path(output_dir)
+    paths = {
+        "rss_jobs": out / "rss_jobs.csv",
+        "rss_scaffold": out / "rss_jobs_scaffold.csv",
+        "teal_scaffold": out / "teal_jobs_scaffold.csv",
+        "mcp_export": out / "mcp_entities.ndjson",
+        "store": out / "pipeline.db",
+        "dedup_index": out / "dedup.sqlite",
+    }
+
+    def pull():
+        from pull_rss import pull_incremental
+
+        pull_incremental(paths["rss_jobs"], cache_dir=out / ".fetch_cache", store_path=paths["store"],
+                         alerts_path=out / "alerts.jsonl", archive_dir=out / "feed_archive")
+        return {"rss_jobs": paths["rss_jobs"]}
+
+    def load_pull():
+        return {"rss_jobs": paths["rss_jobs"]}
+
+    def rss_scaffold(rss_jobs):
+        import pandas as pd
+
+        from rss_to_scaffold import convert_file
+
+        if not Path(rss_jobs).exists():
+            raise StageError(f"{rss_jobs} not found; run with --pull first")
+        chunks = []
+        rows_in, rows_out, elapsed = convert_file(
+            rss_jobs, paths["rss_scaffold"], dedup=dedup, store_path=paths["store"],
+            collect=chunks, index_path=paths["dedup_index"],
+        )
+        print(f"✅ Scaffold created: {paths['rss_scaffold']} with {rows_out} rows.")
+        frame = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        return {"rss_scaffold": frame}
+
+    def load_rss_scaffold():
+        from storage import read_table
+
+        return {"rss_scaffold": read_table(paths["rss_scaffold"])}
+
+    def validate(rss_scaffold):
+        from scaffold_validator import validate_frame
+
+        validator = validate_frame(rss_scaffold)
+        validator.report()
+        if not validator.ok:
+            raise StageError(f"{validator.error_rows} scaffold rows failed validation")
+        print(f"✅ {validator.rows} scaffold rows passed validation.")
+        return {"rss_validation": validator}
+
+    def teal_import():
+        from teal_job_scraper import SCAFFOLD_HEADERS, TealJobScraper
+
+        # Append/upsert into the existing scaffold: rows imported by other means stay,
+        # and without export files the scaffold is left untouched
+        exports = Path(teal_exports)
+        if (exports.is_dir() and any(exports.glob("*.csv"))) or exports.is_file():
+            scraper = TealJobScraper(paths["teal_scaffold"], dedup=dedup)
+            scraper.import_exports([exports], append=True, preview_lines=0)
+        elif paths["teal_scaffold"].exists():
+            print(f"⏭️  No Teal exports in {exports}, keeping {paths['teal_scaffold']}")
+        else:
+            # An empty scaffold, so the next run with nothing to import is cached
+            with open(paths["teal_scaffold"], "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(SCAFFOLD_HEADERS)
+            print(f"⏭️  No Teal exports in {exports}, wrote an empty {paths['teal_scaffold']}")
+        return load_teal()
+
+    def load_teal():
+        if not paths["teal_scaffold"].exists():
+            return {"teal_jobs": []}
+        with open(paths["teal_scaffold"], newline="", encoding="utf-8") as f:
+            return {"teal_jobs": list(csv.DictReader(f))}
+
+    def mcp_export(teal_jobs):
+        from mcp_graph import MCPGraphBuilder
+
+        with MCPGraphBuilder(out / "mcp_manifest.sqlite") as graph:
+            graph.export(teal_jobs, paths["mcp_export"])
+            graph.report(paths["mcp_export"])
+        return {"mcp_graph": paths["mcp_export"]}
+
+    params = {"output_dir": str(out), "dedup": dedup}
+    stages = [
+        Stage("pull", pull, outputs={"rss_jobs": "path"}, persist=(paths["rss_jobs"],),
+              params=params, load=load_pull, volatile=True),
+        Stage("rss_scaffold", rss_scaffold, inputs={"rss_jobs": "path"}, outputs={"rss_scaffold": "scaffold_frame"},
+              persist=(paths["rss_scaffold"],), params=params, load=load_rss_scaffold),
+        Stage("validate", validate, inputs={"rss_scaffold": "scaffold_frame"},
+              outputs={"rss_validation": "validation"}, params=params),
+        # Both branches write dedup.sqlite and pipeline.db; importing after the RSS scaffold
+        # keeps which source wins a cross-source duplicate fixed and the writes apart
+        Stage("teal_import", teal_import, outputs={"teal_jobs": "teal_rows"}, sources=(teal_exports,),
+              persist=(paths["teal_scaffold"],), params=params, load=load_teal, after=("rss_scaffold",)),
+        Stage("mcp_export", mcp_export, inputs={"teal_jobs": "teal_rows"}, outputs={"mcp_graph": "path"},
+              persist=(paths["mcp_export"],), params=params),
+    ]
+    return Pipeline(stages, state_path=out / ".pipeline_state.json", max_workers=max_workers)
+
+
+def _teal_path():
+    path = str(SCRIPTS_DIR / "teal-integration")
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def cmd_pull(args):
+    from pull_rss import pull_incremental
+
+    pull_incremental(full=args.full, queries_path=None if args.no_alerts else QUERIES,
+                     archive_dir=None if args.no_archive else OUTPUT_DIR / "feed_archive")
+
+
+def cmd_convert(args):
+    from rss_to_scaffold import main as convert
+
+    convert(args.input, args.output, dedup=not args.no_dedup, near=args.near, fmt=args.format,
+            chunksize=args.chunksize, validate=args.validate)
+
+
+def cmd_validate(args):
+    from scaffold_validator import validate_file
+
+    validator = validate_file(args.path, args.chunksize, args.format)
+    validator.report(args.errors)
+    if validator.ok:
+        print(f"✅ {args.path}: {validator.rows} rows passed scaffold validation.")
+    return 0 if validator.ok else 1
+
+
+def read_header(path, fmt=None):
+    """Column names of a table; CSV headers are read without loading pandas"""
+    if (fmt or Path(path).suffix.lower().lstrip(".")) == "csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return next(csv.reader(f), [])
+    from storage import table_columns
+
+    return table_columns(path, fmt)
+
+
+def cmd_validate_header(args):
+    from scaffold_schema import missing_columns
+
+    if not Path(args.path).exists():
+        print(f"❌ {args.path} not found")
+        return 1
+    columns = read_header(args.path, args.format)
+    missing = missing_columns(columns)
+    if missing:
+        print(f"❌ {args.path}: missing columns {missing}")
+        return 1
+    print(f"✅ {args.path}: scaffold header OK ({len(columns)} columns)")
+    return 0
+
+
+def cmd_status(args):
+    state_path = Path(args.output_dir) / STATE_PATH.name
+    stages = json.loads(state_path.read_text(encoding="utf-8")).get("stages", {}) if state_path.exists() else {}
+    if stages:
+        print("🧭 Last successful stage runs:")
+        for name, entry in sorted(stages.items(), key=lambda item: item[1].get("ran_at", 0)):
+            ran_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.get("ran_at", 0)))
+            print(f"   {name:<14} {ran_at}")
+    else:
+        print(f"🧭 No pipeline runs recorded in {state_path}")
+    store_path = Path(args.output_dir) / STORE_PATH.name
+    if not store_path.exists():
+        print(f"🗄️  No job store at {store_path}")
+        return 0
+    from job_store import JobStore
+
+    with JobStore(store_path) as store:
+        for name, count in store.stats().items():
+            print(f"{name:>28}: {count}")
+    return 0
+
+
+def cmd_teal_import(args):
+    _teal_path()
+    from teal_job_scraper import TealJobScraper
+
+    scraper = TealJobScraper(args.output, dedup=not args.no_dedup, resolve_links=args.resolve_links)
+    scraper.import_exports(args.paths, append=not args.overwrite, preview_lines=args.preview)
+
+
+def cmd_mcp_export(args):
+    _teal_path()
+    from mcp_graph import MCPGraphBuilder
+
+    with open(args.input, newline="", encoding="utf-8") as f, \
+            MCPGraphBuilder(args.manifest, args.batch_size, args.full) as graph:
+        graph.export(csv.DictReader(f), args.output)
+        graph.report(args.output)
+
+
+def cmd_meta_scrape(args):
+    from meta_scrape import meta_scrape
+
+    meta_scrape(args.db, args.scaffold, args.output, args.cache, args.limit, workers=args.workers,
+                per_host=args.per_host, host_interval=args.host_interval, robots=not args.ignore_robots)
+
+
+def cmd_airtable_sync(args):
+    _teal_path()
+    from airtable_sync import airtable_sync
+
+    airtable_sync(args.input, args.base, snapshot_path=args.snapshot, fake=args.fake, workers=args.workers,
+                  full=args.full, prune=args.prune, adopt=args.adopt)
+
+
+def cmd_replay(args):
+    from feed_archive import FeedArchive
+    from pull_rss import save_csv
+
+    with FeedArchive(args.archive) as archive:
+        started = time.perf_counter()
+        count = save_csv(archive.replay(args.since, args.until, args.source, latest=not args.all_versions),
+                         args.output)
+        print(f"⏱️  Replayed {count} postings in {time.perf_counter() - started:.1f}s"
+              f" ({archive.replay_errors} could not be normalized)")
+
+
+def cmd_run(args):
+    pipeline = build_pipeline(args.output_dir, args.teal_exports, not args.no_dedup, args.workers)
+    if args.list:
+        for name in pipeline.order:
+            stage = pipeline.stages[name]
+            inputs = ", ".join(f"{k}: {v}" for k, v in stage.inputs.items()) or "-"
+            outputs = ", ".join(f"{k}: {v}" for k, v in stage.outputs.items())
+            after = f"  after {', '.join(stage.after)}" if stage.after else ""
+            print(f"{name:<14} ({inputs}) -> ({outputs}){'  [volatile]' if stage.volatile else ''}{after}")
+        return 0
+
+    started = time.perf_counter()
+    results = pipeline.run(args.stages or None, force=args.force, run_volatile=args.pull)
+    pipeline.report(results)
+    print(f"⚡ Pipeline finished in {time.perf_counter() - started:.2f}s")
+    return 1 if any(status in ("failed", "blocked") for status, _ in results.values()) else 0
+
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--metrics", help="write Prometheus metrics here at exit (.om for OpenMetrics)")
+    common.add_argument("--metrics-log", help="append JSON span/metric events here ('-' for stderr)")
+
+    parser = argparse.ArgumentParser(description="Job pipeline: pull, convert, validate, import and export")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    cmd = sub.add_parser("pull", parents=[common], help="fetch the remote job feeds into output/rss_jobs.csv")
+    cmd.add_argument("--full", action="store_true", help="ignore the fetch cache and rewrite the output")
+    cmd.add_argument("--no-alerts", action="store_true", help="skip the saved searches in data/saved_searches.json")
+    cmd.add_argument("--no-archive", action="store_true", help="do not keep the raw postings in output/feed_archive")
+    cmd.set_defaults(func=cmd_pull)
+
+    cmd = sub.add_parser("convert", parents=[common], help="convert the pulled jobs to a scaffold table")
+    cmd.add_argument("--input", default=RSS_JOBS, help="job table (.csv, .parquet or .arrow)")
+    cmd.add_argument("--output", default=RSS_SCAFFOLD, help="scaffold table (.csv, .parquet or .arrow)")
+    cmd.add_argument("--format", choices=["csv", "parquet", "arrow"], help="override the output format")
+    cmd.add_argument("--chunksize", type=int, default=100_000, help="rows per conversion chunk")
+    cmd.add_argument("--no-dedup", action="store_true", help="skip the cross-source dedup stage")
+    cmd.add_argument("--near", action="store_true", help="also drop near-duplicate titles")
+    cmd.add_argument("--validate", action="store_true", help="validate scaffold rows inline")
+    cmd.set_defaults(func=cmd_convert)
+
+    cmd = sub.add_parser("validate", parents=[common], help="validate every row of a scaffold table")
+    cmd.add_argument("path", nargs="?", default=RSS_SCAFFOLD)
+    cmd.add_argument("--format", choices=["csv", "parquet", "arrow"])
+    cmd.add_argument("--chunksize", type=int, default=200_000)
+    cmd.add_argument("--errors", type=int, default=5, help="number of row errors to print")
+    cmd.set_defaults(func=cmd_validate)
+
+    cmd = sub.add_parser("validate-header", parents=[common], help="check a scaffold table's columns only")
+    cmd.add_argument("path", nargs="?", default=RSS_SCAFFOLD)
+    cmd.add_argument("--format", choices=["csv", "parquet", "arrow"])
+    cmd.set_defaults(func=cmd_validate_header)
+
+    cmd = sub.add_parser("status", parents=[common], help="last stage runs and job store counts")
+    cmd.add_argument("--output-dir", default=OUTPUT_DIR)
+    cmd.set_defaults(func=cmd_status)
+
+    cmd = sub.add_parser("teal-import", parents=[common], help="import Teal export CSVs or directories of them")
+    cmd.add_argument("paths", nargs="+")
+    cmd.add_argument("-o", "--output", default=TEAL_SCAFFOLD)
+    cmd.add_argument("--overwrite", action="store_true", help="rewrite the scaffold instead of appending")
+    cmd.add_argument("--no-dedup", action="store_true")
+    cmd.add_argument("--preview", type=int, default=5, help="rows to preview")
+    cmd.add_argument("--resolve-links", action="store_true", help="follow short links (lnkd.in, bit.ly) to the posting")
+    cmd.set_defaults(func=cmd_teal_import)
+
+    cmd = sub.add_parser("mcp-export", parents=[common], help="export jobs as incremental MCP memory graph calls")
+    cmd.add_argument("input", nargs="?", default=TEAL_SCAFFOLD,
+                     help="job or scaffold CSV (job_title/title, company, original_url/url)")
+    cmd.add_argument("-o", "--output", default=OUTPUT_DIR / "mcp_entities.ndjson")
+    cmd.add_argument("--manifest", default=OUTPUT_DIR / "mcp_manifest.sqlite")
+    cmd.add_argument("--batch-size", type=int, default=100)
+    cmd.add_argument("--full", action="store_true", help="ignore the manifest and export everything")
+    cmd.set_defaults(func=cmd_mcp_export)
+
+    cmd = sub.add_parser("meta-scrape", parents=[common], help="fetch job pages for JSON-LD/OpenGraph metadata")
+    cmd.add_argument("--scaffold", help="update this scaffold CSV instead of the job store")
+    cmd.add_argument("-o", "--output", help="with --scaffold: write here instead of in place")
+    cmd.add_argument("--db", default=STORE_PATH)
+    cmd.add_argument("--cache", default=OUTPUT_DIR / "meta_pages.sqlite")
+    cmd.add_argument("--workers", type=int, default=16)
+    cmd.add_argument("--per-host", type=int, default=4, help="requests in flight per host")
+    cmd.add_argument("--host-interval", type=float, default=0.0, help="minimum seconds between requests to one host")
+    cmd.add_argument("--limit", type=int)
+    cmd.add_argument("--ignore-robots", action="store_true")
+    cmd.set_defaults(func=cmd_meta_scrape)
+
+    cmd = sub.add_parser("airtable-sync", parents=[common], help="send new and changed jobs/contacts to Airtable")
+    cmd.add_argument("input", nargs="?", default=TEAL_SCAFFOLD, help="scaffold CSV")
+    cmd.add_argument("--base", help="Airtable base ID (default: $AIRTABLE_BASE_ID; token from $AIRTABLE_TOKEN)")
+    cmd.add_argument("--snapshot", default=OUTPUT_DIR / "airtable_snapshot.sqlite")
+    cmd.add_argument("--workers", type=int, default=4)
+    cmd.add_argument("--full", action="store_true", help="re-send every record, changed or not")
+    cmd.add_argument("--prune", action="store_true", help="delete records whose rows left the scaffold")
+    cmd.add_argument("--adopt", action="store_true", help="rebuild the snapshot from the records in Airtable first")
+    cmd.add_argument("--fake", action="store_true", help="sync into a local fake Airtable instead")
+    cmd.set_defaults(func=cmd_airtable_sync)
+
+    cmd = sub.add_parser("replay", parents=[common], help="re-derive job rows from the raw feed archive, offline")
+    cmd.add_argument("--archive", default=OUTPUT_DIR / "feed_archive")
+    cmd.add_argument("--since", help="fetched at or after (ISO date/time, UTC)")
+    cmd.add_argument("--until", help="fetched before (ISO date/time, UTC)")
+    cmd.add_argument("--source", action="append", help="limit to a source (repeatable)")
+    cmd.add_argument("--all-versions", action="store_true", help="one row per archived version, not per posting")
+    cmd.add_argument("-o", "--output", default=OUTPUT_DIR / "rss_jobs_replay.csv")
+    cmd.set_defaults(func=cmd_replay)
+
+    cmd = sub.add_parser("run", parents=[common], help="run the pipeline DAG, skipping unchanged stages")
+    cmd.add_argument("stages", nargs="*", help="stages to run (default: all); upstream stages are included")
+    cmd.add_argument("--pull", action="store_true", help="fetch the remote feeds first")
+    cmd.add_argument("--force", action="store_true", help="ignore cached fingerprints")
+    cmd.add_argument("--output-dir", default=OUTPUT_DIR)
+    cmd.add_argument("--teal-exports", default=TEAL_EXPORTS, help="Teal export CSV or directory of them")
+    cmd.add_argument("--no-dedup", action="store_true")
+    cmd.add_argument("--workers", type=int, default=4)
+    cmd.add_argument("--list", action="store_true", help="print the stages in run order and exit")
+    cmd.set_defaults(func=cmd_run)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in COMMANDS + ("-h", "--help"):
+        argv = ["run", *argv]
+    args = parser.parse_args(argv)
+
+    if args.metrics or args.metrics_log:
+        metrics.enable(args.metrics_log, args.metrics)
+    raise SystemExit(args.func(args) or 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,182 @@
-import requests
-import pandas as pd
+import argparse
+import csv
+from pathlib import Path
 
-SOURCES = {
-    "remotive": "https://remotive.io/api/remote-jobs",
-    "remoteok": "https://remoteok.com/api"
-}
+import metrics
+from alerts import ALERTS_PATH, QUERIES_PATH, open_alerts
+from fetch_cache import CACHE_DIR, FetchCache, SeenIndex
+from fetch_engine import FetchEngine
+from feed_archive import ARCHIVE_DIR, FeedArchive
+from job_store import STORE_PATH, JobStore
+from records import JobColumns
+from sources import ADAPTERS, JOB_FIELDS
 
-def pull_remotive():
+OUTPUT_PATH = Path("output/rss_jobs.csv")
+
+SOURCES = {name: adapter.url for name, adapter in ADAPTERS.items()}
+
+def fetch_sources(names, engine, cache=None, conditional=True):
+    """Fetch sources concurrently, sending conditional GETs when a cache is given"""
+    reqs = []
+    for name in names:
+        req = ADAPTERS[name].request()
+        if cache is not None and conditional:
+            req.headers.update(cache.conditional_headers(req.url))
+        reqs.append(req)
+    return engine.fetch_all(reqs)
+
+def open_result_body(result, cache=None):
+    """Return the body to parse for a result, or None if there is nothing to do"""
+    label = ADAPTERS[result.name].label
+    if cache is not None:
+        metrics.inc("cache_lookups_total", cache="fetch", result="hit" if result.status == 304 else "miss")
+    if result.status == 304 and cache is not None:
+        if cache.is_processed(result.url):
+            print(f"⏭️  {label} unchanged (304), skipping")
+            return None
+        body = cache.open_body(result.url)
+        if body is None:
+            print(f"Error fetching data from {label}: 304 without a cached body")
+        return body
+    if not result.ok:
+        print(f"Error fetching data from {label}: {result.error or result.status}")
+        return None
+    return cache.store(result) if cache is not None else result.open()
+
+def iter_result_jobs(result, cache=None, seen=None, archive=None):
+    """Yield normalized jobs from one fetch result, reporting fetch/decode errors"""
+    adapter = ADAPTERS[result.name]
+    count = 0
     try:
-        res = requests.get(SOURCES["remotive"])
-        res.raise_for_status()  # Check for HTTP errors
-        data = res.json().get("jobs", [])
-        jobs = []
-        for job in data:
-            jobs.append({
-                "job_title": job["title"],
-                "company": job["company_name"],
-                "original_url": job["url"],
-                "platform": "remotive",
-                "location": job["candidate_required_location"],
-                "post_date": job["publication_date"]
-            })
-        return jobs
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching data from Remotive: {e}")
-        return []
-    except ValueError as e:
-        print(f"Error decoding JSON for Remotive: {e}")
-        return []
+        body = open_result_body(result, cache)
+        if body is None:
+            return
+        with body:
+            for job in adapter.records(body, seen, archive):
+                count += 1
+                yield job
+        if cache is not None:
+            cache.mark_processed(result.url)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        metrics.inc("parse_errors_total", source=result.name)
+        print(f"Error decoding JSON for {adapter.label}: {e}")
+    finally:
+        result.close()
+        metrics.inc("rows_out_total", count, stage="pull", source=result.name)
 
-def pull_remoteok():
+def stream_jobs(names=None, engine=None, cache=None, seen=None, conditional=True, archive=None):
+    """Fetch sources concurrently, then stream their jobs in SOURCES order"""
+    names = list(names or ADAPTERS)
+    owns_engine = engine is None
+    engine = engine or FetchEngine()
     try:
-        res = requests.get(SOURCES["remoteok"], headers={"User-Agent": "Mozilla/5.0"})
-        res.raise_for_status()  # Check for HTTP errors
-        data = res.json()[1:]  # Skip metadata
-        jobs = []
-        for job in data:
-            jobs.append({
-                "job_title": job.get("position") or job.get("title"),
-                "company": job.get("company"),
-                "original_url": "https://remoteok.com" + job.get("url", ""),
-                "platform": "remoteok",
-                "location": job.get("location", ""),
-                "post_date": job.get("date", "")
-            })
-        return jobs
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching data from RemoteOK: {e}")
-        return []
-    except ValueError as e:
-        print(f"Error decoding JSON for RemoteOK: {e}")
-        return []
-
-def save_csv(jobs):
-    if jobs:
-        df = pd.DataFrame(jobs)
-        df.to_csv("output/rss_jobs.csv", index=False)
-        print(f"✅ Saved {len(df)} jobs to output/rss_jobs.csv")
+        results = fetch_sources(names, engine, cache, conditional)
+    finally:
+        if owns_engine:
+            engine.close()
+    for result in results:
+        yield from iter_result_jobs(result, cache, seen, archive)
+
+def pull_remotive():
+    return list(stream_jobs(["remotive"]))
+
+def pull_remoteok():
+    return list(stream_jobs(["remoteok"]))
+
+def pull_columns(names=None):
+    """Pull sources into one JobColumns (Arrow columns) rather than a list of records"""
+    return JobColumns.from_records(stream_jobs(names))
+
+def _row(job):
+    return [job.get(field, "") for field in JOB_FIELDS]
+
+def save_csv(jobs, path=OUTPUT_PATH, append=False):
+    """
+    Write jobs to CSV as they arrive; accepts any iterable of job records.
+
+    With append=True new rows are added to an existing file instead of
+    replacing it.
+    """
+    path = Path(path)
+    if append and path.exists() and path.stat().st_size > 0:
+        count = 0
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            for job in jobs:
+                writer.writerow(_row(job))
+                count += 1
+        if count:
+            print(f"✅ Appended {count} new jobs to {path}")
+        else:
+            print("No new jobs.")
+        return count
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    count = 0
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(JOB_FIELDS)
+        for job in jobs:
+            writer.writerow(_row(job))
+            count += 1
+    if count:
+        tmp_path.replace(path)
+        print(f"✅ Saved {count} jobs to {path}")
     else:
+        tmp_path.unlink()
         print("No jobs to save.")
+    return count
+
+def pull_incremental(output_path=OUTPUT_PATH, cache_dir=CACHE_DIR, full=False, store_path=STORE_PATH,
+                     queries_path=QUERIES_PATH, alerts_path=ALERTS_PATH, archive_dir=ARCHIVE_DIR):
+    """
+    Pull only what changed since the last run.
+
+    Unchanged feeds are answered with 304 and skipped; changed feeds only
+    contribute postings missing from the seen-ID index, which are appended
+    to the output and upserted into the job store. A full pull (or a fresh
+    index) rewrites the output. The new postings are run through the saved
+    searches, if any, and matches are appended to the alert stream. Every
+    raw posting parsed goes to the feed archive (unchanged ones are skipped
+    there), so later mapping changes can be replayed offline.
+    """
+    cache = FetchCache(cache_dir)
+    alerts = open_alerts(queries_path, alerts_path) if queries_path else None
+    archive = FeedArchive(archive_dir) if archive_dir else None
+    try:
+        with metrics.span("stage", stage="pull") as span, SeenIndex(Path(cache_dir) / "seen.sqlite") as seen, JobStore(store_path) as store:
+            append = not full and not seen.is_empty() and Path(output_path).exists()
+            if not append:
+                # The output starts from scratch, so every posting counts as new
+                seen.clear()
+            jobs = store.tee(stream_jobs(cache=cache, seen=seen, conditional=append, archive=archive))
+            if alerts is not None:
+                jobs = alerts.tee(jobs)
+            count = save_csv(jobs, output_path, append=append)
+            seen.commit()
+            cache.commit()
+            seen.prune()
+            span.set(rows_out=count, append=append)
+    finally:
+        if alerts is not None:
+            alerts.close()
+        if archive is not None:
+            archive.close()
+    if alerts is not None and alerts.count:
+        print(f"🔔 {alerts.count} new alerts in {alerts.path}")
+    if archive is not None and archive.stats["added"]:
+        print(f"📦 Archived {archive.stats['added']} new or changed raw postings")
+    evicted = cache.evict()
+    if evicted:
+        print(f"🧹 Evicted {evicted} stale fetch cache entries")
+    return count
 
 if __name__ == "__main__":
-    all_jobs = pull_remotive() + pull_remoteok()
-    save_csv(all_jobs)
+    parser = argparse.ArgumentParser(description="Pull remote job feeds into output/rss_jobs.csv")
+    parser.add_argument("--full", action="store_true", help="ignore the fetch cache and rewrite the output")
+    parser.add_argument("--queries", default=QUERIES_PATH, help="saved searches to alert on (JSON)")
+    parser.add_argument("--no-alerts", action="store_true", help="skip the saved searches")
+    parser.add_argument("--no-archive", action="store_true", help="do not keep the raw postings in the feed archive")
+    args = parser.parse_args()
+    pull_incremental(full=args.full, queries_path=None if args.no_alerts else args.queries,
+                     archive_dir=None if args.no_archive else ARCHIVE_DIR)
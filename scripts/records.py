@@ -0,0 +1,153 @@
+"""
+Compact in-memory job records.
+
+JobRecord is one posting in fixed slots instead of a dict: no per-row
+hash table, and the strings that repeat across postings (company,
+platform, location) are interned so a million postings share one copy
+of each. It is a read-only Mapping, so csv.DictWriter, the job store
+and the dedup index take it as they take dict rows.
+
+JobColumns holds many postings as Arrow columns (struct of arrays):
+rows are buffered as Python values and flushed every chunk_rows into
+string arrays, with company/platform/location dictionary-encoded.
+to_arrow() returns the batches as they are, and to_pandas() wraps them
+in Arrow-backed string columns without copying the text.
+"""
+
+from collections.abc import Mapping
+from sys import intern
+
+JOB_FIELDS = ["job_title", "company", "original_url", "platform", "location", "post_date"]
+# Optional fields, only present (in keys()) when set; Teal imports carry them
+EXTRA_FIELDS = ("notes", "scraped_at")
+INTERNED_FIELDS = ("company", "platform", "location")
+CHUNK_ROWS = 65_536
+_FIELDS = frozenset(JOB_FIELDS)
+
+
+def _text(value):
+    if value is None:
+        return ""
+    return value if type(value) is str else str(value)
+
+
+class JobRecord(Mapping):
+    __slots__ = tuple(JOB_FIELDS) + EXTRA_FIELDS
+
+    def __init__(self, job_title="", company="", original_url="", platform="", location="", post_date="",
+                 notes=None, scraped_at=None):
+        self.job_title = _text(job_title)
+        self.company = intern(_text(company))
+        self.original_url = _text(original_url)
+        self.platform = intern(_text(platform))
+        self.location = intern(_text(location))
+        self.post_date = _text(post_date)
+        self.notes = notes
+        self.scraped_at = scraped_at
+
+    @classmethod
+    def from_mapping(cls, row):
+        return cls(**{name: row[name] for name in cls.__slots__ if name in row})
+
+    def __getitem__(self, name):
+        if name in _FIELDS:
+            return getattr(self, name)
+        if name in EXTRA_FIELDS and getattr(self, name) is not None:
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def __iter__(self):
+        yield from JOB_FIELDS
+        for name in EXTRA_FIELDS:
+            if getattr(self, name) is not None:
+                yield name
+
+    def __len__(self):
+        return len(JOB_FIELDS) + sum(getattr(self, name) is not None for name in EXTRA_FIELDS)
+
+    def __repr__(self):
+        return f"JobRecord({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+
+class JobColumns:
+    """Append-only struct of arrays over JOB_FIELDS, backed by Arrow record batches"""
+
+    def __init__(self, chunk_rows=CHUNK_ROWS):
+        from storage import _require_pyarrow
+
+        _require_pyarrow()
+        self.chunk_rows = chunk_rows
+        self._pending = {name: [] for name in JOB_FIELDS}
+        self._batches = []
+        self._rows = 0
+
+    @classmethod
+    def from_records(cls, records, chunk_rows=CHUNK_ROWS):
+        columns = cls(chunk_rows)
+        columns.extend(records)
+        return columns
+
+    @staticmethod
+    def schema():
+        import pyarrow as pa
+
+        return pa.schema([
+            (name, pa.dictionary(pa.int32(), pa.string()) if name in INTERNED_FIELDS else pa.string())
+            for name in JOB_FIELDS
+        ])
+
+    def append(self, record):
+        for name, values in self._pending.items():
+            values.append(record[name])
+        self._rows += 1
+        if len(self._pending["job_title"]) >= self.chunk_rows:
+            self.flush()
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+        return self
+
+    def flush(self):
+        """Move buffered rows into a new Arrow batch"""
+        import pyarrow as pa
+
+        if not self._pending["job_title"]:
+            return
+        arrays = []
+        for name in JOB_FIELDS:
+            array = pa.array(self._pending[name], pa.string())
+            arrays.append(array.dictionary_encode() if name in INTERNED_FIELDS else array)
+            self._pending[name] = []
+        self._batches.append(pa.record_batch(arrays, schema=self.schema()))
+
+    def __len__(self):
+        return self._rows
+
+    @property
+    def nbytes(self):
+        self.flush()
+        return sum(batch.nbytes for batch in self._batches)
+
+    def to_arrow(self):
+        import pyarrow as pa
+
+        self.flush()
+        return pa.Table.from_batches(self._batches, schema=self.schema())
+
+    def to_pandas(self):
+        """DataFrame over the Arrow buffers: string columns are wrapped, not copied"""
+        import pyarrow as pa
+
+        from storage import string_dtype
+
+        table = self.to_arrow()
+        # Dictionary columns become categoricals (codes only); plain strings stay in Arrow memory
+        return table.to_pandas(types_mapper={pa.string(): string_dtype()}.get)
+
+    def __iter__(self):
+        self.flush()
+        for batch in self._batches:
+            columns = [batch.column(name).to_pylist() for name in JOB_FIELDS]
+            for values in zip(*columns):
+                yield JobRecord(*values)
@@ -1,39 +1,128 @@
+import argparse
+import time
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+import metrics
+from dedup import INDEX_PATH, DedupIndex
+from job_store import STORE_PATH, JobStore
+from scaffold_format import REQUIRED_COLUMNS
+from scaffold_validator import ScaffoldValidator
+from storage import INT_COLUMNS, TableWriter, iter_table_chunks, table_columns
+from urls import clean_url
+
 INPUT_PATH = Path("output/rss_jobs.csv")
 OUTPUT_PATH = Path("output/rss_jobs_scaffold.csv")
+CHUNK_SIZE = 100_000
+
+# Scaffold column -> ingestion column it is copied from; every other
+# scaffold column (or one the input lacks) starts empty and is filled by
+# enrichment.
+SOURCE_COLUMNS = {
+    "job_title": "job_title",
+    "company": "company",
+    "original_url": "original_url",
+    "location": "location",
+}
+
+def empty_column(col, n):
+    """An all-missing column that costs about a byte per row"""
+    if col in INT_COLUMNS:
+        return pd.arrays.IntegerArray(np.zeros(n, dtype=np.int64), np.ones(n, dtype=bool))
+    return pd.Categorical.from_codes(np.full(n, -1, dtype=np.int8), categories=pd.Index([], dtype=object))
+
+def clean_urls(series):
+    """clean_url once per distinct value, so pulls stored before URL fixes convert to valid links"""
+    codes, uniques = pd.factorize(series)
+    # The trailing None is what missing values (code -1) pick
+    cleaned = np.array([clean_url(url) or None for url in uniques] + [None], dtype=object)
+    return cleaned[codes]
 
 def convert_to_scaffold(df):
-    scaffold = pd.DataFrame({
-        "job_title": df["job_title"],
-        "company": df["company"],
-        "original_url": df["original_url"],
-        "poster_name": "",
-        "poster_linkedin": "",
-        "poster_title": "",
-        "poster_type": "",
-        "confidence": "",
-        "reason": "",
-        "meta_scrape_status": "",
-        "org_search_status": "",
-        "poster_email": "",
-        "poster_phone": "",
-        "poster_twitter": "",
-        "poster_github": "",
-        "contact_source": ""
-    })
-    return scaffold
-
-def main():
-    if not INPUT_PATH.exists():
-        print("❌ rss_jobs.csv not found.")
+    n = len(df)
+    data = {}
+    for col in REQUIRED_COLUMNS:
+        if col == "original_url":
+            data[col] = clean_urls(df[SOURCE_COLUMNS[col]])
+        elif SOURCE_COLUMNS.get(col) in df.columns:
+            data[col] = df[SOURCE_COLUMNS[col]].to_numpy()
+        else:
+            data[col] = empty_column(col, n)
+    return pd.DataFrame(data, index=df.index, copy=False)
+
+def convert_file(input_path, output_path, chunksize=CHUNK_SIZE, dedup=True, near=False, fmt=None,
+                 validator=None, store_path=STORE_PATH, collect=None, index_path=INDEX_PATH):
+    """
+    Stream input through dedup and conversion, appending scaffold rows chunk by chunk.
+
+    A ScaffoldValidator, if given, checks each converted chunk inline.
+    Converted rows are also upserted into the job store unless store_path
+    is None. Converted chunks are appended to the collect list, if given,
+    for callers that keep working on the table in memory.
+    """
+    available = table_columns(input_path)
+    wanted = list(SOURCE_COLUMNS.values()) + ["platform", "source"]
+    columns = [c for c in wanted if c in available]
+
+    started = time.perf_counter()
+    rows_in = 0
+    index = DedupIndex(index_path, near=near) if dedup else None
+    store = JobStore(store_path) if store_path else None
+    try:
+        with metrics.span("stage", stage="convert") as span, TableWriter(output_path, fmt) as writer:
+            for chunk in iter_table_chunks(input_path, chunksize, columns=columns):
+                rows_in += len(chunk)
+                if index is not None:
+                    chunk = index.filter_frame(chunk)
+                scaffold = convert_to_scaffold(chunk)
+                if validator is not None:
+                    validator.check(scaffold)
+                writer.write(scaffold)
+                if collect is not None:
+                    collect.append(scaffold)
+                if store is not None:
+                    extra = {c: chunk[c].to_numpy() for c in ("platform", "source") if c in chunk}
+                    store.upsert_frame(scaffold.assign(**extra))
+            span.set(rows_in=rows_in, rows_out=writer.rows)
+        if index is not None:
+            index.report()
+    finally:
+        if index is not None:
+            index.close()
+        if store is not None:
+            store.close()
+    elapsed = time.perf_counter() - started
+    metrics.inc("rows_in_total", rows_in, stage="convert")
+    metrics.inc("rows_out_total", writer.rows, stage="convert")
+    return rows_in, writer.rows, elapsed
+
+def main(input_path=INPUT_PATH, output_path=OUTPUT_PATH, dedup=True, near=False, fmt=None,
+         chunksize=CHUNK_SIZE, validate=False):
+    input_path = Path(input_path)
+    if not input_path.exists():
+        print(f"❌ {input_path.name} not found.")
         return
 
-    df = pd.read_csv(INPUT_PATH)
-    scaffold = convert_to_scaffold(df)
-    scaffold.to_csv(OUTPUT_PATH, index=False)
-    print(f"✅ Scaffold created: {OUTPUT_PATH} with {len(scaffold)} rows.")
+    validator = ScaffoldValidator() if validate else None
+    rows_in, rows_out, elapsed = convert_file(input_path, output_path, chunksize, dedup, near, fmt, validator)
+    rate = rows_in / elapsed if elapsed else 0
+    print(f"✅ Scaffold created: {output_path} with {rows_out} rows.")
+    print(f"⚡ {rows_in} rows in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+    if validator is not None:
+        validator.report()
+        if validator.ok:
+            print(f"✅ {rows_out} scaffold rows passed validation.")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Convert output/rss_jobs.csv to scaffold format")
+    parser.add_argument("--input", default=INPUT_PATH, help="job table (.csv, .parquet or .arrow)")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="scaffold table (.csv, .parquet or .arrow)")
+    parser.add_argument("--format", choices=["csv", "parquet", "arrow"], help="override the output format")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE, help="rows per conversion chunk")
+    parser.add_argument("--no-dedup", action="store_true", help="skip the cross-source dedup stage")
+    parser.add_argument("--near", action="store_true", help="also drop near-duplicate titles")
+    parser.add_argument("--validate", action="store_true", help="validate scaffold rows inline")
+    args = parser.parse_args()
+    main(args.input, args.output, dedup=not args.no_dedup, near=args.near, fmt=args.format,
+         chunksize=args.chunksize, validate=args.validate)
@@ -1,22 +1,34 @@
-import pandas as pd
+import argparse
 
-REQUIRED_COLUMNS = [
-    "job_title", "company", "original_url", "poster_name", "poster_linkedin",
-    "poster_title", "poster_type", "confidence", "reason",
-    "meta_scrape_status", "org_search_status",
-    "poster_email", "poster_phone", "poster_twitter", "poster_github",
-    "contact_source"
-]
+from scaffold_schema import SCAFFOLD_COLUMNS
+from scaffold_validator import ScaffoldValidator
+from storage import iter_table_chunks
 
-def validate_scaffold(filepath):
-    df = pd.read_csv(filepath)
-    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
-    if missing:
-        print(f"❌ Missing columns: {missing}")
-        return
+REQUIRED_COLUMNS = SCAFFOLD_COLUMNS
+
+def validate_scaffold(filepath, fmt=None, chunksize=200_000):
+    """Check the header and every row against the canonical scaffold schema"""
+    validator = ScaffoldValidator()
+    preview = None
+    for chunk in iter_table_chunks(filepath, chunksize, fmt=fmt, coerce=False):
+        if preview is None:
+            preview = chunk.head(1)
+        validator.check(chunk)
+    if validator.missing:
+        print(f"❌ Missing columns: {validator.missing}")
+        return False
+    if not validator.ok:
+        validator.report()
+        return False
     print(f"✅ {filepath} passed scaffold validation.")
-    print(f"🔢 Rows: {len(df)}")
-    print(df.head(1).T)
+    print(f"🔢 Rows: {validator.rows}")
+    if preview is not None:
+        print(preview.T)
+    return True
 
 if __name__ == "__main__":
-    validate_scaffold("data/david_shi_scaffold_format.csv")
+    parser = argparse.ArgumentParser(description="Validate a scaffold table")
+    parser.add_argument("path", nargs="?", default="data/david_shi_scaffold_format.csv")
+    parser.add_argument("--format", choices=["csv", "parquet", "arrow"], help="override the input format")
+    args = parser.parse_args()
+    validate_scaffold(args.path, args.format)
@@ -0,0 +1,113 @@
+"""
+Canonical David Shi scaffold schema.
+
+One definition of every scaffold column: its type, allowed values,
+format rule and the alias names other stages use for it (the Teal export
+writes ``linkedin``/``confidence_score``, for example). Stdlib only, so
+header checks never pay for a pandas import; row validation lives in
+scaffold_validator.py.
+"""
+
+import re
+from dataclasses import dataclass
+
+POSTER_TYPES = ("team_lead", "hiring_manager", "recruiter", "founder", "executive", "engineer", "unknown")
+STATUS_VALUES = ("success", "partial", "fail", "pending", "skipped")
+
+# Status columns hold a status optionally followed by a reason code, e.g. "fail:http_404"
+STATUS_PATTERN = r"(?:success|partial|fail|pending|skipped)(?::[a-z0-9_]+)?"
+# Dotted host of word characters and hyphens, optional port; "https://a.comhttps://a.com/x" fails
+URL_PATTERN = r"https?://(?:[\w-]+\.)+[\w-]+(?::\d+)?(?:[/?#]\S*)?"
+LINKEDIN_PATTERN = r"https?://(?:[a-z]{2,3}\.)?linkedin\.com/\S+"
+EMAIL_PATTERN = r"[^@\s]+@[^@\s]+\.[^@\s]+"
+TWITTER_PATTERN = r"@?[A-Za-z0-9_]{1,15}|https?://(?:www\.)?(?:twitter|x)\.com/\S+"
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    kind: str = "text"        # text | int | enum | status | url | email
+    required: bool = False    # must be non-empty on every row
+    values: tuple = ()        # allowed values for enum columns
+    pattern: str = ""         # full-match rule for non-empty values
+    minimum: int = None
+    maximum: int = None
+    aliases: tuple = ()
+    optional: bool = False    # may be absent from the header (tables written before it existed)
+
+
+SCAFFOLD_SCHEMA = (
+    Column("job_title", required=True),
+    Column("company", required=True),
+    Column("original_url", "url", required=True, pattern=URL_PATTERN),
+    Column("poster_name"),
+    Column("poster_linkedin", "url", pattern=LINKEDIN_PATTERN, aliases=("linkedin",)),
+    Column("poster_title", aliases=("title",)),
+    Column("poster_type", "enum", values=POSTER_TYPES),
+    Column("confidence", "int", minimum=0, maximum=100, aliases=("confidence_score",)),
+    Column("reason"),
+    Column("meta_scrape_status", "status", pattern=STATUS_PATTERN),
+    Column("org_search_status", "status", pattern=STATUS_PATTERN),
+    Column("poster_email", "email", pattern=EMAIL_PATTERN, aliases=("email",)),
+    Column("poster_phone"),
+    Column("poster_twitter", pattern=TWITTER_PATTERN, aliases=("twitter",)),
+    Column("poster_github", "url", pattern=URL_PATTERN, aliases=("github",)),
+    Column("contact_source"),
+    Column("location", optional=True),
+    Column("poster_location", optional=True),
+)
+
+SCAFFOLD_COLUMNS = [col.name for col in SCAFFOLD_SCHEMA]
+COLUMNS_BY_NAME = {col.name: col for col in SCAFFOLD_SCHEMA}
+ALIASES = {alias: col.name for col in SCAFFOLD_SCHEMA for alias in col.aliases}
+INT_COLUMNS = [col.name for col in SCAFFOLD_SCHEMA if col.kind == "int"]
+CATEGORY_COLUMNS = [col.name for col in SCAFFOLD_SCHEMA if col.kind in ("enum", "status")]
+
+# Column layout of the Teal export (TealJobScraper.save_to_scaffold)
+TEAL_HEADERS = [
+    'job_title', 'company', 'original_url', 'poster_name',
+    'linkedin', 'title', 'email', 'confidence_score',
+    'source', 'date_scraped', 'notes'
+]
+
+_compiled = {}
+
+
+def canonical_name(column):
+    return ALIASES.get(column, column)
+
+
+def canonical_columns(columns):
+    """Map a header onto canonical names, leaving unknown columns as they are"""
+    return [canonical_name(col) for col in columns]
+
+
+def missing_columns(columns):
+    present = set(canonical_columns(columns))
+    return [col.name for col in SCAFFOLD_SCHEMA if col.name not in present and not col.optional]
+
+
+def check_value(column, value):
+    """Error code for a single value of a canonical column, or "" if it is valid"""
+    col = COLUMNS_BY_NAME[column]
+    value = "" if value is None else str(value).strip()
+    if not value:
+        return "required" if col.required else ""
+    if col.kind == "int":
+        try:
+            number = float(value)
+        except ValueError:
+            return "not_integer"
+        if not number.is_integer():
+            return "not_integer"
+        if (col.minimum is not None and number < col.minimum) or (col.maximum is not None and number > col.maximum):
+            return "out_of_range"
+        return ""
+    if col.values and value not in col.values:
+        return "invalid_value"
+    if col.pattern:
+        if col.pattern not in _compiled:
+            _compiled[col.pattern] = re.compile(col.pattern)
+        if not _compiled[col.pattern].fullmatch(value):
+            return "invalid_format"
+    return ""
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Vectorized validation of scaffold tables against scaffold_schema.
+
+Each rule is one column-wide pandas operation, so validating a chunk
+costs a handful of vectorized passes rather than a Python loop per row.
+A ScaffoldValidator accumulates results across chunks: stages that
+already hold a DataFrame call check() inline, and validate_file()
+streams a stored table without loading it whole.
+
+    python scripts/scaffold_validator.py output/rss_jobs_scaffold.csv --errors 20
+"""
+
+import argparse
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+import metrics
+from scaffold_schema import SCAFFOLD_SCHEMA, canonical_name, missing_columns
+from storage import iter_table_chunks
+
+MAX_SAMPLE_ERRORS = 1000
+ERROR_COLUMNS = ["row", "column", "code", "value"]
+
+
+def normalize_columns(df):
+    """Rename alias columns (linkedin, confidence_score, ...) to canonical names"""
+    renames = {col: canonical_name(col) for col in df.columns if canonical_name(col) != col}
+    renames = {old: new for old, new in renames.items() if new not in df.columns}
+    return df.rename(columns=renames) if renames else df
+
+
+def _as_text(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    if not isinstance(series.dtype, pd.StringDtype):
+        series = series.astype("string")
+    return series
+
+
+def column_errors(series, col):
+    """Boolean masks of rule violations for one column, keyed by error code"""
+    masks = {}
+    if col.kind == "int":
+        numeric = pd.to_numeric(series, errors="coerce")
+        present = series.notna() & (series.astype("string").str.strip() != "")
+        if col.required:
+            masks["required"] = ~present.fillna(False)
+        not_int = present & (numeric.isna() | (numeric != numeric.round()))
+        masks["not_integer"] = not_int.fillna(True) & present
+        in_range = pd.Series(True, index=series.index)
+        if col.minimum is not None:
+            in_range &= numeric >= col.minimum
+        if col.maximum is not None:
+            in_range &= numeric <= col.maximum
+        masks["out_of_range"] = present & ~masks["not_integer"] & ~in_range.fillna(False)
+        return masks
+
+    text = _as_text(series)
+    stripped = text.str.strip()
+    present = (stripped.notna() & (stripped != "")).fillna(False).astype(bool)
+    if col.required:
+        masks["required"] = ~present
+    if col.values:
+        masks["invalid_value"] = present & ~stripped.isin(col.values)
+    if col.pattern:
+        matched = stripped.str.fullmatch(col.pattern).fillna(False).astype(bool)
+        masks["invalid_format"] = present & ~matched
+    return masks
+
+
+class ScaffoldValidator:
+    def __init__(self, max_sample_errors=MAX_SAMPLE_ERRORS):
+        self.max_sample_errors = max_sample_errors
+        self.rows = 0
+        self.missing = None
+        self.counts = Counter()
+        self.error_rows = 0
+        self.samples = []
+        self._sampled = 0
+
+    @property
+    def ok(self):
+        return not self.missing and not self.error_rows
+
+    def check(self, df):
+        """Validate one chunk; row numbers continue from earlier chunks"""
+        df = normalize_columns(df)
+        offset = self.rows
+        self.rows += len(df)
+        if self.missing is None:
+            self.missing = missing_columns(df.columns)
+
+        bad_rows = np.zeros(len(df), dtype=bool)
+        for col in SCAFFOLD_SCHEMA:
+            if col.name not in df.columns:
+                continue
+            series = df[col.name]
+            for code, mask in column_errors(series, col).items():
+                mask = mask.to_numpy(dtype=bool)
+                hits = int(mask.sum())
+                if not hits:
+                    continue
+                self.counts[(col.name, code)] += hits
+                bad_rows |= mask
+                room = self.max_sample_errors - self._sampled
+                if room > 0:
+                    positions = np.flatnonzero(mask)[:room]
+                    self.samples.append(pd.DataFrame({
+                        "row": positions + offset,
+                        "column": col.name,
+                        "code": code,
+                        "value": series.iloc[positions].astype("string").to_numpy(),
+                    }))
+                    self._sampled += len(positions)
+        bad = int(bad_rows.sum())
+        self.error_rows += bad
+        metrics.inc("rows_validated_total", len(df))
+        metrics.inc("rows_invalid_total", bad)
+        return bad_rows
+
+    def errors(self):
+        """Sampled per-row errors (up to max_sample_errors) as a DataFrame"""
+        if not self.samples:
+            return pd.DataFrame(columns=ERROR_COLUMNS)
+        return pd.concat(self.samples, ignore_index=True).sort_values(["row", "column"], kind="stable")
+
+    def report(self, show_errors=5):
+        if self.missing:
+            print(f"❌ Missing columns: {self.missing}")
+        if self.error_rows:
+            print(f"❌ {self.error_rows} of {self.rows} rows have errors")
+            for (column, code), count in sorted(self.counts.items()):
+                print(f"   {column}: {code} × {count}")
+            for row in self.errors().head(show_errors).itertuples(index=False):
+                print(f"   row {row.row}: {row.column} {row.code} ({row.value!r})")
+
+
+def validate_frame(df):
+    validator = ScaffoldValidator()
+    validator.check(df)
+    return validator
+
+
+def validate_file(path, chunksize=200_000, fmt=None):
+    """Stream a stored scaffold table through the validator"""
+    validator = ScaffoldValidator()
+    for chunk in iter_table_chunks(path, chunksize, fmt=fmt, coerce=False):
+        validator.check(chunk)
+    return validator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate scaffold rows against the canonical schema")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "parquet", "arrow"])
+    parser.add_argument("--chunksize", type=int, default=200_000)
+    parser.add_argument("--errors", type=int, default=5, help="number of row errors to print")
+    args = parser.parse_args()
+
+    validator = validate_file(args.path, args.chunksize, args.format)
+    validator.report(args.errors)
+    if validator.ok:
+        print(f"✅ {args.path}: {validator.rows} rows passed scaffold validation.")
+    raise SystemExit(0 if validator.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
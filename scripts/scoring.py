@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Lead-confidence scoring for scaffold tables.
+
+Scores every row of a table at once from column operations:
+
+- title:     token overlap between job_title and poster_title
+- org_title: share of the job's org words (company, plus the part of
+             job_title after " – ", "," or "|") that poster_title names;
+             words are cut to five letters, so "Infra" meets "Infrastructure"
+- team:      job and poster title fall in the same team (see org_cache.TEAMS)
+- location:  location matches poster_location (only on rows where both
+             name a known region)
+- type:      how close poster_type is to the hiring decision
+- org/meta:  org_search_status / meta_scrape_status succeeded (partial counts half)
+- contact:   a LinkedIn profile or email to reach the poster
+
+Each feature is worth a configurable number of points (DEFAULT_WEIGHTS,
+summing to 100); features whose columns are missing are left out and the
+rest rescaled, as is a feature a row has no data for (NaN). Text features are computed once per distinct value and
+broadcast with factorize, so cost grows with the number of distinct
+titles, not rows.
+
+The reason column gets a compact code, e.g.
+"auto|title=40|orgt=60|team|type=team_lead|org+|li". Rows scored by hand (a
+confidence plus a free-text reason) are kept unless --rescore-manual.
+
+    python scripts/scoring.py output/rss_jobs_scaffold.csv -o output/rss_jobs_scaffold_scored.csv
+    python scripts/scoring.py data/david_shi_scaffold_format.csv --weight title=40 --weight type=10
+"""
+
+import argparse
+import json
+import re
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dedup import normalize_company, normalize_title, text_words
+from org_cache import team_key
+from scaffold_validator import normalize_columns
+from storage import TableWriter, iter_table_chunks
+
+CHUNK_SIZE = 200_000
+AUTO_PREFIX = "auto|"
+
+DEFAULT_WEIGHTS = {
+    "title": 25,
+    "org_title": 10,
+    "team": 10,
+    "location": 10,
+    "type": 20,
+    "org": 15,
+    "meta": 5,
+    "contact": 5,
+}
+
+# Share of the "type" points for each poster_type
+POSTER_TYPE_FACTORS = {
+    "hiring_manager": 1.0,
+    "team_lead": 1.0,
+    "recruiter": 0.7,
+    "founder": 0.6,
+    "engineer": 0.5,
+    "executive": 0.4,
+    "unknown": 0.1,
+}
+STATUS_FACTORS = {"success": 1.0, "partial": 0.5}
+# Where the role ends and the org begins: "Software Engineer – AIGC Infrastructure, TikTok"
+ORG_SEPARATOR = re.compile(r"\s[–—-]\s|[,|(@]")
+ORG_STEM = 5
+STOPWORDS = {"a", "an", "and", "at", "for", "in", "of", "on", "the", "to", "with", "remote", "lead", "head"}
+REGIONS = {
+    "us": "us", "usa": "us", "united states": "us", "america": "us", "canada": "ca", "uk": "uk",
+    "united kingdom": "uk", "london": "uk", "europe": "eu", "eu": "eu", "germany": "eu", "berlin": "eu",
+    "worldwide": "any", "anywhere": "any", "global": "any", "remote": "any",
+}
+
+_TYPE_CODES = {name: i + 1 for i, name in enumerate(POSTER_TYPE_FACTORS)}
+_TYPE_NAMES = {code: name for name, code in _TYPE_CODES.items()}
+
+try:
+    _popcount = np.bitwise_count
+except AttributeError:  # numpy < 2.0
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(values):
+        return _BYTE_COUNTS[values.view(np.uint8)].reshape(len(values), 8).sum(axis=1)
+
+
+def _per_value(series, fn, dtype):
+    """Apply fn to each distinct value of a column and broadcast the results"""
+    codes, uniques = pd.factorize(series.astype(object).where(series.notna(), ""), sort=False)
+    values = np.fromiter((fn(value) for value in uniques), dtype=dtype, count=len(uniques))
+    return values[codes]
+
+
+def title_signature(title):
+    """64-bit set of a title's content words (hashed, abbreviations expanded)"""
+    bits = 0
+    for word in normalize_title(title).split():
+        if word not in STOPWORDS:
+            bits |= 1 << (zlib.crc32(word.encode("utf-8")) & 63)
+    return bits
+
+
+def _stem_bits(words):
+    bits = 0
+    for word in words:
+        if word not in STOPWORDS:
+            bits |= 1 << (zlib.crc32(word[:ORG_STEM].encode("utf-8")) & 63)
+    return bits
+
+
+def org_signature(job_title):
+    """64-bit set of the stemmed words after a job title's first separator (0 if it has none)"""
+    parts = ORG_SEPARATOR.split(str(job_title or ""), maxsplit=1)
+    return _stem_bits(normalize_title(parts[1]).split()) if len(parts) > 1 else 0
+
+
+def region(location):
+    text = " ".join(text_words(location))
+    for name, code in REGIONS.items():
+        if f" {name} " in f" {text} ":
+            return code
+    return ""
+
+
+def _status_factor(series):
+    return _per_value(series, lambda s: STATUS_FACTORS.get(str(s).split(":", 1)[0], 0.0), np.float64)
+
+
+def _column(df, name):
+    return df[name] if name in df.columns else None
+
+
+def _present(series):
+    if series is None:
+        return None
+    return (series.notna() & (series.astype("string").str.strip() != "")).to_numpy(dtype=bool)
+
+
+def features(df):
+    """Per-row feature values in [0, 1] for every feature whose columns exist; NaN where a row has no data"""
+    out = {}
+    job_title, poster_title = _column(df, "job_title"), _column(df, "poster_title")
+    if job_title is not None and poster_title is not None:
+        job_sig = _per_value(job_title, title_signature, np.uint64)
+        poster_sig = _per_value(poster_title, title_signature, np.uint64)
+        union = _popcount(job_sig | poster_sig)
+        out["title"] = np.divide(_popcount(job_sig & poster_sig), union, out=np.zeros(len(df)), where=union > 0)
+        org_sig = _per_value(job_title, org_signature, np.uint64)
+        company = _column(df, "company")
+        if company is not None:
+            org_sig |= _per_value(company, lambda c: _stem_bits(normalize_company(c).split()), np.uint64)
+        poster_stems = _per_value(poster_title, lambda t: _stem_bits(normalize_title(t).split()), np.uint64)
+        org_words = _popcount(org_sig)
+        out["org_title"] = np.divide(_popcount(org_sig & poster_stems), org_words, out=np.zeros(len(df)),
+                                     where=org_words > 0)
+        teams = {}
+        job_team = _per_value(job_title, lambda t: teams.setdefault(team_key(t), len(teams)), np.int32)
+        poster_team = _per_value(poster_title, lambda t: teams.setdefault(team_key(t), len(teams)), np.int32)
+        general = teams.get("general", -1)
+        out["team"] = ((job_team == poster_team) & (job_team != general)).astype(np.float64)
+    location, poster_location = _column(df, "location"), _column(df, "poster_location")
+    if location is not None and poster_location is not None:
+        regions = {"": 0}
+        job_region = _per_value(location, lambda s: regions.setdefault(region(s), len(regions)), np.int32)
+        poster_region = _per_value(poster_location, lambda s: regions.setdefault(region(s), len(regions)), np.int32)
+        anywhere = regions.get("any", -1)
+        match = ((job_region == poster_region) | (job_region == anywhere)).astype(np.float64)
+        out["location"] = np.where((job_region != 0) & (poster_region != 0), match, np.nan)
+    if "poster_type" in df.columns:
+        out["type"] = _per_value(df["poster_type"], lambda t: POSTER_TYPE_FACTORS.get(t, 0.0), np.float64)
+    if "org_search_status" in df.columns:
+        out["org"] = _status_factor(df["org_search_status"])
+    if "meta_scrape_status" in df.columns:
+        out["meta"] = _status_factor(df["meta_scrape_status"])
+    linkedin, email = _present(_column(df, "poster_linkedin")), _present(_column(df, "poster_email"))
+    if linkedin is not None or email is not None:
+        zeros = np.zeros(len(df), dtype=bool)
+        out["contact"] = ((linkedin if linkedin is not None else zeros)
+                          | (email if email is not None else zeros)).astype(np.float64)
+    return out
+
+
+def _reason_codes(df, feats):
+    """Compact reason per row, rendered once per distinct feature combination"""
+    n = len(df)
+    key = np.zeros(n, dtype=np.int64)
+    if "title" in feats:
+        key |= np.rint(feats["title"] * 10).astype(np.int64)                   # bits 0-3
+    if "team" in feats:
+        key |= feats["team"].astype(np.int64) << 4
+    if "location" in feats:
+        key |= (feats["location"] == 1).astype(np.int64) << 5
+    if "poster_type" in df.columns:
+        key |= _per_value(df["poster_type"], lambda t: _TYPE_CODES.get(t, 0), np.int64) << 6   # bits 6-8
+    for shift, name in ((9, "org"), (11, "meta")):
+        if name in feats:
+            key |= (feats[name] * 2).astype(np.int64) << shift                  # 0, 1 (partial), 2
+    linkedin, email = _present(_column(df, "poster_linkedin")), _present(_column(df, "poster_email"))
+    if linkedin is not None:
+        key |= linkedin.astype(np.int64) << 13
+    if email is not None:
+        key |= email.astype(np.int64) << 14
+    if "org_title" in feats:
+        key |= np.rint(feats["org_title"] * 10).astype(np.int64) << 15         # bits 15-18
+
+    def render(k):
+        parts = []
+        if "title" in feats:
+            parts.append(f"title={(k & 15) * 10}")
+        if "org_title" in feats:
+            parts.append(f"orgt={(k >> 15 & 15) * 10}")
+        if k >> 4 & 1:
+            parts.append("team")
+        if k >> 5 & 1:
+            parts.append("loc")
+        if k >> 6 & 7:
+            parts.append(f"type={_TYPE_NAMES[k >> 6 & 7]}")
+        for shift, name in ((9, "org"), (11, "meta")):
+            level = k >> shift & 3
+            if level:
+                parts.append(name + ("+" if level == 2 else "~"))
+        if k >> 13 & 1:
+            parts.append("li")
+        if k >> 14 & 1:
+            parts.append("email")
+        return AUTO_PREFIX + "|".join(parts)
+
+    codes, uniques = pd.factorize(key)
+    return np.array([render(int(k)) for k in uniques], dtype=object)[codes]
+
+
+def score_frame(df, weights=None, rescore_manual=False):
+    """Return df with confidence (0-100) and reason filled in for every row"""
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    unknown = set(weights) - set(DEFAULT_WEIGHTS)
+    if unknown:
+        raise ValueError(f"Unknown scoring features: {sorted(unknown)}")
+    df = normalize_columns(df)
+    feats = features(df)
+    total, points = np.zeros(len(df)), np.zeros(len(df))
+    for name, values in feats.items():
+        known = ~np.isnan(values)
+        total += weights[name] * known
+        points += weights[name] * np.where(known, values, 0.0)
+    scaled = np.divide(points * 100, total, out=np.zeros(len(df)), where=total > 0)
+    confidence = np.clip(np.rint(scaled), 0, 100).astype(np.int64)
+    reason = _reason_codes(df, feats)
+
+    has_contact = np.zeros(len(df), dtype=bool)
+    for col in ("poster_name", "poster_linkedin", "poster_email"):
+        present = _present(_column(df, col))
+        if present is not None:
+            has_contact |= present
+    confidence[~has_contact] = 0
+    reason[~has_contact] = AUTO_PREFIX + "no_contact"
+
+    scored = pd.DataFrame({"confidence": pd.array(confidence, dtype="Int64"), "reason": reason}, index=df.index)
+    if not rescore_manual and "confidence" in df.columns and "reason" in df.columns:
+        old_reason = df["reason"].astype("string")
+        manual = (df["confidence"].notna() & old_reason.notna() & (old_reason.str.strip() != "")
+                  & ~old_reason.str.startswith(AUTO_PREFIX).fillna(False)).to_numpy(dtype=bool)
+        if manual.any():
+            scored.loc[manual, "confidence"] = pd.to_numeric(df["confidence"], errors="coerce")[manual].astype("Int64")
+            scored.loc[manual, "reason"] = df["reason"].astype(object)[manual]
+    return df.assign(confidence=scored["confidence"], reason=scored["reason"].astype("string"))
+
+
+def score_file(input_path, output_path, weights=None, rescore_manual=False, chunksize=CHUNK_SIZE, fmt=None):
+    """Stream a scaffold table through score_frame; returns (rows, seconds)"""
+    started = time.perf_counter()
+    with TableWriter(output_path, fmt) as writer:
+        for chunk in iter_table_chunks(input_path, chunksize):
+            writer.write(score_frame(chunk, weights, rescore_manual))
+    return writer.rows, time.perf_counter() - started
+
+
+def parse_weights(path=None, overrides=()):
+    weights = {}
+    if path:
+        weights.update(json.loads(Path(path).read_text(encoding="utf-8")))
+    for item in overrides:
+        name, _, value = item.partition("=")
+        weights[name.strip()] = float(value)
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute lead confidence and coded reasons for a scaffold table")
+    parser.add_argument("input", help="scaffold table (.csv, .parquet or .arrow)")
+    parser.add_argument("-o", "--output", help="scored table (default: <input>_scored)")
+    parser.add_argument("--weights", help="JSON file of feature -> points")
+    parser.add_argument("--weight", action="append", default=[], metavar="FEATURE=POINTS",
+                        help=f"override one weight ({', '.join(DEFAULT_WEIGHTS)})")
+    parser.add_argument("--rescore-manual", action="store_true", help="also overwrite hand-scored rows")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--format", choices=["csv", "parquet", "arrow"], help="override the output format")
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    output = Path(args.output or input_path.with_name(f"{input_path.stem}_scored{input_path.suffix}"))
+    rows, elapsed = score_file(input_path, output, parse_weights(args.weights, args.weight),
+                               args.rescore_manual, args.chunksize, args.format)
+    rate = rows / elapsed if elapsed else 0
+    print(f"✅ Scored {rows} rows into {output} in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
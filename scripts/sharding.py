@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Sharded multi-process execution for large scaffold tables.
+
+Rows are partitioned into N shards by a hash of their normalized company
+(or canonical URL), so every posting of a company lands in the same
+shard. Each shard goes to a worker process as an Arrow IPC stream in a
+shared-memory block, and the worker hands its result back the same way:
+no DataFrame is pickled, and blocks are read in place rather than copied
+out. Results are merged in input row order, so the
+output does not depend on the number of shards or on which worker
+finished first.
+
+Operations are module-level functions of a DataFrame (see OPERATIONS):
+row operations (convert, score) return one row per input row, aggregate
+operations (validate) return partial counts that are summed.
+
+    python scripts/sharding.py score output/rss_jobs_scaffold.csv -o output/scored.parquet --workers 8
+    python scripts/sharding.py validate output/rss_jobs_scaffold.csv --shards 16 --key original_url
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from dedup import normalize_company
+from storage import _require_pyarrow, apply_scaffold_dtypes, read_table, string_dtype, write_table
+from urls import canonical_url
+
+ROW_COLUMN = "_row"
+KEY_NORMALIZERS = {"company": normalize_company, "original_url": canonical_url}
+
+
+def convert_shard(df):
+    from rss_to_scaffold import convert_to_scaffold
+
+    return convert_to_scaffold(df)
+
+
+def score_shard(df):
+    from scoring import score_frame
+
+    return score_frame(df)
+
+
+def validate_shard(df):
+    """Partial validation counts: one row per (column, code), plus totals under column "*" """
+    from scaffold_validator import ScaffoldValidator
+
+    validator = ScaffoldValidator(max_sample_errors=0)
+    validator.check(df)
+    counts = [(col, code, n) for (col, code), n in validator.counts.items()]
+    counts += [("*", "rows", validator.rows), ("*", "error_rows", validator.error_rows)]
+    return pd.DataFrame(counts, columns=["column", "code", "count"])
+
+
+# name -> (function, kind); "rows" results are re-ordered to the input, "sum" results are added up
+OPERATIONS = {
+    "convert": (convert_shard, "rows"),
+    "score": (score_shard, "rows"),
+    "validate": (validate_shard, "sum"),
+}
+
+
+def shard_ids(df, key="company", shards=8):
+    """Shard number of every row: a stable hash of the normalized key column"""
+    normalize = KEY_NORMALIZERS.get(key, lambda value: value)
+    codes, uniques = pd.factorize(df[key], sort=False)
+    # Missing keys (code -1) hash like an empty string, in the last slot
+    normalized = np.array([str(normalize(value)) for value in uniques] + [""], dtype=object)
+    hashes = pd.util.hash_array(normalized)
+    return (hashes % np.uint64(shards)).astype(np.int64)[codes]
+
+
+def partition(df, key="company", shards=8):
+    """Split df into shards (keeping each row's input position in _row)"""
+    ids = shard_ids(df, key, shards)
+    df = df.reset_index(drop=True).assign(**{ROW_COLUMN: np.arange(len(df))})
+    order = np.argsort(ids, kind="stable")
+    bounds = np.searchsorted(ids[order], np.arange(shards + 1))
+    return [df.iloc[order[bounds[i]:bounds[i + 1]]] for i in range(shards)]
+
+
+def to_shared_memory(df):
+    """Write df as an Arrow IPC stream into a new shared-memory block; returns (name, size)"""
+    _require_pyarrow()
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Size the stream first, then serialize straight into the block
+    mock = pa.MockOutputStream()
+    with pa.ipc.new_stream(mock, table.schema) as writer:
+        writer.write_table(table)
+    size = mock.size()
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        sink = pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf))
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        sink.close()
+        del sink, writer  # release the view of shm.buf so the block can close
+    finally:
+        shm.close()
+    return shm.name, size
+
+
+@contextmanager
+def shared_table(name, size, unlink=False):
+    """
+    Open a block written by to_shared_memory as an Arrow table, without copying it.
+
+    The table's buffers, and frames converted from it, point into the
+    block: drop them before the with block ends, or closing the block
+    raises BufferError. After an error the block is left to the GC.
+    """
+    _require_pyarrow()
+    import pyarrow as pa
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf[:size]
+        yield pa.ipc.open_stream(pa.py_buffer(view)).read_all()
+        view.release()
+        shm.close()
+    finally:
+        if unlink:
+            shm.unlink()
+
+
+def _to_frame(table):
+    import pyarrow as pa
+
+    strings = {pa.string(): string_dtype(), pa.large_string(): string_dtype()}
+    return table.to_pandas(types_mapper=strings.get)
+
+
+def _run_shard(op, name, size):
+    fn, kind = OPERATIONS[op]
+    with shared_table(name, size) as table:
+        df = _to_frame(table)
+        rows = df.pop(ROW_COLUMN).to_numpy()
+        result = fn(apply_scaffold_dtypes(df))
+        if kind == "rows":
+            result = result.reset_index(drop=True).assign(**{ROW_COLUMN: rows})
+        block = to_shared_memory(result)
+        # All of these may still point into the input block
+        del table, df, rows, result
+    return block
+
+
+def _unlink(names):
+    for name in names:
+        try:
+            shared_memory.SharedMemory(name=name).unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ShardedRunner:
+    def __init__(self, shards=None, workers=None, key="company"):
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers
+        self.key = key
+
+    def run(self, op, df):
+        """Apply OPERATIONS[op] to every shard of df in worker processes and merge the results"""
+        _, kind = OPERATIONS[op]
+        blocks, outputs, error = [], [], None
+        try:
+            for shard in partition(df, self.key, self.shards):
+                if len(shard):
+                    blocks.append(to_shared_memory(shard))
+            with ProcessPoolExecutor(max_workers=min(self.workers, max(len(blocks), 1))) as pool:
+                futures = [pool.submit(_run_shard, op, name, size) for name, size in blocks]
+                # Collected in shard order, whatever order the workers finish in
+                for future in futures:
+                    try:
+                        outputs.append(future.result())
+                    except Exception as e:
+                        error = error or e
+        finally:
+            _unlink(name for name, _ in blocks)
+        if error is not None:
+            _unlink(name for name, _ in outputs)
+            raise error
+        return self._merge(kind, outputs)
+
+    def _merge(self, kind, outputs):
+        """Merge and unlink the result blocks; the merge itself copies the rows out of them"""
+        if not outputs:
+            return pd.DataFrame()
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        with ExitStack() as stack:
+            tables = [stack.enter_context(shared_table(name, size, unlink=True)) for name, size in outputs]
+            table = pa.concat_tables(tables, promote_options="permissive")
+            del tables
+            if kind == "sum":
+                keys = [c for c in table.column_names if c != "count"]
+                merged = _to_frame(table).groupby(keys, sort=True, as_index=False)["count"].sum()
+            else:
+                # take() writes every column into new buffers, in input row order
+                table = table.take(pc.sort_indices(table[ROW_COLUMN])).drop_columns([ROW_COLUMN])
+                merged = apply_scaffold_dtypes(_to_frame(table))
+            del table
+        return merged
+
+
+def print_validation(counts):
+    totals = counts[counts["column"] == "*"].set_index("code")["count"]
+    errors = counts[counts["column"] != "*"]
+    rows, bad = int(totals.get("rows", 0)), int(totals.get("error_rows", 0))
+    if not bad:
+        print(f"✅ {rows} scaffold rows passed validation.")
+        return
+    print(f"❌ {bad} of {rows} rows have errors")
+    for row in errors.itertuples(index=False):
+        print(f"   {row.column}: {row.code} × {row.count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a scaffold stage over hash-partitioned shards in parallel")
+    parser.add_argument("op", choices=sorted(OPERATIONS))
+    parser.add_argument("input", help="scaffold or job table (.csv, .parquet or .arrow)")
+    parser.add_argument("-o", "--output", help="output table for row operations (default: <input>_<op>)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--shards", type=int, help="number of shards (default: one per worker)")
+    parser.add_argument("--key", default="company", help="column to shard on (company or original_url)")
+    args = parser.parse_args()
+
+    runner = ShardedRunner(args.shards, args.workers, args.key)
+    started = time.perf_counter()
+    df = read_table(args.input)
+    loaded = time.perf_counter()
+    result = runner.run(args.op, df)
+    elapsed = time.perf_counter() - loaded
+    print(f"⚡ {args.op} over {runner.shards} shards / {runner.workers} workers: {len(df)} rows in {elapsed:.2f}s"
+          f" ({len(df) / elapsed if elapsed else 0:,.0f} rows/s, load {loaded - started:.2f}s)")
+    if OPERATIONS[args.op][1] == "sum":
+        print_validation(result)
+        return
+    input_path = Path(args.input)
+    output = Path(args.output or input_path.with_name(f"{input_path.stem}_{args.op}{input_path.suffix}"))
+    write_table(result, output)
+    print(f"✅ Wrote {len(result)} rows to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Source adapters for the job feeds pulled by pull_rss.py.
+
+Each adapter knows how to request its feed and how to turn the raw
+payload into normalized job records (records.JobRecord). Records are
+yielded one posting at a time from an incremental JSON reader, so a
+feed never has to be held in memory as a parsed document.
+"""
+
+import codecs
+import json
+import re
+
+from fetch_engine import FetchRequest
+from records import JOB_FIELDS, JobRecord
+from urls import clean_url
+
+ADAPTERS = {}
+
+# Characters that can continue a number, so a value followed only by
+# these at the end of the buffer may have been cut off mid-number
+_NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+
+
+def register_adapter(cls):
+    """Class decorator that adds an adapter instance to ADAPTERS"""
+    ADAPTERS[cls.name] = cls()
+    return cls
+
+
+class _JsonStream:
+    """Minimal pull reader over a binary file of JSON text"""
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            self.buf += self.text_decoder.decode(b"", final=True)
+            return False
+        # Drop consumed text before growing the buffer
+        self.buf = self.buf[self.pos:] + self.text_decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON payload")
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {self.buf[self.pos]!r}")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number cut mid-chunk decodes as its prefix ("1." -> 1), so
+            # read on while only number characters are left in the buffer
+            if not self.eof and _NUMBER_TAIL.match(self.buf, end) and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(fp, key=None, chunk_size=64 * 1024):
+    """
+    Yield the items of a JSON array one at a time.
+
+    With ``key`` the array is looked up under that key of a top-level
+    object; otherwise the document itself must be an array.
+    """
+    stream = _JsonStream(fp, chunk_size)
+
+    if key is not None:
+        stream.expect("{")
+        while True:
+            if stream.peek() == "}":
+                return
+            name = stream.value()
+            stream.expect(":")
+            if name == key:
+                break
+            stream.value()
+            if stream.peek() == ",":
+                stream.pos += 1
+
+    stream.expect("[")
+    if stream.peek() == "]":
+        return
+    while True:
+        yield stream.value()
+        if stream.peek() == ",":
+            stream.pos += 1
+        else:
+            stream.expect("]")
+            return
+
+
+class SourceAdapter:
+    name = ""
+    label = ""
+    url = ""
+    headers = {}
+    timeout = 30
+    items_key = None  # Key holding the posting array, None for a top-level array
+    skip_items = 0    # Leading array items that are not postings
+
+    def request(self):
+        return FetchRequest(
+            name=self.name,
+            url=self.url,
+            headers=dict(self.headers),
+            timeout=self.timeout,
+            spool=True,
+        )
+
+    def records(self, fp, seen=None, archive=None):
+        """
+        Yield normalized job records from a binary payload file.
+
+        With a SeenIndex only postings whose ID has not been seen before
+        are normalized and yielded. With a FeedArchive every raw posting
+        is archived first, seen or not (the archive skips unchanged ones).
+        """
+        for i, raw in enumerate(iter_json_array(fp, self.items_key)):
+            if i < self.skip_items or not isinstance(raw, dict):
+                continue
+            posting_id = self.posting_id(raw)
+            if archive is not None:
+                archive.add(self.name, posting_id, raw)
+            if seen is not None and posting_id and not seen.check_and_add(self.name, posting_id):
+                continue
+            record = self.normalize(raw)
+            if record:
+                yield record
+
+    def posting_id(self, raw):
+        """Stable ID of a raw posting, empty if the feed has none"""
+        return str(raw.get("id") or "")
+
+    def normalize(self, raw):
+        raise NotImplementedError
+
+
+@register_adapter
+class RemotiveAdapter(SourceAdapter):
+    name = "remotive"
+    label = "Remotive"
+    url = "https://remotive.io/api/remote-jobs"
+    items_key = "jobs"
+
+    def normalize(self, raw):
+        return JobRecord(
+            job_title=raw["title"],
+            company=raw["company_name"],
+            original_url=clean_url(raw["url"], "https://remotive.com"),
+            platform=self.name,
+            location=raw["candidate_required_location"],
+            post_date=raw["publication_date"],
+        )
+
+
+@register_adapter
+class RemoteOKAdapter(SourceAdapter):
+    name = "remoteok"
+    label = "RemoteOK"
+    url = "https://remoteok.com/api"
+    headers = {"User-Agent": "Mozilla/5.0"}
+    skip_items = 1  # Legal notice / metadata
+
+    def normalize(self, raw):
+        return JobRecord(
+            job_title=raw.get("position") or raw.get("title"),
+            company=raw.get("company"),
+            # The API gives site-relative paths, and sometimes absolute URLs
+            original_url=clean_url(raw.get("url", ""), "https://remoteok.com"),
+            platform=self.name,
+            location=raw.get("location", ""),
+            post_date=raw.get("date", ""),
+        )
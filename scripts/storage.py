@@ -0,0 +1,255 @@
+"""
+Storage layer for scaffold tables.
+
+Tables can be stored as CSV, Parquet or Arrow IPC (Feather v2); the
+format follows the file suffix unless given explicitly. Every read
+applies the same explicit dtypes: integer confidence, categorical
+poster_type/status columns and Arrow-backed strings for everything else,
+so columnar files load without re-parsing or dtype inference.
+
+pyarrow is only needed for the columnar formats.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from scaffold_schema import CATEGORY_COLUMNS as SCHEMA_CATEGORY_COLUMNS
+from scaffold_schema import INT_COLUMNS, SCAFFOLD_COLUMNS
+
+FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+CATEGORY_COLUMNS = SCHEMA_CATEGORY_COLUMNS + ["platform", "contact_source"]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError("Parquet/Arrow storage needs pyarrow: pip3 install pyarrow") from e
+
+
+def string_dtype():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.StringDtype()
+    return pd.StringDtype("pyarrow")
+
+
+def detect_format(path, fmt=None):
+    if fmt:
+        if fmt not in set(FORMATS.values()):
+            raise ValueError(f"Unknown table format: {fmt}")
+        return fmt
+    suffix = Path(path).suffix.lower()
+    if suffix not in FORMATS:
+        raise ValueError(f"Cannot infer table format from {path}; use one of {sorted(FORMATS)}")
+    return FORMATS[suffix]
+
+
+def scaffold_dtypes(columns):
+    """Explicit dtype for each of the given columns"""
+    text = string_dtype()
+    dtypes = {}
+    for col in columns:
+        if col in INT_COLUMNS:
+            dtypes[col] = "Int64"
+        elif col in CATEGORY_COLUMNS:
+            dtypes[col] = "category"
+        else:
+            dtypes[col] = text
+    return dtypes
+
+
+def apply_scaffold_dtypes(df):
+    """Cast a frame to the scaffold dtypes, leaving already-matching columns alone"""
+    for col, dtype in scaffold_dtypes(df.columns).items():
+        if col in INT_COLUMNS and df[col].dtype != "Int64":
+            df[col] = pd.to_numeric(df[col], errors="coerce").round().astype("Int64")
+        elif str(df[col].dtype) != str(dtype):
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def table_columns(path, fmt=None):
+    """Column names of a stored table without loading its rows"""
+    fmt = detect_format(path, fmt)
+    if fmt == "csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if fmt == "parquet":
+        return pq.ParquetFile(path).schema_arrow.names
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).schema.names
+
+
+def arrow_schema(columns):
+    """Arrow schema matching scaffold_dtypes, stable across chunks"""
+    import pyarrow as pa
+
+    fields = []
+    for col in columns:
+        if col in INT_COLUMNS:
+            fields.append(pa.field(col, pa.int64()))
+        elif col in CATEGORY_COLUMNS:
+            fields.append(pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+        else:
+            fields.append(pa.field(col, pa.string()))
+    return pa.schema(fields)
+
+
+def iter_table_chunks(path, chunksize=100_000, columns=None, fmt=None, coerce=True):
+    """
+    Yield a stored table as DataFrames of at most chunksize rows, with scaffold dtypes.
+
+    With coerce=False, CSV integer columns stay as text so a validator can
+    still see values that would not parse.
+    """
+    fmt = detect_format(path, fmt)
+    if fmt == "csv":
+        header = pd.read_csv(path, nrows=0).columns
+        dtypes = scaffold_dtypes(header)
+        for col in INT_COLUMNS:
+            if col in dtypes:
+                dtypes[col] = string_dtype()
+        for chunk in pd.read_csv(path, usecols=columns, dtype=dtypes, chunksize=chunksize):
+            yield apply_scaffold_dtypes(chunk) if coerce else chunk
+        return
+    _require_pyarrow()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if fmt == "parquet":
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield apply_scaffold_dtypes(batch.to_pandas())
+        return
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        for batch in table.to_batches(max_chunksize=chunksize):
+            yield apply_scaffold_dtypes(batch.to_pandas())
+
+
+class TableWriter:
+    """
+    Append DataFrame chunks to a table in any supported format.
+
+    Rows go to a temporary file that replaces the target on close, so a
+    failed run never leaves a half-written table behind. With no rows at
+    all, the target becomes an empty table with `columns` (the scaffold
+    columns by default) rather than keeping an earlier run's output.
+    """
+
+    def __init__(self, path, fmt=None, columns=None):
+        self.path = Path(path)
+        self.fmt = detect_format(path, fmt)
+        self.tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self.columns = list(columns) if columns is not None else list(SCAFFOLD_COLUMNS)
+        self.rows = 0
+        self._started = False
+        self._writer = None
+        self._sink = None
+        self._schema = None
+        if self.fmt != "csv":
+            _require_pyarrow()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.close(commit=exc_type is None)
+
+    def write(self, df):
+        self._started = True
+        if self.fmt == "csv":
+            df.to_csv(self.tmp_path, index=False, mode="a" if self.rows else "w", header=not self.rows)
+            self.rows += len(df)
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._schema is None:
+            self._schema = arrow_schema(df.columns)
+            if self.fmt == "parquet":
+                self._writer = pq.ParquetWriter(self.tmp_path, self._schema, compression="zstd")
+            else:
+                self._sink = pa.OSFile(str(self.tmp_path), "wb")
+                self._writer = pa.ipc.new_file(self._sink, self._schema)
+        table = pa.Table.from_pandas(apply_scaffold_dtypes(df.copy()), preserve_index=False)
+        self._writer.write_table(table.cast(self._schema))
+        self.rows += len(df)
+
+    def close(self, commit=True):
+        if commit and not self._started:
+            self.write(pd.DataFrame(columns=self.columns))
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+        if not self._started or not self.tmp_path.exists():
+            return
+        if commit:
+            os.replace(self.tmp_path, self.path)
+        else:
+            self.tmp_path.unlink()
+
+
+def read_table(path, columns=None, fmt=None):
+    """Read a scaffold (or job) table in any supported format with scaffold dtypes"""
+    fmt = detect_format(path, fmt)
+    if fmt == "csv":
+        header = pd.read_csv(path, nrows=0).columns
+        dtypes = scaffold_dtypes(header)
+        # Integer columns may hold blanks or floats; cast after parsing
+        csv_dtypes = {c: d for c, d in dtypes.items() if c not in INT_COLUMNS}
+        df = pd.read_csv(path, usecols=columns, dtype=csv_dtypes)
+    elif fmt == "parquet":
+        _require_pyarrow()
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        _require_pyarrow()
+        import pyarrow as pa
+
+        with pa.memory_map(str(path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        df = table.to_pandas()
+    return apply_scaffold_dtypes(df)
+
+
+def write_table(df, path, fmt=None):
+    """Write a table in the format given by fmt or the path suffix"""
+    fmt = detect_format(path, fmt)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+        return
+    _require_pyarrow()
+    df = apply_scaffold_dtypes(df.copy())
+    if fmt == "parquet":
+        df.to_parquet(path, index=False, compression="zstd")
+    else:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
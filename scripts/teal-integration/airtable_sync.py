@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+"""
+Diff-based sync of the Teal scaffold into the Airtable tracking base.
+
+Every local row becomes a teal_jobs record and every poster a contacts
+record (contacts are merged across jobs, with linked_jobs pointing at
+their job records). Each record is reduced to the fields this sync owns
+and hashed; a snapshot (SQLite) keeps the Airtable record ID and hash
+last sent for every key. A sync only sends records whose hash changed:
+new keys are created, changed ones patched, and with --prune keys that
+left the scaffold are deleted. Fields people edit in Airtable (status,
+outreach_sent, response_received) are never sent, so they survive.
+
+Requests carry the Airtable maximum of 10 records, run on a few threads
+under a token bucket at the base's 5 requests/s limit, and back off on
+429 (Retry-After, else 30 s as Airtable asks) and 5xx. Jobs go first so
+contacts' linked_jobs resolve to record IDs in one snapshot lookup. The
+snapshot is committed after every successful request, so an interrupted
+sync resumes without creating duplicates. A re-sync of an unchanged
+scaffold makes no calls at all.
+
+FakeAirtable is an in-process stand-in for the REST API (same limits,
+429s and record-link checks) for offline runs and benchmarks.
+
+    AIRTABLE_TOKEN=... python scripts/teal-integration/airtable_sync.py output/teal_jobs_scaffold.csv --base appXXXX
+    python scripts/teal-integration/airtable_sync.py output/teal_jobs_scaffold.csv --fake
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import metrics  # noqa: E402
+from enrichment import TokenBucket  # noqa: E402
+from job_store import contact_key, job_key  # noqa: E402
+from mcp_processor import AIRTABLE_SCHEMA  # noqa: E402
+from scaffold_schema import canonical_name  # noqa: E402
+
+API_URL = "https://api.airtable.com/v0"
+SNAPSHOT_PATH = Path("output/airtable_snapshot.sqlite")
+FAKE_STATE_PATH = Path("output/fake_airtable.json")
+JOBS_TABLE = "teal_jobs"
+CONTACTS_TABLE = "contacts"
+MAX_RECORDS = 10            # Airtable's per-request limit for create/update/delete
+RATE = 5.0                  # requests per second per base
+WORKERS = 4
+RETRIES = 5
+RATE_LIMIT_WAIT = 30.0      # Airtable asks clients to wait 30 s after a 429
+SQL_IN_LIMIT = 500
+
+# Airtable field -> scaffold column (canonical names, so Teal aliases such as linkedin work)
+JOB_FIELDS = {
+    "job_title": "job_title",
+    "company": "company",
+    "original_url": "original_url",
+    "poster_name": "poster_name",
+    "linkedin": "poster_linkedin",
+    "title": "poster_title",
+    "email": "poster_email",
+    "confidence_score": "confidence",
+    "source": "source",
+    "date_scraped": "date_scraped",
+    "notes": "notes",
+}
+CONTACT_FIELDS = {
+    "name": "poster_name",
+    "linkedin": "poster_linkedin",
+    "email": "poster_email",
+    "title": "poster_title",
+    "company": "company",
+    "confidence_score": "confidence",
+}
+
+
+class AirtableError(Exception):
+    """A request Airtable rejected (4xx other than 429), or one that kept failing"""
+
+    def __init__(self, status, message):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+
+def _value(column, value):
+    """Field value as sent to Airtable; None clears the field"""
+    value = "" if value is None else str(value).strip()
+    if not value:
+        return None
+    if column == "confidence":
+        try:
+            return int(float(value))
+        except ValueError:
+            return None
+    if column == "date_scraped":
+        return value[:10]
+    return value
+
+
+def record_hash(fields):
+    return hashlib.blake2b(
+        json.dumps(fields, sort_keys=True, separators=(",", ":")).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def build_records(rows):
+    """({job key: fields}, {contact key: (fields, job keys)}) from scaffold rows"""
+    jobs, contacts = {}, {}
+    for raw in rows:
+        row = {canonical_name(k): v for k, v in raw.items()}
+        row.setdefault("source", row.get("platform"))
+        key = job_key(row)
+        jobs[key] = {field: _value(column, row.get(column)) for field, column in JOB_FIELDS.items()}
+        ckey = contact_key(row)
+        if ckey is None:
+            continue
+        fields = {field: _value(column, row.get(column)) for field, column in CONTACT_FIELDS.items()}
+        if ckey in contacts:
+            merged, job_keys = contacts[ckey]
+            for field, value in fields.items():
+                if field == "confidence_score" and value is not None:
+                    merged[field] = max(merged[field] or 0, value)
+                elif merged[field] is None:
+                    merged[field] = value
+            job_keys.add(key)
+        else:
+            contacts[ckey] = (fields, {key})
+    return jobs, contacts
+
+
+class AirtableClient:
+    def __init__(self, base_id, token, api_url=API_URL, rate=RATE, retries=RETRIES,
+                 rate_limit_wait=RATE_LIMIT_WAIT, backoff=1.0, timeout=30, pool_size=WORKERS):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.base_url = f"{api_url.rstrip('/')}/{base_id}"
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": f"Bearer {token}", "Content-Type": "application/json"})
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=pool_size))
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+        self.bucket = TokenBucket(rate)
+        self.retries = retries
+        self.rate_limit_wait = rate_limit_wait
+        self.backoff = backoff
+        self.timeout = timeout
+        self.stats = {"calls": 0, "rate_limited": 0, "retries": 0}
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.session.close()
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def request(self, method, table, body=None, params=None):
+        """One API call, waiting out 429s and retrying 5xx/connection errors"""
+        import requests
+
+        url = f"{self.base_url}/{table}"
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            self._count("calls")
+            try:
+                response = self.session.request(method, url, json=body, params=params, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                status, message = "error", str(e)
+            else:
+                status = response.status_code
+                if status < 400:
+                    metrics.inc("airtable_calls_total", method=method, status=status)
+                    return response.json()
+                message = response.text[:300]
+            metrics.inc("airtable_calls_total", method=method, status=status)
+            if status == 429:
+                self._count("rate_limited")
+                retry_after = response.headers.get("Retry-After", "")
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    delay = self.rate_limit_wait
+            elif status == "error" or status >= 500:
+                delay = self.backoff * (2 ** attempt)
+            else:
+                raise AirtableError(status, message)
+            if attempt < self.retries:
+                self._count("retries")
+                time.sleep(delay)
+        raise AirtableError(status, f"gave up after {self.retries + 1} attempts: {message}")
+
+    def create(self, table, fields_list):
+        """Create records; returns their IDs in order"""
+        body = {"records": [{"fields": fields} for fields in fields_list], "typecast": True}
+        return [record["id"] for record in self.request("POST", table, body)["records"]]
+
+    def update(self, table, records):
+        """Patch (record ID, fields) pairs; fields not sent are left alone"""
+        body = {"records": [{"id": rid, "fields": fields} for rid, fields in records], "typecast": True}
+        return [record["id"] for record in self.request("PATCH", table, body)["records"]]
+
+    def delete(self, table, record_ids):
+        return [record["id"] for record in self.request("DELETE", table, params={"records[]": record_ids})["records"]]
+
+    def list(self, table, fields=()):
+        """Every record of a table as (record ID, fields), 100 per page"""
+        params = {"pageSize": 100, "fields[]": list(fields)}
+        while True:
+            page = self.request("GET", table, params=params)
+            for record in page["records"]:
+                yield record["id"], record.get("fields", {})
+            if not page.get("offset"):
+                return
+            params["offset"] = page["offset"]
+
+
+class Snapshot:
+    """Airtable record ID and field hash last sent, per (base, table, key)"""
+
+    def __init__(self, path, base_id):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.base_id = base_id
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            " base TEXT NOT NULL, tbl TEXT NOT NULL, key TEXT NOT NULL, record_id TEXT NOT NULL, hash TEXT,"
+            " PRIMARY KEY (base, tbl, key)) WITHOUT ROWID"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def lookup(self, table, keys):
+        """{key: (record ID, hash)} for the keys already synced"""
+        found = {}
+        keys = list(keys)
+        for i in range(0, len(keys), SQL_IN_LIMIT):
+            chunk = keys[i:i + SQL_IN_LIMIT]
+            placeholders = ",".join("?" * len(chunk))
+            for key, record_id, digest in self.conn.execute(
+                f"SELECT key, record_id, hash FROM records WHERE base = ? AND tbl = ? AND key IN ({placeholders})",
+                (self.base_id, table, *chunk),
+            ):
+                found[key] = (record_id, digest)
+        return found
+
+    def keys(self, table):
+        return {key: record_id for key, record_id in self.conn.execute(
+            "SELECT key, record_id FROM records WHERE base = ? AND tbl = ?", (self.base_id, table)
+        )}
+
+    def record(self, table, entries):
+        """Store (key, record ID, hash) entries and commit"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)",
+                ((self.base_id, table, key, record_id, digest) for key, record_id, digest in entries),
+            )
+
+    def forget(self, table, keys):
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM records WHERE base = ? AND tbl = ? AND key = ?",
+                ((self.base_id, table, key) for key in keys),
+            )
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM records WHERE base = ?", (self.base_id,))
+
+
+class AirtableSync:
+    def __init__(self, client, snapshot, workers=WORKERS, full=False, prune=False):
+        self.client = client
+        self.snapshot = snapshot
+        self.workers = workers
+        self.full = full
+        self.prune = prune
+        self.stats = {
+            table: {"created": 0, "updated": 0, "unchanged": 0, "deleted": 0, "failed": 0}
+            for table in (JOBS_TABLE, CONTACTS_TABLE)
+        }
+        self.errors = []
+
+    def _plan(self, table, records):
+        """Split {key: fields} into creates [(key, fields, hash)] and updates [(key, record ID, fields, hash)]"""
+        known = self.snapshot.lookup(table, records)
+        creates, updates = [], []
+        for key, fields in records.items():
+            digest = record_hash(fields)
+            if key not in known:
+                creates.append((key, {f: v for f, v in fields.items() if v is not None}, digest))
+            elif self.full or known[key][1] != digest:
+                updates.append((key, known[key][0], fields, digest))
+            else:
+                self.stats[table]["unchanged"] += 1
+        return creates, updates
+
+    def _run(self, table, calls):
+        """Run (kind, batch, fn) calls concurrently, recording each finished batch in the snapshot"""
+        stats = self.stats[table]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(fn, batch): (kind, batch) for kind, batch, fn in calls}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, batch = pending.pop(future)
+                    try:
+                        record_ids = future.result()
+                    except AirtableError as e:
+                        stats["failed"] += len(batch)
+                        self.errors.append(f"{table} {kind}: {e}")
+                        continue
+                    if kind == "create":
+                        self.snapshot.record(table, ((key, rid, digest) for (key, _, digest), rid
+                                                     in zip(batch, record_ids)))
+                    elif kind == "update":
+                        self.snapshot.record(table, ((key, rid, digest) for key, rid, _, digest in batch))
+                    else:
+                        self.snapshot.forget(table, (key for key, _ in batch))
+                    stats[{"create": "created", "update": "updated", "delete": "deleted"}[kind]] += len(batch)
+
+    def push(self, table, records):
+        """Send the records of one table that differ from the snapshot, MAX_RECORDS per request"""
+        creates, updates = self._plan(table, records)
+        calls = []
+        for i in range(0, len(creates), MAX_RECORDS):
+            batch = creates[i:i + MAX_RECORDS]
+            calls.append(("create", batch, lambda b: self.client.create(table, [fields for _, fields, _ in b])))
+        for i in range(0, len(updates), MAX_RECORDS):
+            batch = updates[i:i + MAX_RECORDS]
+            calls.append(("update", batch, lambda b: self.client.update(table, [(rid, f) for _, rid, f, _ in b])))
+        if self.prune:
+            gone = [(key, rid) for key, rid in self.snapshot.keys(table).items() if key not in records]
+            for i in range(0, len(gone), MAX_RECORDS):
+                batch = gone[i:i + MAX_RECORDS]
+                calls.append(("delete", batch, lambda b: self.client.delete(table, [rid for _, rid in b])))
+        self._run(table, calls)
+
+    def sync(self, rows):
+        """Bring both tables in line with the scaffold rows; returns per-table counts"""
+        started = time.perf_counter()
+        jobs, contacts = build_records(rows)
+        with metrics.span("stage", stage="airtable_sync") as span:
+            self.push(JOBS_TABLE, jobs)
+            # Resolve every contact's jobs to record IDs in one pass over the snapshot
+            job_ids = {key: rid for key, (rid, _) in self.snapshot.lookup(
+                JOBS_TABLE, {key for _, keys in contacts.values() for key in keys}
+            ).items()}
+            records = {}
+            for ckey, (fields, keys) in contacts.items():
+                records[ckey] = dict(fields, linked_jobs=sorted(job_ids[k] for k in keys if k in job_ids))
+            self.push(CONTACTS_TABLE, records)
+            span.set(calls=self.client.stats["calls"], jobs=len(jobs), contacts=len(contacts))
+        self.elapsed = time.perf_counter() - started
+        return self.stats
+
+    def adopt(self):
+        """Rebuild the snapshot from the records already in Airtable (matched by job URL / contact)"""
+        self.snapshot.clear()
+        adopted = {}
+        for table, fields in ((JOBS_TABLE, JOB_FIELDS), (CONTACTS_TABLE, CONTACT_FIELDS)):
+            entries = []
+            for record_id, remote in self.client.list(table, list(fields) + ["linked_jobs"]):
+                row = {column: remote.get(field) for field, column in fields.items()}
+                key = job_key(row) if table == JOBS_TABLE else contact_key(row)
+                if key:
+                    # Hash of what Airtable holds, so only records that differ get patched
+                    current = {field: _value(column, remote.get(field)) for field, column in fields.items()}
+                    if table == CONTACTS_TABLE:
+                        current["linked_jobs"] = sorted(remote.get("linked_jobs") or [])
+                    entries.append((key, record_id, record_hash(current)))
+            self.snapshot.record(table, entries)
+            adopted[table] = len(entries)
+        return adopted
+
+    def report(self):
+        for table, s in self.stats.items():
+            print(f"📤 Airtable {table}: {s['created']} created, {s['updated']} updated,"
+                  f" {s['unchanged']} unchanged, {s['deleted']} deleted, {s['failed']} failed")
+        c = self.client.stats
+        print(f"   {c['calls']} API calls ({c['rate_limited']} rate limited) in {getattr(self, 'elapsed', 0):.2f}s")
+        for error in self.errors[:5]:
+            print(f"⚠️  {error}")
+
+
+class FakeAirtable:
+    """
+    In-process stand-in for the Airtable REST API.
+
+    Serves /v0/<base>/<table> on localhost with create/update/delete/list,
+    the 10-records-per-request limit, unknown-field and record-link checks,
+    and a requests-per-second limit answered with 429. State can persist
+    to a JSON file so --fake runs build on each other.
+    """
+
+    def __init__(self, rate=RATE, schema=AIRTABLE_SCHEMA, state_path=None, token=None):
+        self.rate = rate
+        self.fields = {name: set(table["fields"]) for name, table in schema["tables"].items()}
+        self.links = {
+            (name, field): spec["linkedTable"]
+            for name, table in schema["tables"].items()
+            for field, spec in table["fields"].items() if spec["type"] == "multipleRecordLinks"
+        }
+        self.state_path = Path(state_path) if state_path else None
+        self.token = token
+        self.tables = {name: {} for name in self.fields}
+        self.next_id = 0
+        if self.state_path and self.state_path.exists():
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            self.tables.update(state["tables"])
+            self.next_id = state["next_id"]
+        self.requests = {"GET": 0, "POST": 0, "PATCH": 0, "DELETE": 0, "429": 0}
+        self._window = []
+        self._lock = threading.Lock()
+        self._server = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v0"
+
+    def start(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else {}
+                parts = urlsplit(self.path)
+                status, payload, headers = fake.handle(
+                    self.command, parts.path, parse_qs(parts.query), body, self.headers.get("Authorization")
+                )
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self.state_path:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            self.state_path.write_text(json.dumps({"tables": self.tables, "next_id": self.next_id}), encoding="utf-8")
+
+    def _error(self, status, kind, message=""):
+        return status, {"error": {"type": kind, "message": message}}, {}
+
+    def _check_fields(self, table, fields):
+        for field, value in fields.items():
+            if field not in self.fields[table]:
+                return f"Unknown field name: {field}"
+            linked = self.links.get((table, field))
+            if linked and any(rid not in self.tables[linked] for rid in value or []):
+                return f"Record ID in {field} does not exist in {linked}"
+        return None
+
+    def handle(self, method, path, query, body, auth):
+        """(status, JSON payload, headers) for one API request"""
+        if self.token and auth != f"Bearer {self.token}":
+            return self._error(401, "AUTHENTICATION_REQUIRED")
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.rate:
+                self.requests["429"] += 1
+                retry_after = 1.0 - (now - self._window[0])
+                return 429, {"errors": [{"error": "RATE_LIMIT_REACHED"}]}, {"Retry-After": f"{retry_after:.3f}"}
+            self._window.append(now)
+            self.requests[method] += 1
+
+            table_name = path.rstrip("/").rsplit("/", 1)[-1]
+            table = self.tables.get(table_name)
+            if table is None:
+                return self._error(404, "TABLE_NOT_FOUND", table_name)
+            if method == "GET":
+                ids = sorted(table)
+                start = int(query.get("offset", ["0"])[0])
+                size = min(int(query.get("pageSize", ["100"])[0]), 100)
+                wanted = set(query.get("fields[]", [])) or None
+                records = [
+                    {"id": rid, "fields": {k: v for k, v in table[rid].items() if wanted is None or k in wanted}}
+                    for rid in ids[start:start + size]
+                ]
+                payload = {"records": records}
+                if start + size < len(ids):
+                    payload["offset"] = str(start + size)
+                return 200, payload, {}
+            if method == "DELETE":
+                ids = query.get("records[]", [])
+                if len(ids) > MAX_RECORDS:
+                    return self._error(422, "INVALID_REQUEST_UNKNOWN", "too many records")
+                if any(rid not in table for rid in ids):
+                    return self._error(404, "NOT_FOUND")
+                for rid in ids:
+                    del table[rid]
+                return 200, {"records": [{"id": rid, "deleted": True} for rid in ids]}, {}
+
+            records = body.get("records") or []
+            if not records or len(records) > MAX_RECORDS:
+                return self._error(422, "INVALID_RECORDS", f"{len(records)} records; 1 to {MAX_RECORDS} allowed")
+            for record in records:
+                problem = self._check_fields(table_name, record.get("fields", {}))
+                if problem:
+                    return self._error(422, "INVALID_VALUE_FOR_COLUMN", problem)
+                if method == "PATCH" and record.get("id") not in table:
+                    return self._error(404, "NOT_FOUND", record.get("id", ""))
+            result = []
+            for record in records:
+                fields = {k: v for k, v in record["fields"].items() if v is not None}
+                if method == "POST":
+                    self.next_id += 1
+                    rid = f"rec{self.next_id:014d}"
+                    table[rid] = fields
+                else:
+                    rid = record["id"]
+                    table[rid].update(fields)
+                    for k in [k for k, v in record["fields"].items() if v is None]:
+                        table[rid].pop(k, None)
+                result.append({"id": rid, "fields": table[rid]})
+            return 200, {"records": result}, {}
+
+
+def airtable_sync(input_path, base_id=None, token=None, snapshot_path=SNAPSHOT_PATH, fake=False,
+                  workers=WORKERS, full=False, prune=False, adopt=False):
+    """Sync a scaffold CSV into Airtable (or a FakeAirtable); returns the sync stats"""
+    server = None
+    if fake:
+        server = FakeAirtable(state_path=Path(snapshot_path).parent / FAKE_STATE_PATH.name).start()
+        base_id, token, api_url = "appFAKE", "fake", server.url
+    else:
+        base_id = base_id or os.environ.get("AIRTABLE_BASE_ID")
+        token = token or os.environ.get("AIRTABLE_TOKEN") or os.environ.get("AIRTABLE_API_KEY")
+        if not base_id or not token:
+            raise SystemExit("❌ Set --base/AIRTABLE_BASE_ID and AIRTABLE_TOKEN, or use --fake")
+        api_url = API_URL
+    client = AirtableClient(base_id, token, api_url, pool_size=workers)
+    try:
+        with Snapshot(snapshot_path, base_id) as snapshot, open(input_path, newline="", encoding="utf-8") as f:
+            syncer = AirtableSync(client, snapshot, workers, full=full, prune=prune)
+            if adopt:
+                adopted = syncer.adopt()
+                print(f"🔗 Adopted {adopted[JOBS_TABLE]} jobs and {adopted[CONTACTS_TABLE]} contacts already in Airtable")
+            stats = syncer.sync(csv.DictReader(f))
+            syncer.report()
+            return stats
+    finally:
+        client.close()
+        if server is not None:
+            server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send new and changed scaffold rows to Airtable")
+    parser.add_argument("input", nargs="?", default="output/teal_jobs_scaffold.csv", help="scaffold CSV")
+    parser.add_argument("--base", help="Airtable base ID (default: $AIRTABLE_BASE_ID)")
+    parser.add_argument("--snapshot", default=SNAPSHOT_PATH, help="record IDs and hashes last synced (SQLite)")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--full", action="store_true", help="re-send every record, changed or not")
+    parser.add_argument("--prune", action="store_true", help="delete records whose rows left the scaffold")
+    parser.add_argument("--adopt", action="store_true", help="rebuild the snapshot from the records in Airtable first")
+    parser.add_argument("--fake", action="store_true", help="sync into a local FakeAirtable (state in output/)")
+    args = parser.parse_args()
+    airtable_sync(args.input, args.base, snapshot_path=args.snapshot, fake=args.fake, workers=args.workers,
+                  full=args.full, prune=args.prune, adopt=args.adopt)
+
+
+if __name__ == "__main__":
+    main()
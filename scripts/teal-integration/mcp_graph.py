@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Incremental job graph export for the Claude memory MCP server.
+
+Jobs stream through an index that merges companies by normalized name
+and jobs by canonical URL, so each entity and relation is emitted once.
+Output is newline-delimited JSON, one MCP tool call per line, with at
+most batch_size items per call. A manifest (SQLite) records what earlier
+exports already sent: unchanged entities are skipped, changed ones only
+send their new observations, and known relations are not repeated.
+The manifest is committed only after the export file is in place.
+
+    python scripts/teal-integration/mcp_graph.py output/teal_jobs_scaffold.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import metrics  # noqa: E402
+from dedup import normalize_company  # noqa: E402
+from urls import canonical_url  # noqa: E402
+
+MANIFEST_PATH = Path("output/mcp_manifest.sqlite")
+EXPORT_PATH = Path("output/mcp_entities.ndjson")
+BATCH_SIZE = 100
+SQL_IN_LIMIT = 500
+
+
+def _field(job, *names):
+    for name in names:
+        value = job.get(name)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def _short_hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=6).hexdigest()
+
+
+class MCPGraphBuilder:
+    def __init__(self, manifest_path=MANIFEST_PATH, batch_size=BATCH_SIZE, full=False):
+        self.manifest_path = Path(manifest_path)
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(self.manifest_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            " key TEXT PRIMARY KEY, name TEXT NOT NULL, observations TEXT NOT NULL) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS relations (key TEXT PRIMARY KEY) WITHOUT ROWID;"
+        )
+        if full:
+            self.conn.execute("DELETE FROM entities")
+            self.conn.execute("DELETE FROM relations")
+        self._out = None
+        self._pending = {"create_entities": [], "add_observations": [], "create_relations": []}
+        self.stats = {"jobs": 0, "created": 0, "updated": 0, "unchanged": 0, "relations": 0, "calls": 0, "bytes": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _entities_for(self, job):
+        """(job entity, company entity or None) with manifest keys"""
+        title = _field(job, "title", "job_title")
+        company = _field(job, "company")
+        url = _field(job, "url", "original_url")
+        key = "job:" + (canonical_url(url) or f"{normalize_company(company)}|{title.casefold()}")
+        job_entity = {
+            "key": key,
+            "name": f"Job_{_short_hash(key)}",
+            "entityType": "job_posting",
+            "observations": [f"Title: {title}", f"Company: {company}", f"URL: {url}", "Source: Teal HQ"],
+            "extracted": _field(job, "extractedAt", "date_scraped"),
+        }
+        company_norm = normalize_company(company)
+        if not company_norm:
+            return job_entity, None
+        company_entity = {
+            "key": "company:" + company_norm,
+            "name": company,
+            "entityType": "company",
+            "observations": ["Source: Teal HQ extraction"],
+        }
+        return job_entity, company_entity
+
+    def _manifest(self, table, columns, keys):
+        found = {}
+        keys = list(keys)
+        for i in range(0, len(keys), SQL_IN_LIMIT):
+            chunk = keys[i:i + SQL_IN_LIMIT]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.conn.execute(
+                f"SELECT {columns} FROM {table} WHERE key IN ({placeholders})", chunk
+            ):
+                found[row[0]] = row[1:]
+        return found
+
+    def _emit(self, tool, item):
+        pending = self._pending[tool]
+        pending.append(item)
+        if len(pending) >= self.batch_size:
+            self._write(tool)
+
+    def _write(self, tool):
+        items = self._pending[tool]
+        if not items:
+            return
+        if tool != "create_entities":
+            # Entities go out before any call that references them
+            self._write("create_entities")
+        key = {"create_entities": "entities", "add_observations": "observations"}.get(tool, "relations")
+        line = json.dumps({"tool": f"memory:{tool}", "arguments": {key: items}}, separators=(",", ":")) + "\n"
+        self._out.write(line)
+        self.stats["calls"] += 1
+        self.stats["bytes"] += len(line.encode("utf-8"))
+        self._pending[tool] = []
+
+    def _process_batch(self, jobs):
+        """
+        Emit the calls for one batch. Entities already sent, earlier in this
+        run or in a previous one, are found in the manifest, which is written
+        per batch, so memory is bounded by the batch size.
+        """
+        entities, links = {}, []
+        for job in jobs:
+            job_entity, company_entity = self._entities_for(job)
+            if job_entity["key"] in entities:
+                continue
+            self.stats["jobs"] += 1
+            entities[job_entity["key"]] = job_entity
+            if company_entity is not None:
+                # The first spelling of a company names its entity
+                entities.setdefault(company_entity["key"], company_entity)
+                links.append((company_entity["key"], job_entity["key"]))
+
+        known = self._manifest("entities", "key, name, observations", entities)
+        names = {}
+        manifest_entities = []
+        for key, entity in entities.items():
+            if key in known:
+                name, stored = known[key][0], set(json.loads(known[key][1]))
+                names[key] = name
+                new = [o for o in entity["observations"] if o not in stored]
+                if not new:
+                    self.stats["unchanged"] += 1
+                    continue
+                self._emit("add_observations", {"entityName": name, "contents": new})
+                manifest_entities.append((key, name, json.dumps(sorted(stored | set(new)))))
+                self.stats["updated"] += 1
+                continue
+            names[key] = entity["name"]
+            observations = list(entity["observations"])
+            if entity.get("extracted"):
+                observations.append(f"Extracted: {entity['extracted']}")
+            self._emit("create_entities", {
+                "name": entity["name"], "entityType": entity["entityType"], "observations": observations,
+            })
+            manifest_entities.append((key, entity["name"], json.dumps(sorted(entity["observations"]))))
+            self.stats["created"] += 1
+
+        relations = {}
+        for company_key, job_key in links:
+            relation = {"from": names[company_key], "to": names[job_key], "relationType": "has_job_posting"}
+            relations["|".join((relation["from"], relation["relationType"], relation["to"]))] = relation
+        known_relations = self._manifest("relations", "key", relations)
+        for key, relation in relations.items():
+            if key not in known_relations:
+                self._emit("create_relations", relation)
+                self.stats["relations"] += 1
+
+        self.conn.executemany("INSERT OR REPLACE INTO entities VALUES (?, ?, ?)", manifest_entities)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO relations VALUES (?)",
+            ((k,) for k in relations if k not in known_relations),
+        )
+
+    def export(self, jobs, path=EXPORT_PATH):
+        """Write the MCP calls for everything new or changed in jobs to path (NDJSON)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with metrics.span("stage", stage="mcp_export") as span, open(tmp_path, "w", encoding="utf-8") as self._out:
+                batch = []
+                for job in jobs:
+                    batch.append(job)
+                    if len(batch) >= self.batch_size:
+                        self._process_batch(batch)
+                        batch = []
+                if batch:
+                    self._process_batch(batch)
+                # Entities before the relations that reference them
+                for tool in ("create_entities", "add_observations", "create_relations"):
+                    self._write(tool)
+                span.set(**self.stats)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self.conn.rollback()
+            tmp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            self._out = None
+        self.conn.commit()
+        metrics.inc("rows_in_total", self.stats["jobs"], stage="mcp_export")
+        metrics.inc("mcp_calls_total", self.stats["calls"])
+        metrics.inc("mcp_bytes_total", self.stats["bytes"])
+        return dict(self.stats)
+
+    def report(self, path=EXPORT_PATH):
+        s = self.stats
+        print(
+            f"💾 MCP graph: {s['jobs']} jobs → {s['created']} new entities, {s['updated']} updated,"
+            f" {s['unchanged']} unchanged, {s['relations']} new relations"
+        )
+        print(f"   {s['calls']} batched calls ({s['bytes'] / 1024:.1f} KB) written to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export jobs as incremental MCP memory graph calls")
+    parser.add_argument("input", help="job or scaffold CSV (job_title/title, company, original_url/url)")
+    parser.add_argument("-o", "--output", default=EXPORT_PATH)
+    parser.add_argument("--manifest", default=MANIFEST_PATH)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--full", action="store_true", help="ignore the manifest and export everything")
+    args = parser.parse_args()
+
+    with open(args.input, newline="", encoding="utf-8") as f, \
+            MCPGraphBuilder(args.manifest, args.batch_size, args.full) as graph:
+        graph.export(csv.DictReader(f), args.output)
+        graph.report(args.output)
+
+
+if __name__ == "__main__":
+    main()
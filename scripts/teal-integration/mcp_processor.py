@@ -9,63 +9,67 @@ import csv
 from datetime import datetime
 from pathlib import Path
 
+from mcp_graph import MCPGraphBuilder
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Tables and fields of the tracking base; airtable_sync.py writes the fields it owns
+AIRTABLE_SCHEMA = {
+    "base_name": "David Shi Job Pipeline",
+    "tables": {
+        "teal_jobs": {
+            "fields": {
+                "job_title": {"type": "singleLineText"},
+                "company": {"type": "singleLineText"},
+                "original_url": {"type": "url"},
+                "poster_name": {"type": "singleLineText"},
+                "linkedin": {"type": "url"},
+                "title": {"type": "singleLineText"},
+                "email": {"type": "email"},
+                "confidence_score": {"type": "number"},
+                "source": {"type": "singleSelect", "options": ["teal_hq", "rss", "manual"]},
+                "date_scraped": {"type": "date"},
+                "notes": {"type": "multilineText"},
+                "status": {"type": "singleSelect", "options": ["new", "researching", "contacted", "responded", "closed"]},
+                "outreach_sent": {"type": "checkbox"},
+                "response_received": {"type": "checkbox"}
+            }
+        },
+        "contacts": {
+            "fields": {
+                "name": {"type": "singleLineText"},
+                "linkedin": {"type": "url"},
+                "email": {"type": "email"},
+                "title": {"type": "singleLineText"},
+                "company": {"type": "singleLineText"},
+                "confidence_score": {"type": "number"},
+                "linked_jobs": {"type": "multipleRecordLinks", "linkedTable": "teal_jobs"}
+            }
+        }
+    }
+}
+
 class MCPTealProcessor:
-    def __init__(self):
-        self.output_dir = Path("../../output")
+    def __init__(self, output_dir=REPO_ROOT / "output"):
+        self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
-    def process_with_memory_mcp(self, jobs_data):
-        """Store job data in Claude's memory for enrichment"""
-        # This would use memory MCP to store job entities
-        print("🧠 Storing jobs in Claude memory...")
-        
-        entities = []
-        relations = []
-        
-        for job in jobs_data:
-            # Create job entity
-            job_entity = {
-                "name": f"Job_{job.get('index', 'unknown')}",
-                "entityType": "job_posting",
-                "observations": [
-                    f"Title: {job.get('title', '')}",
-                    f"Company: {job.get('company', '')}",
-                    f"URL: {job.get('url', '')}",
-                    f"Source: Teal HQ",
-                    f"Extracted: {job.get('extractedAt', '')}"
-                ]
-            }
-            entities.append(job_entity)
-            
-            # Create company entity if not exists
-            if job.get('company'):
-                company_entity = {
-                    "name": job.get('company', ''),
-                    "entityType": "company",
-                    "observations": [
-                        f"Has job posting: {job.get('title', '')}",
-                        f"Source: Teal HQ extraction"
-                    ]
-                }
-                entities.append(company_entity)
-                
-                # Create relation
-                relations.append({
-                    "from": job.get('company', ''),
-                    "to": f"Job_{job.get('index', 'unknown')}",
-                    "relationType": "has_job_posting"
-                })
-        
-        # Save for MCP memory commands
-        with open(self.output_dir / "mcp_entities.json", 'w') as f:
-            json.dump({"entities": entities, "relations": relations}, f, indent=2)
-            
-        print(f"💾 Prepared {len(entities)} entities for MCP memory storage")
-        return entities, relations
+    def process_with_memory_mcp(self, jobs_data, full=False):
+        """Export new or changed job/company entities as batched MCP memory calls"""
+        print("🧠 Exporting job graph for Claude memory...")
+        export_path = self.output_dir / "mcp_entities.ndjson"
+        with MCPGraphBuilder(self.output_dir / "mcp_manifest.sqlite", full=full) as graph:
+            stats = graph.export(jobs_data, export_path)
+            graph.report(export_path)
+        return stats
     
     def generate_github_integration(self, jobs_data):
         """Create GitHub workflow for job pipeline"""
-        
+        try:
+            import yaml  # only this method needs it; keep module import cheap
+        except ImportError as e:
+            raise ImportError("Writing the GitHub workflow needs PyYAML: pip3 install pyyaml") from e
+
         workflow = {
             "name": "Teal Job Processing Pipeline",
             "on": {
@@ -109,10 +113,9 @@ class MCPTealProcessor:
             }
         }
         
-        github_dir = Path("../../.github/workflows")
+        github_dir = REPO_ROOT / ".github" / "workflows"
         github_dir.mkdir(parents=True, exist_ok=True)
-        
-        import yaml
+
         with open(github_dir / "teal_pipeline.yml", 'w') as f:
             yaml.dump(workflow, f, default_flow_style=False)
             
@@ -120,42 +123,8 @@ class MCPTealProcessor:
     
     def create_airtable_schema(self, jobs_data):
         """Generate Airtable schema for job tracking"""
-        
-        schema = {
-            "base_name": "David Shi Job Pipeline",
-            "tables": {
-                "teal_jobs": {
-                    "fields": {
-                        "job_title": {"type": "singleLineText"},
-                        "company": {"type": "singleLineText"},
-                        "original_url": {"type": "url"},
-                        "poster_name": {"type": "singleLineText"},
-                        "linkedin": {"type": "url"},
-                        "title": {"type": "singleLineText"},
-                        "email": {"type": "email"},
-                        "confidence_score": {"type": "number"},
-                        "source": {"type": "singleSelect", "options": ["teal_hq", "rss", "manual"]},
-                        "date_scraped": {"type": "date"},
-                        "notes": {"type": "multilineText"},
-                        "status": {"type": "singleSelect", "options": ["new", "researching", "contacted", "responded", "closed"]},
-                        "outreach_sent": {"type": "checkbox"},
-                        "response_received": {"type": "checkbox"}
-                    }
-                },
-                "contacts": {
-                    "fields": {
-                        "name": {"type": "singleLineText"},
-                        "linkedin": {"type": "url"},
-                        "email": {"type": "email"},
-                        "title": {"type": "singleLineText"},
-                        "company": {"type": "singleLineText"},
-                        "confidence_score": {"type": "number"},
-                        "linked_jobs": {"type": "multipleRecordLinks", "linkedTable": "teal_jobs"}
-                    }
-                }
-            }
-        }
-        
+        schema = AIRTABLE_SCHEMA
+
         with open(self.output_dir / "airtable_schema.json", 'w') as f:
             json.dump(schema, f, indent=2)
             
@@ -185,8 +154,8 @@ class MCPTealProcessor:
             "- Update confidence scores",
             "",
             "## Step 5: Update Airtable",
-            "airtable:create_records - Add jobs to tracking base",
-            "airtable:update_records - Update contact information",
+            "python scripts/pipeline.py airtable-sync - Send only new or changed jobs and contacts",
+            "(airtable:create_records / airtable:update_records for one-off edits)",
             "",
             "## Step 6: Commit to GitHub",
             "github:create_or_update_file - Save enriched data",
@@ -10,7 +10,7 @@ mkdir -p ../../data
 
 # Install Python dependencies
 echo "📦 Installing Python dependencies..."
-pip3 install requests beautifulsoup4 lxml pandas pyyaml
+pip3 install requests pandas pyyaml pyarrow
 
 # Make scripts executable
 chmod +x teal_job_scraper.py
@@ -4,42 +4,66 @@ Teal HQ Job Scraper - David Shi Pipeline Integration
 Extracts LinkedIn job URLs from Teal saved jobs via MCP automation
 """
 
+import argparse
 import csv
 import json
 import os
+import sys
 import time
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-import requests
-from bs4 import BeautifulSoup
 import logging
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import metrics
+from dedup import DedupIndex
+from job_store import JobStore
+from records import JobRecord
+from scaffold_schema import TEAL_HEADERS
+from urls import RedirectCache, clean_url
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# David Shi Scaffold Format Headers
-SCAFFOLD_HEADERS = [
-    'job_title', 'company', 'original_url', 'poster_name', 
-    'linkedin', 'title', 'email', 'confidence_score',
-    'source', 'date_scraped', 'notes'
-]
+# David Shi Scaffold Format Headers (Teal export layout; see scaffold_schema.ALIASES)
+SCAFFOLD_HEADERS = TEAL_HEADERS
+
+# Lower-cased header names tried, in order, for each JobRecord field of a Teal export
+TEAL_COLUMN_CANDIDATES = {
+    'job_title': ('job title', 'title', 'job_title', 'position', 'role'),
+    'company': ('company', 'company name', 'employer'),
+    'original_url': ('url', 'job url', 'link', 'original_url', 'job link', 'posting url'),
+    'notes': ('notes', 'note'),
+}
 
 class TealJobScraper:
-    def __init__(self, output_path="output/teal_jobs_scaffold.csv"):
+    def __init__(self, output_path="output/teal_jobs_scaffold.csv", dedup=True, resolve_links=False):
         self.output_path = Path(output_path)
         self.output_path.parent.mkdir(exist_ok=True)
-        self.session = requests.Session()
-        
-        # Setup headers to look like real browser
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        })
-        
+        self.dedup_index_path = self.output_path.parent / "dedup.sqlite" if dedup else None
+        self.store_path = self.output_path.parent / "pipeline.db"
+        self._session = None
+        # Short links (lnkd.in, bit.ly) are followed once and remembered across runs
+        self.redirects = RedirectCache(self.output_path.parent / "url_resolve.sqlite") if resolve_links else None
+
+    @property
+    def session(self):
+        """HTTP session that looks like a real browser, created on first use"""
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+            self._session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive'
+            })
+        return self._session
+
     def manual_extract_flow(self):
         """Guide user through manual extraction process"""
         print("🚀 Teal HQ Job Extraction - Manual Flow")
@@ -145,13 +169,14 @@ extractTealJobs();
             url = input("Original URL: ").strip()
             notes = input("Notes (optional): ").strip()
             
-            job = {
-                'title': title,
-                'company': company,
-                'url': url,
-                'notes': notes,
-                'extracted_at': datetime.now().isoformat()
-            }
+            job = JobRecord(
+                job_title=title,
+                company=company,
+                original_url=url,
+                platform='teal_hq',
+                notes=notes,
+                scraped_at=datetime.now().isoformat()
+            )
             
             jobs.append(job)
             print(f"✅ Added job {len(jobs)}")
@@ -171,73 +196,140 @@ extractTealJobs();
             print(f"❌ File not found: {csv_path}")
             return []
             
-        jobs = []
-        try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Map Teal CSV columns to our format
-                    job = {
-                        'title': row.get('Job Title', row.get('title', '')),
-                        'company': row.get('Company', row.get('company', '')),
-                        'url': row.get('URL', row.get('url', row.get('link', ''))),
-                        'notes': row.get('Notes', ''),
-                        'extracted_at': datetime.now().isoformat()
-                    }
-                    jobs.append(job)
-            
-            print(f"✅ Imported {len(jobs)} jobs from CSV")
-            
-        except Exception as e:
-            print(f"❌ Error reading CSV: {e}")
-            
-        return jobs
+        return self.iter_teal_csv(csv_path)
+    
+    @staticmethod
+    def detect_columns(fieldnames):
+        """Map our job fields to the header of one Teal export (case-insensitive)"""
+        by_lower = {name.strip().lower(): name for name in fieldnames or []}
+        mapping = {}
+        for field, candidates in TEAL_COLUMN_CANDIDATES.items():
+            for candidate in candidates:
+                if candidate in by_lower:
+                    mapping[field] = by_lower[candidate]
+                    break
+        return mapping
+    
+    def iter_teal_csv(self, csv_path):
+        """Stream jobs from a Teal export; columns are mapped once per file"""
+        extracted_at = datetime.now().isoformat()
+        with open(csv_path, 'r', newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            mapping = self.detect_columns(reader.fieldnames)
+            if 'job_title' not in mapping:
+                print(f"❌ {csv_path}: no job title column in {reader.fieldnames}")
+                return
+            logger.info(f"{csv_path}: columns {mapping}")
+            for row in reader:
+                job = {field: (row.get(column) or '').strip() for field, column in mapping.items()}
+                yield JobRecord(platform='teal_hq', scraped_at=extracted_at, **job)
+    
+    def import_exports(self, paths, append=True, preview_lines=5, collect=None):
+        """
+        Headless import of Teal export CSVs (files or directories of them).
+        
+        Rows stream straight into the scaffold file; with append=True new
+        jobs are appended and jobs already in the store are only upserted.
+        """
+        files = []
+        for path in map(Path, paths):
+            if path.is_dir():
+                files.extend(sorted(path.glob('*.csv')))
+            elif path.exists():
+                files.append(path)
+            else:
+                print(f"❌ File not found: {path}")
+        if not files:
+            print("❌ No Teal exports to import")
+            return 0
+        jobs = (job for path in files for job in self.iter_teal_csv(path))
+        print(f"📁 Importing {len(files)} Teal export(s)")
+        return self.save_to_scaffold(jobs, append=append, preview_lines=preview_lines, collect=collect)
+    
+    def to_scaffold_row(self, i, job):
+        """Map an extracted job to a scaffold row"""
+        url = clean_url(job.original_url)
+        if self.redirects is not None:
+            url = self.redirects.resolve(url)
+        return {
+            'job_title': job.job_title,
+            'company': job.company,
+            'original_url': url,
+            'poster_name': '',  # To be enriched later
+            'linkedin': '',     # To be enriched later  
+            'title': '',        # To be enriched later
+            'email': '',        # To be enriched later
+            'confidence_score': 0,
+            'source': 'teal_hq',
+            'date_scraped': job.scraped_at or datetime.now().isoformat(),
+            'notes': job.notes if job.notes is not None else f"Job #{i+1} from Teal HQ extraction"
+        }
     
-    def save_to_scaffold(self, jobs):
-        """Save jobs to David Shi scaffold format"""
-        if not jobs:
+    def save_to_scaffold(self, jobs, append=False, preview_lines=5, collect=None):
+        """Save jobs (a list or a stream) to David Shi scaffold format; written rows go to collect if given"""
+        if isinstance(jobs, list) and not jobs:
             print("❌ No jobs to save")
-            return
-            
-        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=SCAFFOLD_HEADERS)
-            writer.writeheader()
+            return 0
             
-            for i, job in enumerate(jobs):
-                scaffold_row = {
-                    'job_title': job.get('title', ''),
-                    'company': job.get('company', ''),
-                    'original_url': job.get('url', ''),
-                    'poster_name': '',  # To be enriched later
-                    'linkedin': '',     # To be enriched later  
-                    'title': '',        # To be enriched later
-                    'email': '',        # To be enriched later
-                    'confidence_score': 0,
-                    'source': 'teal_hq',
-                    'date_scraped': job.get('extracted_at', datetime.now().isoformat()),
-                    'notes': job.get('notes', f"Job #{i+1} from Teal HQ extraction")
-                }
-                writer.writerow(scaffold_row)
-                
-        print(f"✅ Saved {len(jobs)} jobs to {self.output_path}")
+        rows = (self.to_scaffold_row(i, job) for i, job in enumerate(jobs))
+        append = append and self.output_path.exists() and self.output_path.stat().st_size > 0
+        # A rewrite goes to a temporary file, so a failed import keeps the previous output
+        target = self.output_path if append else self.output_path.with_name(self.output_path.name + '.tmp')
+        index = DedupIndex(self.dedup_index_path) if self.dedup_index_path else None
+        store = JobStore(self.store_path)
+        saved = 0
+        try:
+            if index is not None:
+                rows = index.filter_records(rows)
+            rows = store.tee(rows, source='teal_hq', new_only=append)
+            with metrics.span('stage', stage='teal_import') as span, \
+                    open(target, 'a' if append else 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=SCAFFOLD_HEADERS)
+                if not append:
+                    writer.writeheader()
+                for scaffold_row in rows:
+                    writer.writerow(scaffold_row)
+                    saved += 1
+                    if collect is not None:
+                        collect.append(scaffold_row)
+                span.set(rows_out=saved, append=append)
+            if not append:
+                target.replace(self.output_path)
+            if index is not None:
+                index.report()
+        finally:
+            if not append:
+                target.unlink(missing_ok=True)
+            store.close()
+            if index is not None:
+                index.close()
+        metrics.inc('rows_out_total', saved, stage='teal_import')
+        
+        if not saved:
+            print("❌ No new jobs to save")
+            return saved
+        
+        print(f"✅ {'Appended' if append else 'Saved'} {saved} jobs to {self.output_path}")
         print(f"📁 File location: {self.output_path.absolute()}")
         
         # Show preview
-        self.preview_results()
+        if preview_lines:
+            self.preview_results(preview_lines)
+        return saved
     
-    def preview_results(self):
-        """Show preview of saved data"""
+    def preview_results(self, limit=5):
+        """Show preview of saved data (header + first `limit` rows only)"""
         try:
             with open(self.output_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+                lines = list(islice(f, limit + 2))
                 
             print(f"\n📊 Preview of {self.output_path}:")
             print("=" * 60)
-            for i, line in enumerate(lines[:6]):  # Header + 5 rows
+            for i, line in enumerate(lines[:limit + 1]):
                 print(f"{i:2d}: {line.strip()}")
                 
-            if len(lines) > 6:
-                print(f"... and {len(lines) - 6} more rows")
+            if len(lines) > limit + 1:
+                print("... more rows")
                 
         except Exception as e:
             print(f"❌ Error reading preview: {e}")
@@ -276,5 +368,20 @@ extractTealJobs();
             print("❌ No jobs extracted")
 
 if __name__ == "__main__":
-    scraper = TealJobScraper()
-    scraper.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Teal HQ → David Shi scaffold importer")
+    sub = parser.add_subparsers(dest="command")
+    imp = sub.add_parser("import", help="headless import of Teal export CSVs or directories of them")
+    imp.add_argument("paths", nargs="+")
+    imp.add_argument("-o", "--output", default="output/teal_jobs_scaffold.csv")
+    imp.add_argument("--overwrite", action="store_true", help="rewrite the scaffold instead of appending")
+    imp.add_argument("--no-dedup", action="store_true")
+    imp.add_argument("--preview", type=int, default=5, help="rows to preview")
+    imp.add_argument("--resolve-links", action="store_true", help="follow short links (lnkd.in, bit.ly) to the posting")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        scraper = TealJobScraper(args.output, dedup=not args.no_dedup, resolve_links=args.resolve_links)
+        scraper.import_exports(args.paths, append=not args.overwrite, preview_lines=args.preview)
+    else:
+        scraper = TealJobScraper()
+        scraper.run()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+URL normalization for job postings.
+
+Two levels:
+
+- clean_url: what ingestion stores in original_url. Absolute https URL,
+  lowercase host without www./m./country prefixes, no tracking
+  parameters, fragment or trailing slash. Still the link people click.
+- canonical_url: the join/dedup key. clean_url, plus known job boards
+  reduced to their stable posting ID, so every variant of a posting maps
+  to one key:
+
+    https://www.linkedin.com/jobs/view/senior-engineer-at-acme-3712345678/?trk=abc
+    https://uk.linkedin.com/jobs/search/?currentJobId=3712345678&keywords=ml
+        -> https://linkedin.com/jobs/view/3712345678
+    https://remoteok.com/remote-jobs/remote-senior-engineer-acme-1092345 -> https://remoteok.com/remote-jobs/1092345
+    https://remotive.com/remote-jobs/software-dev/senior-engineer-1934567 -> https://remotive.com/remote-jobs/1934567
+    https://aijobs.net/job/1278543-software-engineer-aigc/ -> https://aijobs.net/job/1278543
+
+Short and redirect links (lnkd.in, bit.ly, ...) can be resolved through
+RedirectCache, a SQLite table of url -> final url, so each link costs
+one network round trip across all runs.
+
+    python scripts/urls.py canon "https://www.linkedin.com/jobs/view/3712345678/?trk=abc"
+    python scripts/urls.py resolve https://lnkd.in/abc123
+"""
+
+import argparse
+import re
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit
+
+REDIRECT_CACHE_PATH = Path("output/url_resolve.sqlite")
+RESOLVE_TIMEOUT = 10
+FAILED_RETRY_AFTER = 24 * 3600
+
+# Compared lowercased; utm_* is dropped as a prefix
+TRACKING_PARAMS = {
+    "ref", "refid", "trackingid", "trk", "trkinfo", "source", "src", "gclid", "fbclid", "mc_cid", "mc_eid",
+    "lipi", "licu", "eboid", "recommendedflavor", "originalsubdomain", "alternatechannel",
+}
+SHORTENER_HOSTS = {"lnkd.in", "bit.ly", "t.co", "tinyurl.com", "ow.ly", "buff.ly", "rebrand.ly", "goo.gl", "trib.al"}
+HOST_ALIASES = {"remotive.io": "remotive.com", "remoteok.io": "remoteok.com", "ai-jobs.net": "aijobs.net"}
+
+# host -> (pattern over the path, canonical path template); first match wins
+JOB_ID_PATTERNS = {
+    "linkedin.com": [
+        (re.compile(r"^/(?:comm/)?jobs/view/(?:[^/]*?-)?(\d{6,})/?$"), "/jobs/view/{id}"),
+    ],
+    "remoteok.com": [
+        (re.compile(r"^/(?:remote-jobs|l)/(?:[^/]*-)?(\d{3,})/?$"), "/remote-jobs/{id}"),
+    ],
+    "remotive.com": [
+        (re.compile(r"^/remote-jobs/(?:[^/]+/)?(?:[^/]*-)?(\d{3,})/?$"), "/remote-jobs/{id}"),
+    ],
+    "aijobs.net": [
+        (re.compile(r"^/job/(\d+)(?:-[^/]*)?/?$"), "/job/{id}"),
+    ],
+}
+# scheme://netloc, path, query (fragment dropped); cheaper than urlsplit per posting
+_URL_PARTS = re.compile(r"^https?://([^/?#]+)([^?#]*)(?:\?([^#]*))?", re.IGNORECASE)
+# A leading scheme (javascript:, mailto:, http://); no dots, so "host.com:8080/x" is not one
+_SCHEME = re.compile(r"^([a-zA-Z][a-zA-Z0-9+-]*):")
+# A base glued onto an absolute link inside the host, as old pulls wrote them:
+# "https://remoteok.comhttps://remoteOK.com/remote-jobs/..." keeps the later URL
+_EMBEDDED_URL = re.compile(r"^https?://[^/?#]*?(?=https?://)", re.IGNORECASE)
+# host -> query parameter carrying the job ID on search/collection pages
+JOB_ID_PARAMS = {"linkedin.com": ("currentJobId", "/jobs/view/{id}")}
+
+
+@lru_cache(maxsize=4096)
+def _host(netloc):
+    host = netloc.lower().rsplit("@", 1)[-1]
+    if host.endswith(":443") or host.endswith(":80"):
+        host = host.rsplit(":", 1)[0]
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    # Country subdomains (uk.linkedin.com, de.linkedin.com) share one ID space
+    parts = host.split(".")
+    if len(parts) == 3 and len(parts[0]) == 2 and ".".join(parts[1:]) in JOB_ID_PATTERNS:
+        host = ".".join(parts[1:])
+    return HOST_ALIASES.get(host, host)
+
+
+def clean_url(url, base=None):
+    """
+    Absolute https URL without tracking parameters, fragment or host/slash
+    variants; "" for what is not a web link (javascript:, mailto:, a path
+    without a base)
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if url.startswith("//"):
+        url = "https:" + url
+    elif _SCHEME.match(url):
+        pass
+    elif url.startswith("/"):
+        if not base:
+            return ""
+        url = base.rstrip("/") + url
+    else:
+        url = urljoin(base.rstrip("/") + "/", url) if base else "https://" + url
+    if url.count("://") > 1:
+        url = _EMBEDDED_URL.sub("", url, count=1)
+    match = _URL_PARTS.match(url)
+    if not match:
+        return ""
+    netloc, path, query = match.groups()
+    if "//" in path:
+        path = re.sub(r"/{2,}", "/", path)
+    path = path.rstrip("/") or "/"
+    cleaned = f"https://{_host(netloc)}{path}"
+    if query:
+        query = urlencode(sorted(
+            (k, v) for k, v in parse_qsl(query, keep_blank_values=True)
+            if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+        ))
+        if query:
+            cleaned += "?" + query
+    return cleaned
+
+
+def _posting(parts):
+    """(posting ID, canonical path template) for a cleaned, split URL on a known job board"""
+    for pattern, template in JOB_ID_PATTERNS.get(parts.netloc, ()):
+        match = pattern.match(parts.path)
+        if match:
+            return match.group(1), template
+    if parts.netloc in JOB_ID_PARAMS:
+        param, template = JOB_ID_PARAMS[parts.netloc]
+        value = dict(parse_qsl(parts.query)).get(param, "")
+        if value.isdigit():
+            return value, template
+    return None
+
+
+def job_id(url):
+    """(host, posting ID) for a known job board URL, or None"""
+    parts = urlsplit(clean_url(url))
+    found = _posting(parts)
+    return (parts.netloc, found[0]) if found else None
+
+
+def canonical_url(url):
+    """Join/dedup key for a URL: clean_url, reduced to the posting ID on known job boards"""
+    cleaned = clean_url(url)
+    if not cleaned:
+        return ""
+    parts = urlsplit(cleaned)
+    found = _posting(parts)
+    if found:
+        return f"https://{parts.netloc}{found[1].format(id=found[0])}"
+    if parts.netloc == "linkedin.com" and parts.path.startswith("/in/"):
+        # Profile handles are case-insensitive
+        return f"https://{parts.netloc}{parts.path.lower()}"
+    return cleaned
+
+
+def needs_resolution(url):
+    return urlsplit(clean_url(url)).netloc in SHORTENER_HOSTS
+
+
+class RedirectCache:
+    """Persistent url -> final url map, so each short link is resolved once across runs"""
+
+    def __init__(self, path=REDIRECT_CACHE_PATH, session=None, timeout=RESOLVE_TIMEOUT):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS redirects ("
+            "url TEXT PRIMARY KEY, final_url TEXT, status INTEGER, resolved_at REAL NOT NULL)"
+        )
+        self.session = session
+        self.timeout = timeout
+        self.stats = {"hits": 0, "resolved": 0, "failed": 0}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def _fetch(self, url):
+        if self.session is None:
+            import requests
+
+            self.session = requests.Session()
+        try:
+            response = self.session.head(url, allow_redirects=True, timeout=self.timeout)
+            if response.status_code in (403, 405):
+                response = self.session.get(url, allow_redirects=True, timeout=self.timeout, stream=True)
+                response.close()
+        except Exception:
+            return None, 0
+        if response.status_code >= 400:
+            return None, response.status_code
+        return response.url, response.status_code
+
+    def resolve(self, url):
+        """Final URL of a short/redirect link (cached), or the link itself if unresolvable"""
+        url = clean_url(url)
+        if not needs_resolution(url):
+            return url
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT final_url, resolved_at FROM redirects WHERE url = ?", (url,)
+            ).fetchone()
+        if row is not None and (row[0] or time.time() - row[1] < FAILED_RETRY_AFTER):
+            self.stats["hits"] += 1
+            return row[0] or url
+        final_url, status = self._fetch(url)
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO redirects VALUES (?, ?, ?, ?)",
+                (url, clean_url(final_url) if final_url else None, status, time.time()),
+            )
+            self.conn.commit()
+        self.stats["resolved" if final_url else "failed"] += 1
+        return clean_url(final_url) if final_url else url
+
+    def canonical(self, url):
+        return canonical_url(self.resolve(url))
+
+    def size(self):
+        return self.conn.execute("SELECT COUNT(*) FROM redirects").fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clean, canonicalize and resolve job posting URLs")
+    sub = parser.add_subparsers(dest="command", required=True)
+    canon = sub.add_parser("canon", help="print clean and canonical forms")
+    canon.add_argument("urls", nargs="+")
+    resolve = sub.add_parser("resolve", help="resolve short/redirect links through the cache")
+    resolve.add_argument("urls", nargs="+")
+    resolve.add_argument("--cache", default=REDIRECT_CACHE_PATH)
+    stats = sub.add_parser("stats", help="redirect cache size")
+    stats.add_argument("--cache", default=REDIRECT_CACHE_PATH)
+    args = parser.parse_args()
+
+    if args.command == "canon":
+        for url in args.urls:
+            found = job_id(url)
+            print(f"{url}\n  clean:     {clean_url(url)}\n  canonical: {canonical_url(url)}"
+                  + (f"\n  job id:    {found[1]} ({found[0]})" if found else ""))
+        return
+    with RedirectCache(args.cache) as cache:
+        if args.command == "resolve":
+            for url in args.urls:
+                print(f"{url} -> {cache.canonical(url)}")
+        print(f"🔗 Redirect cache: {cache.size()} links, {cache.stats['hits']} hits,"
+              f" {cache.stats['resolved']} resolved, {cache.stats['failed']} failed")
+
+
+if __name__ == "__main__":
+    main()
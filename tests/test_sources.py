@@ -0,0 +1,38 @@
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from sources import iter_json_array
+
+PAYLOADS = [
+    [1.25, 3],
+    [1e5, -2.5e-3, 0, -7, 12345678901234567890],
+    [True, False, None, "null", ""],
+    ["café — naïve", "\U0001f680 remote", 'a"b'],
+    [{"id": 1, "salary": {"min": 1.5e4, "max": 2e4}, "tags": ["x", [1.0, [2]]]}, {}, []],
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+@pytest.mark.parametrize("items", PAYLOADS)
+def test_iter_json_array_chunk_boundaries(items, chunk_size):
+    payload = json.dumps(items, ensure_ascii=False).encode("utf-8")
+    assert list(iter_json_array(io.BytesIO(payload), chunk_size=chunk_size)) == items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_iter_json_array_under_key(chunk_size):
+    payload = json.dumps({"legal": "x", "count": 2.5, "jobs": [{"id": 1}, 2.75]}).encode()
+    fp = io.BytesIO(payload)
+    assert list(iter_json_array(fp, "jobs", chunk_size=chunk_size)) == [{"id": 1}, 2.75]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 64])
+def test_iter_json_array_truncated(chunk_size):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.BytesIO(b"[1.25, 3"), chunk_size=chunk_size))